@@ -2,6 +2,8 @@ from decimal import Decimal
 
 from pydantic import BaseModel
 
+__all__ = ["TransactionDTO"]
+
 
 class TransactionDTO(BaseModel):
     asset: str
@@ -1,3 +1,6 @@
+import asyncio
+from typing import Optional, Sequence
+
 from app.application.v1.transaction.dto import TransactionDTO
 from app.application.v1.transaction.schemas import (
     TransactionHashResponse,
@@ -8,12 +11,44 @@ from app.application.v1.transaction.usecase import (
     CreateOnChainTransaction,
     GetTransactionHash,
     ListTransactions,
+    encode_cursor,
 )
 from app.shared.monitoring.logging import get_logger
-from app.shared.utils.validators import wei_to_eth
+from app.shared.utils.responses import FastJSONResponse
+from app.shared.utils.validators import wei_to_eth_batch
 
 logger = get_logger(__name__)
 
+_INLINE_TRANSFERS_LIMIT = 64
+
+
+def _build_transfer_rows(
+    assets: Sequence[str], address_froms: Sequence[str], values_wei: Sequence[int]
+) -> list[dict]:
+    """
+    Build TransactionDTO-shaped rows from parallel asset/address/value columns.
+
+    Wei values are converted in one batch and rows are plain dicts, which
+    pydantic-core encodes without building a model per row.
+    """
+    return [
+        {"asset": asset, "address_from": address_from, "value": value}
+        for asset, address_from, value in zip(
+            assets, address_froms, wei_to_eth_batch(values_wei)
+        )
+    ]
+
+
+def _build_transfers(raw_transfers: list[dict]) -> list[TransactionDTO]:
+    rows = _build_transfer_rows(
+        [transfer["asset"] for transfer in raw_transfers],
+        [transfer["address_from"] for transfer in raw_transfers],
+        [transfer["value"] for transfer in raw_transfers],
+    )
+    # model_construct skips validation: the usecase already produced correctly
+    # typed values, so callers must keep these fields' types in sync
+    return [TransactionDTO.model_construct(**row) for row in rows]
+
 
 async def check_transaction_handler(
     tx_hash: str, usecase: GetTransactionHash
@@ -21,26 +56,20 @@ async def check_transaction_handler(
     result = await usecase.execute(tx_hash)
 
     # Extract transaction data
-    tx_data = result["tx_data"]
-    is_token = result["is_token"]
     confirmations = result["confirmations"]
     is_confirmed = result["is_confirmed"]
     min_confirmations_required = result["min_confirmations_required"]
     is_destination_our_wallet = result["is_destination_our_wallet"]
 
-    # Determine asset type
-    asset = "token" if is_token else "eth"
-
-    transfers = [
-        TransactionDTO(
-            asset=transfer["asset"],
-            address_from=transfer.get("from") or transfer.get("address_from", ""),
-            value=wei_to_eth(transfer["value"]),
-        )
-        for transfer in result.get("transfers", [])
-    ]
+    raw_transfers = result.get("transfers", [])
+    # Large transfer lists (e.g. airdrops) are built off the event loop; small
+    # ones stay inline where thread scheduling would cost more than the work
+    if len(raw_transfers) > _INLINE_TRANSFERS_LIMIT:
+        transfers = await asyncio.to_thread(_build_transfers, raw_transfers)
+    else:
+        transfers = _build_transfers(raw_transfers)
 
-    return TransactionHashResponse(
+    return TransactionHashResponse.model_construct(
         is_valid=True,
         transfers=transfers,
         confirmations=confirmations,
@@ -57,12 +86,23 @@ async def create_onchain_transaction_handler(
 
 
 async def list_transactions_handler(
-    usecase: ListTransactions, limit: int = 100, offset: int = 0
-):
-    transactions = await usecase.execute(limit=limit, offset=offset)
-    return [
-        TransactionDTO(
-            asset=tx.asset, address_from=tx.address_from, value=wei_to_eth(tx.value)
+    usecase: ListTransactions,
+    limit: int = 100,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> FastJSONResponse:
+    transactions = await usecase.execute(limit=limit, offset=offset, cursor=cursor)
+    # Returning a Response skips FastAPI's re-validation of up to 1000 rows
+    response = FastJSONResponse(
+        _build_transfer_rows(
+            [tx.asset for tx in transactions],
+            [tx.address_from for tx in transactions],
+            [tx.value for tx in transactions],
         )
-        for tx in transactions
-    ]
+    )
+
+    # A full page means there may be more rows after the last one
+    if transactions and len(transactions) == limit:
+        last = transactions[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.hash)
+    return response
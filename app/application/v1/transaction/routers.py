@@ -1,44 +1,43 @@
-import asyncio
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
+from app.application.v1.transaction.dto import TransactionDTO
 from app.application.v1.transaction.handlers import (
     check_transaction_handler,
     create_onchain_transaction_handler,
     list_transactions_handler,
 )
 from app.application.v1.transaction.schemas import (
-    TransactionDTO,
     TransactionHashResponse,
     TransactionOnChainRequest,
     TransactionOnChainResponse,
+    TransactionStatusBatchRequest,
 )
 from app.application.v1.transaction.usecase import (
     CreateOnChainTransaction,
     GetTransactionHash,
     ListTransactions,
 )
-from app.infrastructure.blockchain.transaction.node_repository import (
-    Web3TransactionRepository,
-)
-from app.infrastructure.config import load_config
-from app.infrastructure.db.transaction.postgresql_repository import (
-    PostgreSQLTransactionRepository,
-)
-from app.infrastructure.db.wallet.postgresql_repository import (
-    EthereumWalletService,
-    HashiCorpVaultService,
-)
-from app.shared.utils.validators import wei_to_eth
+from app.shared.utils.responses import FastJSONResponse
+from app.shared.utils.validators import normalize_tx_hash
 
 router = APIRouter(prefix="/v1", tags=["Transaction"])
 
 
 def get_transaction_usecase(tx_hash: str, request: Request):
-    web3_repo = Web3TransactionRepository(request.app.state.web3)
+    web3_repo = request.app.state.web3_repo
     wallet_repo = request.app.state.wallet_repo
     db_repo = request.app.state.transaction_repo
-    return GetTransactionHash(tx_hash, web3_repo, wallet_repo, db_repo)
+    return GetTransactionHash(
+        tx_hash,
+        web3_repo,
+        wallet_repo,
+        db_repo,
+        wallet_cache=request.app.state.wallet_cache,
+    )
 
 
 @router.get(
@@ -64,50 +63,103 @@ async def get_transaction_status(tx_hash: str, request: Request):
     Busca informações detalhadas de uma transação incluindo confirmações atuais
     """
     db_repo = request.app.state.transaction_repo
-    web3_repo = Web3TransactionRepository(request.app.state.web3)
+    web3_repo = request.app.state.web3_repo
 
-    tx_data = await db_repo.get_transaction_with_confirmations(tx_hash, web3_repo)
+    tx_data = await db_repo.get_transaction_with_confirmations(
+        normalize_tx_hash(tx_hash), web3_repo
+    )
 
     if not tx_data:
-        from fastapi import HTTPException
-
         raise HTTPException(status_code=404, detail="Transaction not found")
 
+    return _transaction_status_response(tx_data)
+
+
+@router.post(
+    "/transaction/status/batch",
+    response_model=list[TransactionOnChainResponse],
+    tags=["Transaction"],
+)
+async def get_transactions_status(
+    request_body: TransactionStatusBatchRequest, request: Request
+):
+    """
+    Busca o status de várias transações com uma consulta e um lote JSON-RPC.
+    Hashes não encontrados são omitidos da resposta.
+    """
+    db_repo = request.app.state.transaction_repo
+    web3_repo = request.app.state.web3_repo
+
+    transactions = await db_repo.get_many_with_confirmations(
+        request_body.hashes, web3_repo
+    )
+    return [_transaction_status_response(tx_data) for tx_data in transactions]
+
+
+def _transaction_status_response(tx_data: dict) -> TransactionOnChainResponse:
+    # effective_fee is a float in the response, so divide in float directly
+    # instead of going through an exact Decimal that is then discarded
+    created_at = tx_data["created_at"]
     return TransactionOnChainResponse(
         hash=tx_data["hash"],
         status=tx_data["status"],
         effective_fee=(
-            float(wei_to_eth(tx_data["effective_fee"]))
-            if tx_data["effective_fee"]
-            else 0.0
+            tx_data["effective_fee"] / 1e18 if tx_data["effective_fee"] else 0.0
+        ),
+        created_at=(
+            created_at if isinstance(created_at, str) else created_at.isoformat()
         ),
-        created_at=tx_data["created_at"].isoformat(),
         confirmations=tx_data["confirmations"],
         is_confirmed=tx_data["is_confirmed"],
     )
 
 
 def get_create_onchain_usecase(request: Request):
-    config = load_config()
-    vault_service = HashiCorpVaultService(
-        url=config.vault_url,
-        token=config.vault_token,
-        secret_path=config.vault_secret_path,
-    )
-    wallet_service = EthereumWalletService()
-    web3_repo = Web3TransactionRepository(request.app.state.web3)
+    vault_service = request.app.state.vault_service
+    wallet_service = request.app.state.wallet_service
+    web3_repo = request.app.state.web3_repo
     transaction_repo = request.app.state.transaction_repo
     return CreateOnChainTransaction(
-        web3_repo, transaction_repo, vault_service, wallet_service
+        web3_repo,
+        transaction_repo,
+        vault_service,
+        wallet_service,
+        token_gas_limits=request.app.state.token_gas_limits,
     )
 
 
+async def parse_onchain_request_body(request: Request) -> TransactionOnChainRequest:
+    # Validate the raw bytes with pydantic-core's JSON parser in one pass,
+    # instead of json.loads() into a dict followed by model validation
+    try:
+        return TransactionOnChainRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+        )
+
+
 @router.post(
-    "/transaction", response_model=TransactionOnChainResponse, tags=["Transaction"]
+    "/transaction",
+    response_model=TransactionOnChainResponse,
+    tags=["Transaction"],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": TransactionOnChainRequest.model_json_schema()
+                }
+            },
+        }
+    },
 )
 async def create_onchain_transaction(
-    request_body: TransactionOnChainRequest,
     request: Request,
+    request_body: TransactionOnChainRequest = Depends(parse_onchain_request_body),
     usecase: CreateOnChainTransaction = Depends(get_create_onchain_usecase),
 ):
     return await create_onchain_transaction_handler(request_body, usecase)
@@ -118,13 +170,29 @@ def get_list_transactions_usecase(request: Request):
     return ListTransactions(db_repo)
 
 
-@router.get("/transaction", response_model=list[TransactionDTO], tags=["Transaction"])
+@router.get(
+    "/transaction",
+    response_model=list[TransactionDTO],
+    response_class=FastJSONResponse,
+    tags=["Transaction"],
+)
 async def list_transactions(
     request: Request,
     limit: int = Query(
         100, ge=1, le=1000, description="Max number of transactions to return"
     ),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from the X-Next-Cursor header of the previous page",
+    ),
+    offset: int = Query(
+        0,
+        ge=0,
+        deprecated=True,
+        description="Offset for pagination (deprecated, use cursor)",
+    ),
     usecase: ListTransactions = Depends(get_list_transactions_usecase),
 ):
-    return await list_transactions_handler(usecase, limit=limit, offset=offset)
+    return await list_transactions_handler(
+        usecase, limit=limit, offset=offset, cursor=cursor
+    )
@@ -1,11 +1,14 @@
 from decimal import Decimal
-from typing import Optional, Union
+from typing import Optional
 
-from pydantic import BaseModel, field_validator
-from pydantic.types import T
+from pydantic import BaseModel, Field, field_validator
 
 from app.application.v1.transaction.dto import TransactionDTO
-from app.shared.utils.validators import eth_to_wei, validate_eth_value
+from app.shared.utils.validators import (
+    eth_to_wei,
+    normalize_tx_hash,
+    validate_eth_value,
+)
 
 
 class TransactionHashResponse(BaseModel):
@@ -21,12 +24,14 @@ class TransactionOnChainRequest(BaseModel):
     address_from: str
     address_to: str
     asset: str
-    value: Union[str, float, Decimal]
+    # Accepts JSON numbers or decimal strings; parsed once into a Decimal
+    # (pydantic-core rejects NaN/Infinity), avoiding float precision loss
+    value: Decimal
     contract_address: Optional[str] = None
 
     @field_validator("value")
     @classmethod
-    def validate_value(cls, v):
+    def validate_value(cls, v: Decimal) -> Decimal:
         """Validate ETH value is positive and valid"""
         if not validate_eth_value(v):
             raise ValueError("Value must be a positive valid number in ETH")
@@ -47,3 +52,13 @@ class TransactionOnChainResponse(BaseModel):
     is_confirmed: Optional[bool] = False
     wait_time: Optional[float] = None
     timeout: Optional[bool] = False
+
+
+class TransactionStatusBatchRequest(BaseModel):
+    hashes: list[str] = Field(min_length=1, max_length=100)
+
+    @field_validator("hashes")
+    @classmethod
+    def normalize_hashes(cls, v: list[str]) -> list[str]:
+        """Normalize hashes to the 0x-prefixed lowercase form stored in the DB"""
+        return [normalize_tx_hash(tx_hash) for tx_hash in v]
@@ -1,13 +1,13 @@
 import asyncio
+import base64
 import datetime
-import re
 import time
 from http import HTTPStatus
+from typing import AbstractSet, Mapping, Optional
 
 from fastapi import HTTPException
 from web3 import Web3
 
-from app.application.v1.transaction.dto import TransactionDTO
 from app.application.v1.transaction.schemas import (
     TransactionOnChainRequest,
     TransactionOnChainResponse,
@@ -15,22 +15,19 @@ from app.application.v1.transaction.schemas import (
 from app.domain.transaction.entity import Transaction as TransactionEntity
 from app.infrastructure.blockchain.transaction.node_repository import (
     Web3TransactionRepository,
+    encode_erc20_transfer,
+    fetch_transaction_parameters,
 )
 from app.infrastructure.db.transaction.postgresql_repository import (
     PostgreSQLTransactionRepository,
 )
+from app.infrastructure.db.wallet.ownership_cache import WalletOwnershipCache
 from app.infrastructure.db.wallet.postgresql_repository import (
     PostgreSQLWalletRepository,
 )
 
 # Monitoring imports
-from app.shared.monitoring.logging import (
-    LoggerMixin,
-    get_logger,
-    log_blockchain_operation,
-    log_database_operation,
-    log_function_call,
-)
+from app.shared.monitoring.logging import LoggerMixin
 from app.shared.monitoring.metrics import (
     MetricsContext,
     record_blockchain_operation,
@@ -39,7 +36,28 @@ from app.shared.monitoring.metrics import (
     track_time,
     transaction_processing_duration_seconds,
 )
-from app.shared.utils.validators import wei_to_eth
+from app.shared.utils.clock import utc_now
+from app.shared.utils.validators import normalize_tx_hash, wei_to_eth
+
+# Fields of Web3TransactionRepository.get_transaction returned to callers;
+# only the calldata ("input") is left out of the result
+_TX_VIEW_FIELDS = ("hash", "value", "from", "to")
+
+
+def _largest_owned_transfer(
+    transfers: list[dict], side: str, owned: AbstractSet[str]
+) -> Optional[dict]:
+    """Largest-value transfer whose `side` address is ours; earliest wins ties"""
+    best = None
+    for transfer in transfers:
+        address = transfer.get(side)
+        if (
+            address
+            and address.lower() in owned
+            and (best is None or transfer.get("value", 0) > best.get("value", 0))
+        ):
+            best = transfer
+    return best
 
 
 class GetTransactionHash(LoggerMixin):
@@ -49,28 +67,16 @@ class GetTransactionHash(LoggerMixin):
         web3_repo: Web3TransactionRepository,
         wallet_repo: PostgreSQLWalletRepository,
         db_repo: PostgreSQLTransactionRepository,
+        wallet_cache: WalletOwnershipCache,
         min_confirmations: int = 12,
     ):
-        # Clean the transaction hash by removing any extra spaces
-        self.tx_hash = tx_hash.strip()
+        # Normalize once here; the hash is used as-is for node and DB lookups
+        self.tx_hash = normalize_tx_hash(tx_hash)
         self.web3_repo = web3_repo
         self.wallet_repo = wallet_repo
         self.db_repo = db_repo
         self.min_confirmations = min_confirmations
-
-    # Add validation if destination address is ours
-    async def validate_destination_address(self, address: str) -> bool:
-        """Validate if destination address is one of our wallets"""
-        try:
-            # Normalize address to lowercase for comparison
-            address_lower = address.lower()
-            wallet = await self.wallet_repo.get_wallet_by_address(address_lower)
-            return wallet is not None
-        except Exception as e:
-            self.logger.error(
-                f"Failed to validate destination address - Address: {address}, Error: {str(e)}"
-            )
-            return False
+        self.wallet_cache = wallet_cache
 
     @track_time(
         transaction_processing_duration_seconds,
@@ -78,130 +84,154 @@ class GetTransactionHash(LoggerMixin):
     )
     async def execute(self, txhash: str):
         self.logger.info(
-            f"Starting transaction validation - Hash: {self.tx_hash}, Min confirmations: {self.min_confirmations}"
+            "Starting transaction validation - Hash: %s, Min confirmations: %s",
+            self.tx_hash,
+            self.min_confirmations,
         )
 
         start_time = time.time()
 
         try:
             with MetricsContext("validate_transaction", "blockchain"):
-                tx_data = self.web3_repo.get_transaction(self.tx_hash)
+                tx_data = await asyncio.to_thread(
+                    self.web3_repo.get_transaction, self.tx_hash
+                )
 
             if not tx_data:
                 raise HTTPException(HTTPStatus.NOT_FOUND, "Transaction not found")
 
-            # Determine if this is a token transaction
-            is_token = bool(tx_data.get("input") and tx_data.get("input") != "0x")
+            # Bind the transaction fields once; they are reused throughout
+            input_data = tx_data.get("input") or "0x"
+            tx_to = tx_data.get("to")
+            tx_from = tx_data.get("from")
+            tx_value = int(tx_data.get("value") or 0)
+            tx_to_lower = tx_to.lower() if tx_to else None
+            tx_from_lower = tx_from.lower() if tx_from else None
+
+            # Determine if this is a token transaction: any calldata at all.
+            # web3 returns HexBytes, where len() counts bytes, not hex digits
+            is_token = input_data not in ("0x", b"")
+
+            # The remaining RPCs only depend on tx_data, so run them concurrently
+            # in worker threads: validation waits for the slowest call, not the sum
+            confirmations_call = asyncio.to_thread(
+                self.web3_repo.get_transaction_confirmations, self.tx_hash
+            )
 
-            # Determine asset type
+            # Determine asset type and extract transfer information
+            transfers = []
             if is_token:
+                transfers_call = asyncio.to_thread(
+                    self.web3_repo.get_transaction_transfers, self.tx_hash
+                )
                 # Get the actual token symbol from the contract
-                contract_address = tx_data.get("to")
-                if contract_address:
-                    asset = self.web3_repo.get_token_symbol(contract_address)
+                if tx_to:
+                    confirmations, token_transfers, asset = await asyncio.gather(
+                        confirmations_call,
+                        transfers_call,
+                        asyncio.to_thread(self.web3_repo.get_token_symbol, tx_to),
+                    )
                 else:
                     asset = "UNKNOWN"
-            else:
-                asset = "ETH"  # Always uppercase for consistency
-
-            # Extract transfer information
-            transfers = []
-            if is_token:
-                token_transfers = self.web3_repo.get_transaction_transfers(self.tx_hash)
+                    confirmations, token_transfers = await asyncio.gather(
+                        confirmations_call, transfers_call
+                    )
                 transfers.extend(token_transfers)
             else:
-                eth_value = int(tx_data.get("value", 0))
-                if eth_value > 0:
+                asset = "ETH"  # Always uppercase for consistency
+                confirmations = await confirmations_call
+                if tx_value > 0:
                     transfers.append(
                         {
                             "asset": "eth",
-                            "from": tx_data.get("from"),
-                            "address_from": tx_data.get("from"),
-                            "value": eth_value,
+                            "from": tx_from,
+                            "address_from": tx_from or "",
+                            "value": tx_value,
                         }
                     )
 
             # Check confirmations
-            confirmations = self.web3_repo.get_transaction_confirmations(self.tx_hash)
             is_confirmed = confirmations >= self.min_confirmations
 
             # Check if destination is our wallet
             # For token transactions, we need to check the actual transfer destinations, not just tx.to
-            destination_address = tx_data.get("to")
-            is_our_wallet = False
+            destination_address = tx_to
+            address_from = tx_from
+
+            # Ownership is answered from the process-wide wallet snapshot. A
+            # miss only means "unknown": the wallet may have been created by
+            # another process since the last reload, so when no candidate is
+            # in the snapshot the database confirms them in one query
+            candidates = {
+                address for address in (tx_to_lower, tx_from_lower) if address
+            }
+            if is_token:
+                candidates.update(
+                    address.lower()
+                    for transfer in transfers
+                    for address in (transfer.get("to"), transfer.get("from"))
+                    if address
+                )
+            owned = candidates & await self.wallet_cache.get()
+            if candidates and not owned:
+                owned = await self.wallet_repo.get_wallets_by_addresses(
+                    list(candidates)
+                )
 
+            # For token transactions, the transfers touching our wallets decide
+            # the addresses; with several (e.g. batched payouts) the largest
+            # value wins so the choice does not depend on log order
+            incoming = outgoing = None
+            if is_token:
+                incoming = _largest_owned_transfer(transfers, "to", owned)
+                outgoing = _largest_owned_transfer(transfers, "from", owned)
+
+            is_our_wallet = False
             if is_token:
                 # For token transactions, check all transfer destinations
-                for transfer in transfers:
-                    transfer_to = transfer.get("to")
-                    if transfer_to:
-                        # Normalize address to lowercase for comparison
-                        transfer_to_lower = transfer_to.lower()
-                        wallet = await self.wallet_repo.get_wallet_by_address(
-                            transfer_to_lower
-                        )
-                        if wallet:
-                            is_our_wallet = True
-                            destination_address = (
-                                transfer_to  # Update to the actual destination
-                            )
-                            self.logger.info(
-                                f"Token transfer destination is our wallet - Address: {transfer_to}"
-                            )
-                            break
+                if incoming is not None:
+                    is_our_wallet = True
+                    destination_address = incoming["to"]
+                    self.logger.info(
+                        "Token transfer destination is our wallet - Address: %s",
+                        destination_address,
+                    )
             else:
                 # For ETH transactions, check the direct destination
-                if destination_address:
-                    is_our_wallet = await self.validate_destination_address(
-                        destination_address
-                    )
+                if tx_to_lower:
+                    is_our_wallet = tx_to_lower in owned
 
             # Check if this transaction should be saved to database (if either address is ours)
-            address_from = tx_data.get("from")
             should_save_transaction = False
             transaction_type = "unknown"
             is_from_our_wallet = False
             is_to_our_wallet = False
 
             # Check if address_from is one of our wallets
-            if address_from:
-                # Normalize address to lowercase for comparison
-                address_from_lower = address_from.lower()
-                wallet_from = await self.wallet_repo.get_wallet_by_address(
-                    address_from_lower
+            if tx_from_lower and tx_from_lower in owned:
+                is_from_our_wallet = True
+                should_save_transaction = True
+                self.logger.info(
+                    "Transaction 'from' address is our wallet - Address: %s",
+                    address_from,
                 )
-                if wallet_from:
-                    is_from_our_wallet = True
-                    should_save_transaction = True
-                    self.logger.info(
-                        f"Transaction 'from' address is our wallet - Address: {address_from}"
-                    )
 
             # For token transactions, also check if any transfer source is our wallet
-            if is_token:
-                for transfer in transfers:
-                    transfer_from = transfer.get("from")
-                    if transfer_from:
-                        # Normalize address to lowercase for comparison
-                        transfer_from_lower = transfer_from.lower()
-                        wallet_from = await self.wallet_repo.get_wallet_by_address(
-                            transfer_from_lower
-                        )
-                        if wallet_from:
-                            is_from_our_wallet = True
-                            should_save_transaction = True
-                            address_from = transfer_from  # Update to the actual source
-                            self.logger.info(
-                                f"Token transfer source is our wallet - Address: {transfer_from}"
-                            )
-                            break
+            if outgoing is not None:
+                is_from_our_wallet = True
+                should_save_transaction = True
+                address_from = outgoing["from"]  # Update to the actual source
+                self.logger.info(
+                    "Token transfer source is our wallet - Address: %s", address_from
+                )
 
             # Check if destination address is one of our wallets
             if is_our_wallet:
                 is_to_our_wallet = True
                 should_save_transaction = True
                 self.logger.info(
-                    f"Transaction 'to' address is our wallet - Address: {destination_address}"
+                    "Transaction 'to' address is our wallet - Address: %s",
+                    destination_address,
                 )
 
             # Determine transaction type based on wallet involvement
@@ -210,13 +240,15 @@ class GetTransactionHash(LoggerMixin):
                 # External transaction coming to our wallet - this is a deposit
                 transaction_type = "deposit"
                 self.logger.info(
-                    f"External deposit detected (from external to our wallet) - Type: {transaction_type}"
+                    "External deposit detected (from external to our wallet) - Type: %s",
+                    transaction_type,
                 )
             elif is_from_our_wallet and not is_to_our_wallet:
                 # Transaction from our wallet to external - this is a withdrawal
                 transaction_type = "withdraw"
                 self.logger.info(
-                    f"External withdrawal detected (from our wallet to external) - Type: {transaction_type}"
+                    "External withdrawal detected (from our wallet to external) - Type: %s",
+                    transaction_type,
                 )
             elif is_from_our_wallet and is_to_our_wallet:
                 # Both addresses are ours - this is an internal transfer
@@ -224,50 +256,40 @@ class GetTransactionHash(LoggerMixin):
                 # But could also create logic to save twice (once as withdraw, once as deposit)
                 transaction_type = "withdraw"
                 self.logger.info(
-                    f"Internal transfer detected (both addresses are ours) - Type: {transaction_type}"
+                    "Internal transfer detected (both addresses are ours) - Type: %s",
+                    transaction_type,
                 )
             else:
                 # Neither address is ours - this shouldn't happen in this context
                 transaction_type = "unknown"
                 self.logger.warning(
-                    f"Neither address belongs to our wallets - this shouldn't happen here"
+                    "Neither address belongs to our wallets - this shouldn't happen here"
                 )
 
             # Save transaction if either address is ours
             if should_save_transaction:
-                formatted_tx_hash = (
-                    self.tx_hash
-                    if self.tx_hash.startswith("0x")
-                    else f"0x{self.tx_hash}"
-                )
-
-                existing = await self.db_repo.get_transaction_by_hash(formatted_tx_hash)
-                if not existing:
+                if not await self.db_repo.has_transaction(self.tx_hash):
                     self.logger.info(
-                        f"Transaction not found in database. Persisting transaction - Hash: {formatted_tx_hash}, Type: {transaction_type}"
+                        "Transaction not found in database. Persisting transaction - Hash: %s, Type: %s",
+                        self.tx_hash,
+                        transaction_type,
                     )
-                    now = datetime.datetime.now()
+                    now = utc_now()
 
                     # For token transactions, save the token value instead of tx.value
                     transaction_value = 0
                     if is_token and transfers:
-                        # Use the value from the first transfer that involves our wallet
-                        for transfer in transfers:
-                            if (
-                                transfer.get("from") == address_from
-                                and is_from_our_wallet
-                            ) or (
-                                transfer.get("to") == destination_address
-                                and is_to_our_wallet
-                            ):
-                                transaction_value = transfer.get("value", 0)
-                                break
+                        # Use the value of the transfer that selected our wallet,
+                        # the outgoing one first since internal moves are withdraws
+                        chosen = outgoing if outgoing is not None else incoming
+                        if chosen is not None:
+                            transaction_value = chosen.get("value", 0)
                     else:
-                        transaction_value = int(tx_data.get("value", 0) or 0)
+                        transaction_value = tx_value
 
                     await self.db_repo.save_transaction(
                         TransactionEntity(
-                            hash=formatted_tx_hash,
+                            hash=self.tx_hash,
                             asset=asset,
                             address_from=address_from or "",  # Ensure it's never None
                             address_to=destination_address or "",
@@ -280,16 +302,19 @@ class GetTransactionHash(LoggerMixin):
                             updated_at=now,
                             deleted_at=None,
                             contract_address=(
-                                tx_data.get("to") if is_token else None
+                                tx_to if is_token else None
                             ),  # Store contract address for tokens
                         )
                     )
                     self.logger.info(
-                        f"Transaction saved in database - Hash: {formatted_tx_hash}, Type: {transaction_type}"
+                        "Transaction saved in database - Hash: %s, Type: %s",
+                        self.tx_hash,
+                        transaction_type,
                     )
                 else:
                     self.logger.info(
-                        f"Transaction already exists in database. Skipping save - Hash: {formatted_tx_hash}, Status: {existing.status}"
+                        "Transaction already exists in database. Skipping save - Hash: %s",
+                        self.tx_hash,
                     )
 
             record_transaction_validated(
@@ -301,12 +326,20 @@ class GetTransactionHash(LoggerMixin):
 
             duration = time.time() - start_time
             self.logger.info(
-                f"Transaction validation completed successfully - Hash: {self.tx_hash}, Token: {is_token}, Confirmations: {confirmations}, Confirmed: {is_confirmed}, Our wallet: {is_our_wallet}, Duration: {duration:.3f}s"
+                "Transaction validation completed successfully - Hash: %s, Token: %s, Confirmations: %s, Confirmed: %s, Our wallet: %s, Duration: %.3fs",
+                self.tx_hash,
+                is_token,
+                confirmations,
+                is_confirmed,
+                is_our_wallet,
+                duration,
             )
 
             return {
                 "tx_hash": self.tx_hash,
-                "tx_data": tx_data,
+                "tx_data": {
+                    key: tx_data[key] for key in _TX_VIEW_FIELDS if key in tx_data
+                },
                 "is_token": is_token,
                 "confirmations": confirmations,
                 "is_confirmed": is_confirmed,
@@ -320,7 +353,10 @@ class GetTransactionHash(LoggerMixin):
         except Exception as e:
             duration = time.time() - start_time
             self.logger.error(
-                f"Transaction validation failed - Hash: {self.tx_hash}, Error: {str(e)}, Duration: {duration:.3f}s"
+                "Transaction validation failed - Hash: %s, Error: %s, Duration: %.3fs",
+                self.tx_hash,
+                e,
+                duration,
             )
             record_blockchain_operation("validate_transaction", "error")
             raise
@@ -333,11 +369,21 @@ class CreateOnChainTransaction(LoggerMixin):
         db_repo: PostgreSQLTransactionRepository,
         vault_service,
         wallet_service,
+        token_gas_limits: Optional[Mapping[str, int]] = None,
     ):
         self.web3_repo = web3_repo
         self.db_repo = db_repo
         self.vault_service = vault_service
         self.wallet_service = wallet_service
+        # Gas limits for known token contracts, keyed by lowercase address
+        self.token_gas_limits = token_gas_limits or {}
+
+    def _sign_with_vault_key(self, web3, key_id: str, tx: dict):
+        # The Vault read and the ECDSA signature both block, so they run
+        # together in one worker thread
+        private_key = self.vault_service.get_private_key(key_id)
+        # Use the modern web3.py v7+ signing method
+        return web3.eth.account.sign_transaction(tx, private_key)
 
     @track_time(
         transaction_processing_duration_seconds,
@@ -349,7 +395,12 @@ class CreateOnChainTransaction(LoggerMixin):
         value_in_wei = request.get_value_in_wei()
 
         self.logger.info(
-            f"Starting transaction creation - From: {request.address_from}, To: {request.address_to}, Asset: {request.asset}, Value: {request.value} ETH ({value_in_wei} Wei)"
+            "Starting transaction creation - From: %s, To: %s, Asset: %s, Value: %s ETH (%s Wei)",
+            request.address_from,
+            request.address_to,
+            request.asset,
+            request.value,
+            value_in_wei,
         )
 
         start_time = time.time()
@@ -363,47 +414,53 @@ class CreateOnChainTransaction(LoggerMixin):
                 or not request.value
             ):
                 self.logger.error(
-                    f"Missing required fields - From: {bool(request.address_from)}, To: {bool(request.address_to)}, Asset: {bool(request.asset)}, Value: {bool(request.value)}"
+                    "Missing required fields - From: %s, To: %s, Asset: %s, Value: %s",
+                    bool(request.address_from),
+                    bool(request.address_to),
+                    bool(request.asset),
+                    bool(request.value),
                 )
                 raise HTTPException(HTTPStatus.BAD_REQUEST, "Missing required fields")
 
             # 1. Check balance and build transaction
-            self.logger.info(f"Building transaction - Asset: {request.asset}")
+            self.logger.info("Building transaction - Asset: %s", request.asset)
 
             with MetricsContext("build_transaction", "blockchain"):
                 web3 = self.web3_repo.web3
                 address_from = Web3.to_checksum_address(request.address_from)
                 address_to = Web3.to_checksum_address(request.address_to)
-                nonce = web3.eth.get_transaction_count(address_from)
-                chain_id = web3.eth.chain_id
+                # Node reads block on HTTP, so they run in worker threads to
+                # keep the event loop serving other requests meanwhile
+                (
+                    (nonce, eth_balance, gas_price, max_priority_fee),
+                    chain_id,
+                ) = await asyncio.gather(
+                    # One batched round-trip instead of four serial RPCs
+                    asyncio.to_thread(fetch_transaction_parameters, web3, address_from),
+                    asyncio.to_thread(getattr, self.web3_repo, "chain_id"),
+                )
 
                 # Check ETH balance first
-                eth_balance = web3.eth.get_balance(address_from)
                 self.logger.info(
-                    f"Address balance check - Address: {address_from}, ETH Balance: {eth_balance / 1e18:.6f} ETH"
+                    "Address balance check - Address: %s, ETH Balance: %.6f ETH",
+                    address_from,
+                    eth_balance / 1e18,
                 )
 
                 if eth_balance == 0:
                     self.logger.error(
-                        f"Insufficient ETH balance for gas fees - Address: {address_from}, Balance: 0 ETH"
+                        "Insufficient ETH balance for gas fees - Address: %s, Balance: 0 ETH",
+                        address_from,
                     )
                     raise HTTPException(
                         HTTPStatus.BAD_REQUEST,
                         f"Insufficient ETH balance for gas fees. Address {address_from} has 0 ETH balance.",
                     )
 
-                # Get current gas price and calculate fees
-                gas_price = web3.eth.gas_price
+                # Calculate fees from the current gas price
                 margin = 1.2
                 gas_price = int(gas_price * margin)
 
-                # Handle max_priority_fee with fallback for compatibility
-                try:
-                    max_priority_fee = web3.eth.max_priority_fee
-                except (AttributeError, Exception):
-                    # Fallback: use 2 gwei as default priority fee
-                    max_priority_fee = 2000000000  # 2 gwei
-
                 max_fee_per_gas = gas_price + max_priority_fee
 
                 if request.asset.lower() == "eth":
@@ -416,7 +473,9 @@ class CreateOnChainTransaction(LoggerMixin):
                         required_eth = total_required / 1e18
                         available_eth = eth_balance / 1e18
                         self.logger.error(
-                            f"Insufficient ETH balance - Required: {required_eth:.6f} ETH (value + gas), Available: {available_eth:.6f} ETH"
+                            "Insufficient ETH balance - Required: %.6f ETH (value + gas), Available: %.6f ETH",
+                            required_eth,
+                            available_eth,
                         )
                         raise HTTPException(
                             HTTPStatus.BAD_REQUEST,
@@ -437,37 +496,25 @@ class CreateOnChainTransaction(LoggerMixin):
                     }
                     contract_address = None
                     self.logger.info(
-                        f"ETH transaction built - Value: {value_in_wei / 1e18:.6f} ETH, Max fee: {max_fee_per_gas}, Priority fee: {max_priority_fee}, Nonce: {nonce}, Gas cost: {estimated_gas_cost / 1e18:.6f} ETH"
+                        "ETH transaction built - Value: %.6f ETH, Max fee: %s, Priority fee: %s, Nonce: %s, Gas cost: %.6f ETH",
+                        value_in_wei / 1e18,
+                        max_fee_per_gas,
+                        max_priority_fee,
+                        nonce,
+                        estimated_gas_cost / 1e18,
                     )
                 else:
                     if not request.contract_address:
                         self.logger.error(
-                            f"Contract address required for token transaction - Asset: {request.asset}"
+                            "Contract address required for token transaction - Asset: %s",
+                            request.asset,
                         )
                         raise HTTPException(
                             HTTPStatus.BAD_REQUEST,
                             "contract_address is required for tokens",
                         )
 
-                    erc20_abi = [
-                        {
-                            "constant": False,
-                            "inputs": [
-                                {"name": "_to", "type": "address"},
-                                {"name": "_value", "type": "uint256"},
-                            ],
-                            "name": "transfer",
-                            "outputs": [{"name": "", "type": "bool"}],
-                            "type": "function",
-                        }
-                    ]
-                    contract = web3.eth.contract(
-                        address=Web3.to_checksum_address(request.contract_address),
-                        abi=erc20_abi,
-                    )
-                    data = contract.functions.transfer(
-                        address_to, value_in_wei
-                    ).build_transaction({"gas": 0, "gasPrice": 0})["data"]
+                    data = encode_erc20_transfer(address_to, value_in_wei)
 
                     # Build EIP-1559 transaction for token transfer
                     tx = {
@@ -481,8 +528,14 @@ class CreateOnChainTransaction(LoggerMixin):
                         "maxPriorityFeePerGas": max_priority_fee,
                         "type": "0x2",  # EIP-1559 transaction type
                     }
-                    # Estimate gas dynamically for token/contract transactions
-                    tx["gas"] = web3.eth.estimate_gas(tx)
+                    # Known contracts use their pre-measured gas limit; anything
+                    # else is estimated by the node
+                    gas_limit = self.token_gas_limits.get(
+                        request.contract_address.lower()
+                    )
+                    if gas_limit is None:
+                        gas_limit = await asyncio.to_thread(web3.eth.estimate_gas, tx)
+                    tx["gas"] = gas_limit
 
                     # For token transfers, check if ETH balance covers gas fees
                     estimated_gas_cost = tx["gas"] * max_fee_per_gas
@@ -490,7 +543,9 @@ class CreateOnChainTransaction(LoggerMixin):
                         required_eth = estimated_gas_cost / 1e18
                         available_eth = eth_balance / 1e18
                         self.logger.error(
-                            f"Insufficient ETH balance for token transaction gas - Required: {required_eth:.6f} ETH, Available: {available_eth:.6f} ETH"
+                            "Insufficient ETH balance for token transaction gas - Required: %.6f ETH, Available: %.6f ETH",
+                            required_eth,
+                            available_eth,
                         )
                         raise HTTPException(
                             HTTPStatus.BAD_REQUEST,
@@ -499,30 +554,43 @@ class CreateOnChainTransaction(LoggerMixin):
 
                     contract_address = request.contract_address
                     self.logger.info(
-                        f"Token transaction built - Asset: {request.asset}, Contract: {contract_address}, Max fee: {max_fee_per_gas}, Priority fee: {max_priority_fee}, Nonce: {nonce}, Gas: {tx['gas']}, Gas cost: {estimated_gas_cost / 1e18:.6f} ETH"
+                        "Token transaction built - Asset: %s, Contract: %s, Max fee: %s, Priority fee: %s, Nonce: %s, Gas: %s, Gas cost: %.6f ETH",
+                        request.asset,
+                        contract_address,
+                        max_fee_per_gas,
+                        max_priority_fee,
+                        nonce,
+                        tx["gas"],
+                        estimated_gas_cost / 1e18,
                     )
 
             # 2. Get private key from Vault and sign transaction
             self.logger.info(
-                f"Signing transaction with Vault - Address: {address_from}"
+                "Signing transaction with Vault - Address: %s", address_from
             )
 
             # Add detailed logging for debugging
             self.logger.info(
-                f"Transaction details before signing - Chain ID: {chain_id}, Nonce: {nonce}, Gas: {tx['gas']}, Max fee: {max_fee_per_gas}, Priority fee: {max_priority_fee}"
+                "Transaction details before signing - Chain ID: %s, Nonce: %s, Gas: %s, Max fee: %s, Priority fee: %s",
+                chain_id,
+                nonce,
+                tx["gas"],
+                max_fee_per_gas,
+                max_priority_fee,
             )
 
             with MetricsContext("sign_transaction", "vault"):
                 key_id = f"eth_wallet_{address_from}"
-                private_key = self.vault_service.get_private_key(key_id)
-
-                # Use the modern web3.py v7+ signing method
-                signed = web3.eth.account.sign_transaction(tx, private_key)
+                signed = await asyncio.to_thread(
+                    self._sign_with_vault_key, web3, key_id, tx
+                )
                 signed_tx = signed.raw_transaction.hex()
 
                 # Log signed transaction details
                 self.logger.info(
-                    f"Transaction signed successfully - Length: {len(signed_tx)}, Prefix: {signed_tx[:20]}"
+                    "Transaction signed successfully - Length: %s, Prefix: %s",
+                    len(signed_tx),
+                    signed_tx[:20],
                 )
 
             # 3. Enviar transação
@@ -531,31 +599,31 @@ class CreateOnChainTransaction(LoggerMixin):
             with MetricsContext("broadcast_transaction", "blockchain"):
                 # Log before sending
                 self.logger.info(
-                    f"Sending raw transaction to network - Length: {len(signed_tx)}, Chain ID: {web3.eth.chain_id}"
+                    "Sending raw transaction to network - Length: %s, Chain ID: %s",
+                    len(signed_tx),
+                    chain_id,
                 )
 
                 # Send the signed transaction
-                tx_hash = web3.eth.send_raw_transaction(signed.raw_transaction).hex()
-                self.logger.info(f"Transaction sent successfully - Hash: {tx_hash}")
+                sent_hash = await asyncio.to_thread(
+                    web3.eth.send_raw_transaction, signed.raw_transaction
+                )
+                tx_hash = normalize_tx_hash(sent_hash.hex())
+                self.logger.info("Transaction sent successfully - Hash: %s", tx_hash)
 
             status = "pending"
-            now = datetime.datetime.now()
+            now = utc_now()
 
             # Calculate effective fee based on transaction
             effective_fee = int(tx["gas"] * tx["maxFeePerGas"])
 
             # 4. Save transaction history
-            self.logger.info(f"Saving transaction to database - Hash: {tx_hash}")
+            self.logger.info("Saving transaction to database - Hash: %s", tx_hash)
 
             with MetricsContext("save_transaction", "database"):
-                # Ensure hash has 0x prefix
-                formatted_tx_hash = (
-                    tx_hash if tx_hash.startswith("0x") else f"0x{tx_hash}"
-                )
-
                 await self.db_repo.save_transaction(
                     TransactionEntity(
-                        hash=formatted_tx_hash,
+                        hash=tx_hash,
                         asset=request.asset,
                         address_from=request.address_from,
                         address_to=request.address_to,
@@ -584,12 +652,17 @@ class CreateOnChainTransaction(LoggerMixin):
 
             duration = time.time() - start_time
             self.logger.info(
-                f"Transaction created successfully - Hash: {formatted_tx_hash}, Asset: {request.asset}, Status: {status}, Fee: {float(wei_to_eth(effective_fee)):.6f} ETH, Duration: {duration:.2f}s"
+                "Transaction created successfully - Hash: %s, Asset: %s, Status: %s, Fee: %.6f ETH, Duration: %.2fs",
+                tx_hash,
+                request.asset,
+                status,
+                float(wei_to_eth(effective_fee)),
+                duration,
             )
 
             # 5. Return response (background monitor will update status)
             return TransactionOnChainResponse(
-                hash=formatted_tx_hash,
+                hash=tx_hash,
                 status=status,
                 effective_fee=float(wei_to_eth(effective_fee)),
                 created_at=now.isoformat(),
@@ -605,30 +678,70 @@ class CreateOnChainTransaction(LoggerMixin):
             if "Private key not found in Vault" in str(e):
                 duration = time.time() - start_time
                 self.logger.error(
-                    f"Transaction creation failed - Wallet key not found - From: {request.address_from}, To: {request.address_to}, Asset: {request.asset}, Error: {str(e)}, Duration: {duration}s"
+                    "Transaction creation failed - Wallet key not found - From: %s, To: %s, Asset: %s, Error: %s, Duration: %ss",
+                    request.address_from,
+                    request.address_to,
+                    request.asset,
+                    e,
+                    duration,
                 )
                 record_transaction_created(request.asset, "error")
                 raise HTTPException(HTTPStatus.BAD_REQUEST, str(e))
             else:
                 duration = time.time() - start_time
                 self.logger.error(
-                    f"Transaction creation failed - From: {request.address_from}, To: {request.address_to}, Asset: {request.asset}, Error: {str(e)}, Duration: {duration}s"
+                    "Transaction creation failed - From: %s, To: %s, Asset: %s, Error: %s, Duration: %ss",
+                    request.address_from,
+                    request.address_to,
+                    request.asset,
+                    e,
+                    duration,
                 )
                 record_transaction_created(request.asset, "error")
                 raise
         except Exception as e:
             duration = time.time() - start_time
             self.logger.error(
-                f"Transaction creation failed - From: {request.address_from}, To: {request.address_to}, Asset: {request.asset}, Error: {str(e)}, Duration: {duration}s"
+                "Transaction creation failed - From: %s, To: %s, Asset: %s, Error: %s, Duration: %ss",
+                request.address_from,
+                request.address_to,
+                request.asset,
+                e,
+                duration,
             )
             record_transaction_created(request.asset, "error")
             raise
 
 
+def encode_cursor(created_at: datetime.datetime, tx_hash: str) -> str:
+    """Encode a keyset position (created_at, hash) as an opaque cursor"""
+    raw = f"{created_at.isoformat()}|{tx_hash}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime.datetime, str]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, tx_hash = raw.split("|", 1)
+        return datetime.datetime.fromisoformat(created_at), tx_hash
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(HTTPStatus.BAD_REQUEST, "Invalid pagination cursor")
+
+
 class ListTransactions(LoggerMixin):
     def __init__(self, db_repo: PostgreSQLTransactionRepository):
         self.db_repo = db_repo
 
-    async def execute(self, limit: int = 100, offset: int = 0):
-        self.logger.info(f"Listing transactions - Limit: {limit}, Offset: {offset}")
-        return await self.db_repo.list_transactions(limit=limit, offset=offset)
+    async def execute(
+        self, limit: int = 100, offset: int = 0, cursor: Optional[str] = None
+    ):
+        if cursor is None:
+            self.logger.info(
+                "Listing transactions - Limit: %s, Offset: %s", limit, offset
+            )
+            return await self.db_repo.list_transactions(limit=limit, offset=offset)
+
+        after = decode_cursor(cursor)
+        self.logger.info("Listing transactions - Limit: %s, After: %s", limit, after)
+        return await self.db_repo.list_transactions(limit=limit, after=after)
@@ -1,36 +1,30 @@
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Optional
+
+import pydantic_core
 
 from app.application.v1.wallet.schemas import WalletCreationStatusResponse
 from app.application.v1.wallet.usecase import CreateWalletsUseCase, GetAllWalletsUseCase
 
+logger = logging.getLogger(__name__)
+
 
-# Simple, direct logging
+# Records only go onto the root logger's queue; logs/app.log is written by the
+# listener thread started in setup_logging, never on the event loop. Messages
+# take %-style args so nothing is formatted when the level is disabled.
 def write_log(
-    level: str, message: str, extra_data: Optional[Dict[str, Any]] = None
+    level: str,
+    message: str,
+    *args: Any,
+    extra_data: Optional[Dict[str, Any]] = None,
 ) -> None:
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = f"{timestamp} | {level} | wallet_handler | {message}"
+    log_level = getattr(logging, level)
+    if not logger.isEnabledFor(log_level):
+        return
     if extra_data:
-        log_entry += f" | {extra_data}"
-
-    # Write to file directly
-    try:
-        with open("logs/app.log", "a") as f:
-            f.write(log_entry + "\n")
-            f.flush()
-    except:
-        pass  # Fail silently
-
-    # Also use standard logging
-    logger = logging.getLogger(__name__)
-    if level == "INFO":
-        logger.info(message)
-    elif level == "WARNING":
-        logger.warning(message)
-    elif level == "ERROR":
-        logger.error(message)
+        logger.log(log_level, message + " | %s", *args, extra_data)
+    else:
+        logger.log(log_level, message, *args)
 
 
 async def create_wallets_handler(
@@ -41,16 +35,18 @@ async def create_wallets_handler(
     """
     write_log(
         "INFO",
-        f"🏦 Iniciando criação de {n} carteira(s)",
-        {"operation": "create_wallets", "wallet_count": n},
+        "🏦 Iniciando criação de %d carteira(s)",
+        n,
+        extra_data={"operation": "create_wallets", "wallet_count": n},
     )
 
     try:
         addresses = await usecase.execute(n)
         write_log(
             "INFO",
-            f"✅ {len(addresses)} carteira(s) criada(s) com sucesso",
-            {
+            "✅ %d carteira(s) criada(s) com sucesso",
+            len(addresses),
+            extra_data={
                 "operation": "create_wallets_success",
                 "wallet_count": len(addresses),
                 "addresses": addresses[
@@ -64,35 +60,52 @@ async def create_wallets_handler(
     except Exception as e:
         write_log(
             "ERROR",
-            f"❌ Erro ao criar carteiras: {str(e)}",
-            {"operation": "create_wallets_error", "wallet_count": n, "error": str(e)},
+            "❌ Erro ao criar carteiras: %s",
+            e,
+            extra_data={
+                "operation": "create_wallets_error",
+                "wallet_count": n,
+                "error": str(e),
+            },
         )
         raise
 
 
-async def get_all_wallets_handler(conn):
+async def get_all_wallets_handler(conn) -> AsyncIterator[bytes]:
     """
-    Handler to get all active wallets (not soft-deleted).
+    Handler to stream all active wallets (not soft-deleted) as a JSON body
+    of the form {"wallets": [{"address": ...}, ...]}, one chunk per batch.
     """
     write_log(
         "INFO",
         "📋 Consultando todas as carteiras ativas",
-        {"operation": "get_all_wallets"},
+        extra_data={"operation": "get_all_wallets"},
     )
 
     try:
         usecase = GetAllWalletsUseCase(conn)
-        wallets = await usecase.execute()
+        count = 0
+        yield b'{"wallets":['
+        async for batch in usecase.stream():
+            # Encode the batch as a JSON array and drop its brackets
+            chunk = pydantic_core.to_json(batch)[1:-1]
+            yield b"," + chunk if count else chunk
+            count += len(batch)
+        yield b"]}"
         write_log(
             "INFO",
-            f"✅ {len(wallets)} carteira(s) encontrada(s)",
-            {"operation": "get_all_wallets_success", "wallet_count": len(wallets)},
+            "✅ %d carteira(s) encontrada(s)",
+            count,
+            extra_data={
+                "operation": "get_all_wallets_success",
+                "wallet_count": count,
+            },
         )
-        return wallets  # This will be a list of dicts with 'address'
     except Exception as e:
         write_log(
             "ERROR",
-            f"❌ Erro ao consultar carteiras: {str(e)}",
-            {"operation": "get_all_wallets_error", "error": str(e)},
+            "❌ Erro ao consultar carteiras: %s",
+            e,
+            extra_data={"operation": "get_all_wallets_error", "error": str(e)},
         )
         raise
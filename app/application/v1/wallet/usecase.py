@@ -1,12 +1,15 @@
-import datetime
+import asyncio
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import List
-
-from sqlalchemy import Null
+from typing import AsyncIterator
 
 from app.domain.wallet.entity import Wallet
 from app.shared.monitoring.metrics import record_wallet_created
+from app.shared.utils.clock import utc_now
+
+_LIST_ACTIVE_WALLETS = "SELECT address FROM wallets WHERE deleted_at IS NULL"
+
+# Rows fetched from the cursor and encoded per chunk when streaming wallets
+_STREAM_BATCH_SIZE = 1000
 
 
 # --- Abstractions ---
@@ -15,6 +18,11 @@ class VaultService(ABC):
     def store_private_key(self, key_id: str, private_key: str) -> None:
         pass
 
+    @abstractmethod
+    def store_private_keys_bulk(self, private_keys: dict[str, str]) -> None:
+        """Store many private keys, keyed by key id"""
+        pass
+
     @abstractmethod
     def get_private_key(self, key_id: str) -> str:
         pass
@@ -38,32 +46,51 @@ class CreateWalletsUseCase:
         vault_service: VaultService,
         wallet_service: WalletService,
         wallet_repository,
+        wallet_cache=None,
     ):
         self.vault_service = vault_service
         self.wallet_service = wallet_service
         self.wallet_repository = wallet_repository
+        self.wallet_cache = wallet_cache
+
+    def _generate_wallets(self, n: int) -> list[dict]:
+        return [self.wallet_service.create_wallet() for _ in range(n)]
 
     async def execute(self, n: int) -> list[str]:
         """
         Creates N Ethereum wallets, stores private keys in Vault, and returns status.
         """
-        addresses = []
-        for i in range(n):
-            wallet = self.wallet_service.create_wallet()
-            address = wallet["address"]
-            private_key = wallet["private_key"]
-            key_id = f"eth_wallet_{address}"
-            self.vault_service.store_private_key(key_id, private_key)
-            # Save to repository
-            await self.wallet_repository.save_wallet(
-                Wallet(
-                    address=address,
-                    created_at=datetime.datetime.now(),
-                    updated_at=datetime.datetime.now(),
-                    deleted_at=None,
-                )
+        # Key generation is CPU-bound, so the whole batch runs in a worker
+        # thread instead of stalling other requests on the event loop
+        generated = await asyncio.to_thread(self._generate_wallets, n)
+
+        # All keys go to Vault in one call instead of one round trip per wallet
+        await asyncio.to_thread(
+            self.vault_service.store_private_keys_bulk,
+            {
+                f"eth_wallet_{wallet['address']}": wallet["private_key"]
+                for wallet in generated
+            },
+        )
+
+        now = utc_now()
+        addresses = [wallet["address"] for wallet in generated]
+        wallets = [
+            Wallet(
+                address=address,
+                created_at=now,
+                updated_at=now,
+                deleted_at=None,
             )
-            addresses.append(address)
+            for address in addresses
+        ]
+
+        # Save to repository in one batch
+        await self.wallet_repository.save_wallets_bulk(wallets)
+
+        # New wallets must be visible to ownership checks right away
+        if self.wallet_cache is not None:
+            self.wallet_cache.invalidate()
 
         # Record metrics for all wallets created in this batch
         record_wallet_created(n)
@@ -91,9 +118,30 @@ class GetAllWalletsUseCase:
         self.conn = conn
 
     async def execute(self):
-        query = "SELECT address FROM wallets WHERE deleted_at IS NULL;"
-        rows = await self.conn.fetch(query)
-        return [dict(row) for row in rows]
+        # A constant query text lets asyncpg reuse the connection's cached
+        # prepared statement on every call
+        rows = await self.conn.fetch(_LIST_ACTIVE_WALLETS)
+        return [{"address": row["address"]} for row in rows]
+
+    async def stream(
+        self, batch_size: int = _STREAM_BATCH_SIZE
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Yield active wallets in batches read through a server-side cursor,
+        so memory use does not grow with the size of the table.
+        """
+        # asyncpg cursors only exist inside a transaction
+        async with self.conn.transaction():
+            batch = []
+            async for row in self.conn.cursor(
+                _LIST_ACTIVE_WALLETS, prefetch=batch_size
+            ):
+                batch.append({"address": row["address"]})
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
 
 
 # --- Implementations for VaultService and WalletService should be provided elsewhere and injected here. ---
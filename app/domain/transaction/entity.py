@@ -1,11 +1,12 @@
 import datetime
+from dataclasses import dataclass
 from typing import Optional
-from uuid import UUID
 
-from pydantic import BaseModel
 
-
-class Transaction(BaseModel):
+# Built from node data and database rows only; request validation happens in
+# the API schemas, so the entity skips Pydantic's per-field validation
+@dataclass(slots=True, kw_only=True)
+class Transaction:
     hash: str
     asset: str
     address_from: str
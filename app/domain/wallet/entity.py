@@ -1,11 +1,14 @@
+# Wallet Domain
 import datetime
+from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import BaseModel, Field
 
-
-class Wallet(BaseModel):
-    address: str = Field(..., description="The Ethereum address of the wallet")
+# Plain slotted dataclass: wallets are built from generated keys and database
+# rows, never from client input, so there is nothing to validate
+@dataclass(slots=True)
+class Wallet:
+    address: str  # The Ethereum address of the wallet
     created_at: datetime.datetime
     updated_at: datetime.datetime
     deleted_at: Optional[datetime.datetime] = None
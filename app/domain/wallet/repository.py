@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from app.domain.wallet.entity import Wallet
 
@@ -9,10 +9,22 @@ class WalletRepository(ABC):
     async def save_wallet(self, wallet: Wallet) -> None:
         pass
 
+    @abstractmethod
+    async def save_wallets_bulk(self, wallets: List[Wallet]) -> None:
+        pass
+
     @abstractmethod
     async def get_wallet_by_address(self, address: str) -> Optional[Wallet]:
         pass
 
+    @abstractmethod
+    async def get_wallets_by_addresses(self, addresses: List[str]) -> Set[str]:
+        pass
+
+    @abstractmethod
+    async def list_active_addresses(self) -> Set[str]:
+        pass
+
     @abstractmethod
     async def list_wallets(self) -> List[Wallet]:
         pass
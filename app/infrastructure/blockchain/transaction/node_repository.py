@@ -1,11 +1,92 @@
-from web3 import Web3
+import sys
+from collections.abc import Mapping
+from functools import cached_property
+
+from eth_abi import encode
+from eth_utils import (
+    event_signature_to_log_topic,
+    function_signature_to_4byte_selector,
+)
 
 from app.domain.transaction.repository import TransactionRepository
+from app.shared.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 4-byte selector of ERC20 transfer(address,uint256)
+ERC20_TRANSFER_SELECTOR = function_signature_to_4byte_selector(
+    "transfer(address,uint256)"
+)
+
+# topic[0] of ERC20 Transfer(address,address,uint256) event logs
+ERC20_TRANSFER_TOPIC = event_signature_to_log_topic("Transfer(address,address,uint256)")
+
+# Standard ERC20 ABI for the symbol() function
+_ERC20_SYMBOL_ABI = [
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "symbol",
+        "outputs": [{"name": "", "type": "string"}],
+        "type": "function",
+    }
+]
+
+# Token symbols never change, so they are cached per contract for the
+# lifetime of the repository; bounded to avoid unbounded growth
+_SYMBOL_CACHE_MAX_SIZE = 4096
+
+
+def encode_erc20_transfer(address_to: str, value: int) -> str:
+    """
+    Encode the calldata of an ERC20 transfer(address_to, value) call.
+    Same output as contract.functions.transfer(...), without building a contract.
+    """
+    calldata = ERC20_TRANSFER_SELECTOR + encode(
+        ["address", "uint256"], [address_to, value]
+    )
+    return "0x" + calldata.hex()
+
+
+def fetch_transaction_parameters(web3, address: str) -> tuple[int, int, int, int]:
+    """
+    Fetch (nonce, balance, gas_price, max_priority_fee) for address.
+
+    All four reads go to the node as one JSON-RPC batch. Providers without
+    batch support, or without eth_maxPriorityFeePerGas (which fails the whole
+    batch), fall back to individual calls with a 2 gwei priority fee.
+    """
+    eth = web3.eth
+    try:
+        with web3.batch_requests() as batch:
+            batch.add(eth.get_transaction_count(address))
+            batch.add(eth.get_balance(address))
+            batch.add(eth.gas_price)
+            batch.add(eth.max_priority_fee)
+            nonce, balance, gas_price, max_priority_fee = batch.execute()
+        return nonce, balance, gas_price, max_priority_fee
+    except Exception as e:
+        logger.debug("Batch request failed, falling back to single calls: %s", e)
+
+    nonce = eth.get_transaction_count(address)
+    balance = eth.get_balance(address)
+    gas_price = eth.gas_price
+    try:
+        max_priority_fee = eth.max_priority_fee
+    except Exception:
+        max_priority_fee = 2000000000  # 2 gwei
+    return nonce, balance, gas_price, max_priority_fee
 
 
 class Web3TransactionRepository(TransactionRepository):
     def __init__(self, web3):
         self.web3 = web3
+        self._symbol_cache: dict[str, str] = {}
+
+    @cached_property
+    def chain_id(self) -> int:
+        """Chain id of the connected node, fixed for the life of the connection"""
+        return self.web3.eth.chain_id
 
     def get_transaction(self, tx_hash: str) -> dict:
         tx = self.web3.eth.get_transaction(tx_hash)
@@ -28,22 +109,87 @@ class Web3TransactionRepository(TransactionRepository):
     def get_transaction_confirmations(self, transaction_hash: str) -> int:
         """Get number of confirmations for a transaction"""
         try:
-            tx = self.web3.eth.get_transaction(transaction_hash)
-            if tx.blockNumber is None:
-                print(
-                    f"[DEBUG] Transaction {transaction_hash} is pending (blockNumber is None)"
+            # The transaction and the current block come back in one batch
+            try:
+                with self.web3.batch_requests() as batch:
+                    batch.add(self.web3.eth.get_transaction(transaction_hash))
+                    batch.add(self.web3.eth.block_number)
+                    tx, current_block = batch.execute()
+            except Exception as e:
+                logger.debug(
+                    "Batch request failed, falling back to single calls: %s", e
                 )
+                tx = self.web3.eth.get_transaction(transaction_hash)
+                current_block = None
+            if tx.blockNumber is None:
+                logger.debug("Transaction %s is pending", transaction_hash)
                 return 0  # Transaction is pending
-            current_block = self.web3.eth.block_number
+            if current_block is None:
+                current_block = self.web3.eth.block_number
             confirmations = current_block - tx.blockNumber + 1
-            print(
-                f"[DEBUG] Transaction {transaction_hash}: blockNumber={tx.blockNumber}, current_block={current_block}, confirmations={confirmations}"
+            logger.debug(
+                "Transaction %s: blockNumber=%s, current_block=%s, confirmations=%s",
+                transaction_hash,
+                tx.blockNumber,
+                current_block,
+                confirmations,
             )
             return confirmations
         except Exception as e:
-            print(f"[ERROR] Failed to get confirmations for {transaction_hash}: {e}")
+            logger.error("Failed to get confirmations for %s: %s", transaction_hash, e)
             return 0
 
+    def get_transactions_confirmations(self, transaction_hashes: list[str]) -> dict:
+        """
+        Get confirmations for many transactions in a single JSON-RPC batch
+
+        The current block number is fetched once and all receipts are
+        requested in one batch, instead of two round trips per hash. The
+        batch goes straight to the provider so each entry is handled on its
+        own: a null receipt (pending, unknown or dropped hash) or an error
+        entry only leaves that hash at 0. Only providers without batch
+        support fall back to looking up each hash individually.
+
+        Returns:
+            dict mapping each hash to its confirmations (0 when pending or unknown)
+        """
+        confirmations = {tx_hash: 0 for tx_hash in transaction_hashes}
+        if not transaction_hashes:
+            return confirmations
+        try:
+            current_block = self.web3.eth.block_number
+            responses = self.web3.provider.make_batch_request(
+                [
+                    ("eth_getTransactionReceipt", [tx_hash])
+                    for tx_hash in transaction_hashes
+                ]
+            )
+            if not isinstance(responses, list):
+                # A batch-level error comes back as a single response object
+                raise ValueError(responses.get("error", responses))
+        except Exception as e:
+            logger.debug("Batch request failed, falling back to single calls: %s", e)
+            return {
+                tx_hash: self.get_transaction_confirmations(tx_hash)
+                for tx_hash in confirmations
+            }
+
+        for tx_hash, response in zip(transaction_hashes, responses):
+            receipt = response.get("result")
+            if not isinstance(receipt, Mapping):
+                if "error" in response:
+                    logger.debug(
+                        "Receipt lookup failed for %s: %s", tx_hash, response["error"]
+                    )
+                continue
+            block_number = receipt.get("blockNumber")
+            if block_number is not None:
+                # Raw responses are unformatted, so quantities are hex strings
+                if isinstance(block_number, str):
+                    block_number = int(block_number, 16)
+                confirmations[tx_hash] = current_block - block_number + 1
+        return confirmations
+
     def is_transaction_confirmed(
         self, transaction_hash: str, min_confirmations: int = 6
     ) -> bool:
@@ -63,105 +209,109 @@ class Web3TransactionRepository(TransactionRepository):
         try:
             tx = self.web3.eth.get_transaction(transaction_hash)
             if tx is None or not hasattr(tx, "hash"):
-                print(
-                    f"[DEBUG] Transaction {transaction_hash} not found or missing hash attribute"
+                logger.debug(
+                    "Transaction %s not found or missing hash attribute",
+                    transaction_hash,
                 )
                 return False
             if require_confirmations:
                 result = self.is_transaction_confirmed(
                     transaction_hash, min_confirmations
                 )
-                print(
-                    f"[DEBUG] is_transaction_confirmed({transaction_hash}, {min_confirmations}) = {result}"
+                logger.debug(
+                    "is_transaction_confirmed(%s, %s) = %s",
+                    transaction_hash,
+                    min_confirmations,
+                    result,
                 )
                 return result
-            print(
-                f"[DEBUG] Transaction {transaction_hash} found and confirmations not required"
+            logger.debug(
+                "Transaction %s found and confirmations not required", transaction_hash
             )
             return True
         except Exception as e:
-            print(f"[ERROR] Failed to validate transaction {transaction_hash}: {e}")
+            logger.error("Failed to validate transaction %s: %s", transaction_hash, e)
             return False
 
+    def _get_transaction_and_receipt(self, tx_hash: str) -> tuple:
+        """
+        Fetch a transaction and its receipt in one JSON-RPC batch
+
+        A pending transaction has no receipt, which fails the whole batch;
+        then both are fetched individually and the receipt is None.
+        """
+        try:
+            with self.web3.batch_requests() as batch:
+                batch.add(self.web3.eth.get_transaction(tx_hash))
+                batch.add(self.web3.eth.get_transaction_receipt(tx_hash))
+                tx, receipt = batch.execute()
+            return tx, receipt
+        except Exception as e:
+            logger.debug("Batch request failed, falling back to single calls: %s", e)
+
+        tx = self.web3.eth.get_transaction(tx_hash)
+        try:
+            receipt = self.web3.eth.get_transaction_receipt(tx_hash)
+        except Exception as e:
+            logger.error("Failed to get transaction receipt for %s: %s", tx_hash, e)
+            receipt = None
+        return tx, receipt
+
     def get_transaction_transfers(self, tx_hash: str) -> list:
         """
         Retorna uma lista de transferências (ETH ou tokens) associadas a um tx_hash.
         Cada item é um dicionário com: asset, from, to, value
         """
-        print(f"[DEBUG] get_transaction_transfers called for {tx_hash}")
-        tx = self.web3.eth.get_transaction(tx_hash)
+        tx, receipt = self._get_transaction_and_receipt(tx_hash)
         transfers = []
 
         # ETH transfer
         if tx.value and tx.value > 0:
-            print(f"[DEBUG] ETH transfer found: value={tx.value}")
             transfers.append(
-                {"asset": "eth", "from": tx["from"], "to": tx["to"], "value": tx.value}
+                {
+                    "asset": "eth",
+                    "from": tx["from"],
+                    "address_from": tx["from"],
+                    "to": tx["to"],
+                    "value": tx.value,
+                }
             )
-        else:
-            print(f"[DEBUG] No ETH transfer found: tx.value={tx.value}")
 
         # Token transfers (ERC20)
+        if receipt is None:
+            return transfers
         try:
-            receipt = self.web3.eth.get_transaction_receipt(tx_hash)
-            print(f"[DEBUG] Transaction receipt found, logs count: {len(receipt.logs)}")
-
-            for i, log in enumerate(receipt.logs):
-                print(
-                    f"[DEBUG] Processing log {i}: topics={len(log.topics) if log.topics else 0}"
-                )
-
-                # ERC20 Transfer event signature (without 0x prefix)
-                transfer_signature = (
-                    "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
-                )
-
+            for log in receipt.logs:
                 if log.topics and len(log.topics) > 0:
-                    # Get topic without 0x prefix for comparison
-                    topic_hex = log.topics[0].hex()
-                    print(f"[DEBUG] Log {i} topic[0]: {topic_hex}")
-
-                    if topic_hex == transfer_signature:
-                        print(f"[DEBUG] Log {i} is a Transfer event")
+                    # Topics are bytes; compare without hex-encoding each one
+                    if log.topics[0] == ERC20_TRANSFER_TOPIC:
                         if len(log.topics) >= 3:
-                            from_address = "0x" + log.topics[1].hex()[-40:]
-                            to_address = "0x" + log.topics[2].hex()[-40:]
-
-                            # Convert log.data to hex string if it's bytes
-                            if isinstance(log.data, bytes):
-                                data_hex = log.data.hex()
-                            else:
-                                data_hex = (
-                                    log.data[2:]
-                                    if log.data.startswith("0x")
-                                    else log.data
-                                )
+                            # Addresses are the low 20 bytes of the topics
+                            from_address = "0x" + bytes(log.topics[1])[-20:].hex()
+                            to_address = "0x" + bytes(log.topics[2])[-20:].hex()
 
-                            value = int(data_hex, 16) if data_hex else 0
-                            print(
-                                f"[DEBUG] Token Transfer detected: from={from_address}, to={to_address}, value={value}"
-                            )
+                            # Decode the uint256 value straight from the raw
+                            # bytes; only hex-string data needs converting first
+                            data = log.data
+                            if not isinstance(data, (bytes, bytearray)):
+                                data = bytes.fromhex(
+                                    data[2:] if data.startswith("0x") else data
+                                )
+                            value = int.from_bytes(data[:32], "big")
                             transfers.append(
                                 {
                                     "asset": "token",
                                     "from": from_address,
+                                    "address_from": from_address,
                                     "to": to_address,
                                     "value": value,
                                 }
                             )
-                        else:
-                            print(
-                                f"[DEBUG] Log {i} Transfer event has insufficient topics: {len(log.topics)}"
-                            )
-                    else:
-                        print(f"[DEBUG] Log {i} is not a Transfer event")
-                else:
-                    print(f"[DEBUG] Log {i} has no topics")
 
         except Exception as e:
-            print(f"[ERROR] Failed to get transaction receipt for {tx_hash}: {e}")
+            logger.error("Failed to decode transfer logs for %s: %s", tx_hash, e)
 
-        print(f"[DEBUG] get_transaction_transfers returning {len(transfers)} transfers")
+        logger.debug("Found %d transfers in %s", len(transfers), tx_hash)
         return transfers
 
     def get_token_symbol(self, contract_address: str) -> str:
@@ -170,29 +320,24 @@ class Web3TransactionRepository(TransactionRepository):
         Returns the symbol or 'UNKNOWN' if unable to retrieve.
         """
         try:
-            # Standard ERC20 ABI for symbol() function
-            erc20_abi = [
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "symbol",
-                    "outputs": [{"name": "", "type": "string"}],
-                    "type": "function",
-                }
-            ]
+            checksum_address = self.web3.to_checksum_address(contract_address)
+            cached = self._symbol_cache.get(checksum_address)
+            if cached is not None:
+                return cached
 
             contract = self.web3.eth.contract(
-                address=self.web3.to_checksum_address(contract_address), abi=erc20_abi
+                address=checksum_address, abi=_ERC20_SYMBOL_ABI
             )
 
             symbol = contract.functions.symbol().call()
-            # Normalize symbol to uppercase for consistency
-            symbol_upper = symbol.upper()
-            print(
-                f"[DEBUG] Token symbol for {contract_address}: {symbol} -> {symbol_upper}"
-            )
+            # Normalize symbol to uppercase for consistency; symbols are a small
+            # vocabulary reused as asset values and metric labels, so intern them
+            symbol_upper = sys.intern(symbol.upper())
+            # Failed lookups fall through to "UNKNOWN" below and are not cached
+            if len(self._symbol_cache) < _SYMBOL_CACHE_MAX_SIZE:
+                self._symbol_cache[checksum_address] = symbol_upper
             return symbol_upper
 
         except Exception as e:
-            print(f"[ERROR] Failed to get token symbol for {contract_address}: {e}")
+            logger.error("Failed to get token symbol for %s: %s", contract_address, e)
             return "UNKNOWN"
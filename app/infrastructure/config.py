@@ -1,5 +1,5 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from dotenv import load_dotenv
 
@@ -16,6 +16,30 @@ class Config:
     environment: str
     app_version: str
     enable_metrics: bool
+    # "text" or "json" (one object per line)
+    log_format: str = "text"
+    # Pre-measured gas limits for token contracts, keyed by lowercase address
+    token_gas_overrides: dict[str, int] = field(default_factory=dict)
+    # asyncpg pool bounds; min_size connections are opened at startup
+    postgres_pool_min_size: int = 10
+    postgres_pool_max_size: int = 25
+    # Prepared statements kept per pooled connection
+    postgres_statement_cache_size: int = 1024
+    # Seconds before a query is cancelled
+    postgres_command_timeout: float = 30.0
+
+
+def parse_gas_overrides(raw: str) -> dict[str, int]:
+    """
+    Parse "0xContract=65000,0xOther=90000" into {lowercase address: gas limit}
+    """
+    overrides = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        address, _, gas = item.partition("=")
+        overrides[address.strip().lower()] = int(gas)
+    return overrides
 
 
 def load_config() -> Config:
@@ -30,7 +54,15 @@ def load_config() -> Config:
         web3_provider_url=os.getenv("WEB3_PROVIDER_URL", "http://localhost:8545"),
         # Logging and Monitoring
         log_level=os.getenv("LOG_LEVEL", "INFO"),
+        log_format=os.getenv("LOG_FORMAT", "text"),
         environment=os.getenv("ENVIRONMENT", "development"),
         app_version=os.getenv("APP_VERSION", "1.0.0"),
         enable_metrics=os.getenv("ENABLE_METRICS", "true").lower() == "true",
+        token_gas_overrides=parse_gas_overrides(os.getenv("TOKEN_GAS_OVERRIDES", "")),
+        postgres_pool_min_size=int(os.getenv("POSTGRES_POOL_MIN_SIZE", "10")),
+        postgres_pool_max_size=int(os.getenv("POSTGRES_POOL_MAX_SIZE", "25")),
+        postgres_statement_cache_size=int(
+            os.getenv("POSTGRES_STATEMENT_CACHE_SIZE", "1024")
+        ),
+        postgres_command_timeout=float(os.getenv("POSTGRES_COMMAND_TIMEOUT", "30")),
     )
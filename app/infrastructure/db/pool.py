@@ -0,0 +1,33 @@
+import asyncpg
+
+# Repository queries are small OLTP lookups; JIT compilation only adds
+# planning time to them
+_SERVER_SETTINGS = {"jit": "off"}
+
+
+async def create_pool(
+    dsn: str,
+    *,
+    min_size: int = 10,
+    max_size: int = 25,
+    statement_cache_size: int = 1024,
+    command_timeout: float = 30.0,
+    max_inactive_connection_lifetime: float = 300.0,
+) -> asyncpg.Pool:
+    """
+    Create the asyncpg pool shared by the repositories
+
+    Size max_size to the concurrent requests one worker serves; across all
+    workers, max_size must stay below the server's max_connections minus
+    headroom for migrations and admin sessions. Idle connections above
+    min_size are closed after max_inactive_connection_lifetime seconds.
+    """
+    return await asyncpg.create_pool(
+        dsn,
+        min_size=min_size,
+        max_size=max_size,
+        statement_cache_size=statement_cache_size,
+        command_timeout=command_timeout,
+        max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+        server_settings=_SERVER_SETTINGS,
+    )
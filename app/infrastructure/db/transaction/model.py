@@ -1,12 +1,30 @@
-import datetime
-
-from sqlalchemy import BigInteger, Boolean, Column, DateTime, Float, Integer, String
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    String,
+    text,
+)
 
 from app.infrastructure.db.base import Base
+from app.shared.utils.clock import utc_now
 
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Matches the keyset ORDER BY used by list_transactions
+        Index("ix_transactions_created_at_hash", "created_at", "hash"),
+        # Serves the monitor's pending poll, index-only for the hash variant
+        Index(
+            "ix_transactions_pending_created_at",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'confirming')"),
+            postgresql_include=["hash"],
+        ),
+    )
     hash = Column(String, primary_key=True)
     asset = Column(String, nullable=False)
     address_from = Column(String, nullable=False)
@@ -16,11 +34,11 @@ class Transaction(Base):
     type = Column(String, nullable=False)
     status = Column(String, nullable=False)
     effective_fee = Column(BigInteger, nullable=True)
-    created_at = Column(DateTime, default=datetime.datetime.now, nullable=False)
+    created_at = Column(DateTime, default=utc_now, nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.datetime.now,
-        onupdate=datetime.datetime.now,
+        default=utc_now,
+        onupdate=utc_now,
         nullable=False,
     )
     deleted_at = Column(DateTime, nullable=True)
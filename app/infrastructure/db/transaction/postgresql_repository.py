@@ -1,39 +1,190 @@
+import asyncio
 import datetime
-
-import asyncpg
+from collections import OrderedDict
+from typing import NamedTuple, Optional
 
 from app.domain.transaction.entity import Transaction as TransactionEntity
-from app.infrastructure.db.transaction.model import Transaction as TransactionModel
+from app.infrastructure.db.pool import create_pool
+
+_INSERT_TRANSACTION = (
+    "INSERT INTO transactions(hash, asset, address_from, address_to, value, is_token, type, status, effective_fee, created_at, updated_at, deleted_at) "
+    "VALUES($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12) "
+    "ON CONFLICT (hash) DO NOTHING"
+)
+
+# Same insert for a whole batch: one array parameter per column, expanded
+# server-side by unnest into one row per transaction
+_INSERT_TRANSACTIONS_UNNEST = (
+    "INSERT INTO transactions(hash, asset, address_from, address_to, value, is_token, type, status, effective_fee, created_at, updated_at, deleted_at) "
+    "SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::bigint[], $6::boolean[], $7::text[], $8::text[], $9::bigint[], $10::timestamp[], $11::timestamp[], $12::timestamp[]) "
+    "ON CONFLICT (hash) DO NOTHING"
+)
+
+
+# Query texts are module constants so every call sends the identical string,
+# which asyncpg's per-connection statement cache prepares only once
+_TRANSACTION_COLUMNS = (
+    "hash, asset, address_from, address_to, value, is_token, type, status, "
+    "effective_fee, created_at, updated_at, deleted_at"
+)
+_HAS_TRANSACTION = "SELECT 1 FROM transactions WHERE hash = $1"
+# updated_at comes from the database clock, as naive UTC like utc_now()
+_UPDATE_TRANSACTION_STATUS = (
+    "UPDATE transactions SET status = $1, updated_at = NOW() AT TIME ZONE 'UTC' "
+    "WHERE hash = $2"
+)
+_UPDATE_TRANSACTIONS_STATUS = (
+    "UPDATE transactions SET status = $1, updated_at = NOW() AT TIME ZONE 'UTC' "
+    "WHERE hash = ANY($2)"
+)
+_SELECT_TRANSACTION_BY_HASH = (
+    f"SELECT {_TRANSACTION_COLUMNS} FROM transactions WHERE hash = $1"
+)
+_SELECT_TRANSACTIONS_BY_HASHES = (
+    f"SELECT {_TRANSACTION_COLUMNS} FROM transactions WHERE hash = ANY($1)"
+)
+_SELECT_TRANSACTIONS_PAGE = (
+    f"SELECT {_TRANSACTION_COLUMNS} FROM transactions "
+    "ORDER BY created_at DESC, hash DESC LIMIT $1 OFFSET $2"
+)
+# Keyset pagination: served by ix_transactions_created_at_hash
+_SELECT_TRANSACTIONS_AFTER = (
+    f"SELECT {_TRANSACTION_COLUMNS} FROM transactions "
+    "WHERE (created_at, hash) < ($2, $3) "
+    "ORDER BY created_at DESC, hash DESC LIMIT $1"
+)
+# Pending or confirming transactions created in the last $1 hours
+_PENDING_TRANSACTIONS_FILTER = (
+    "FROM transactions "
+    "WHERE status IN ('pending', 'confirming') "
+    "AND created_at > NOW() - INTERVAL '1 hour' * $1 "
+    "ORDER BY created_at ASC"
+)
+_SELECT_PENDING_TRANSACTIONS = (
+    f"SELECT {_TRANSACTION_COLUMNS} {_PENDING_TRANSACTIONS_FILTER}"
+)
+_SELECT_PENDING_TRANSACTION_HASHES = f"SELECT hash {_PENDING_TRANSACTIONS_FILTER}"
+
+
+class TransactionRow(NamedTuple):
+    """
+    Read-only transaction row, in _TRANSACTION_COLUMNS order
+
+    Returned by listings instead of TransactionEntity: TransactionRow._make
+    copies a record's values into a tuple without per-field keyword calls.
+    """
+
+    hash: str
+    asset: str
+    address_from: str
+    address_to: str
+    value: int
+    is_token: bool
+    type: str
+    status: str
+    effective_fee: Optional[int]
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    deleted_at: Optional[datetime.datetime]
+
+
+def _row_to_transaction(row) -> TransactionEntity:
+    """Build an entity from a row selected with _TRANSACTION_COLUMNS, by position"""
+    return TransactionEntity(
+        hash=row[0],
+        asset=row[1],
+        address_from=row[2],
+        address_to=row[3],
+        value=row[4],
+        is_token=row[5],
+        type=row[6],
+        status=row[7],
+        effective_fee=row[8],
+        created_at=row[9],
+        updated_at=row[10],
+        deleted_at=row[11],
+    )
+
+
+def _transaction_args(tx: TransactionEntity) -> tuple:
+    return (
+        tx.hash,
+        tx.asset,
+        tx.address_from,
+        tx.address_to,
+        tx.value,
+        tx.is_token,
+        tx.type,
+        tx.status,
+        tx.effective_fee,
+        tx.created_at,
+        tx.updated_at,
+        tx.deleted_at,
+    )
+
+
+# Transactions are never deleted, so a hash known to be stored stays stored;
+# remembered hashes are bounded LRU-style
+_KNOWN_HASHES_MAX_SIZE = 100_000
+
+# Rows in a terminal status no longer change, so they are served from memory;
+# pending rows always go to the database
+_TERMINAL_STATUSES = frozenset({"confirmed", "failed"})
+_TERMINAL_CACHE_MAX_SIZE = 4096
 
 
 class PostgreSQLTransactionRepository:
     def __init__(self, pool):
         self._pool = pool
+        self._known_hashes: OrderedDict[str, None] = OrderedDict()
+        self._terminal_cache: OrderedDict[str, TransactionEntity] = OrderedDict()
 
     @classmethod
-    async def create(cls, dsn: str):
-        pool = await asyncpg.create_pool(dsn=dsn)
+    async def create(cls, dsn: str, **pool_options):
+        pool = await create_pool(dsn, **pool_options)
         return cls(pool)
 
     async def save_transaction(self, tx: TransactionEntity) -> None:
-        async with self._pool.acquire() as conn:
-            await conn.execute(
-                "INSERT INTO transactions(hash, asset, address_from, address_to, value, is_token, type, status, effective_fee, created_at, updated_at, deleted_at) "
-                "VALUES($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12) "
-                "ON CONFLICT (hash) DO NOTHING",
-                tx.hash,
-                tx.asset,
-                tx.address_from,
-                tx.address_to,
-                tx.value,
-                tx.is_token,
-                tx.type,
-                tx.status,
-                tx.effective_fee,
-                tx.created_at,
-                tx.updated_at,
-                tx.deleted_at,
-            )
+        await self._pool.execute(_INSERT_TRANSACTION, *_transaction_args(tx))
+        self._remember_hash(tx.hash)
+        self._terminal_cache.pop(tx.hash, None)
+
+    async def save_transactions_bulk(self, txs: list[TransactionEntity]) -> None:
+        """
+        Save many transactions with a single INSERT ... SELECT FROM unnest
+
+        The rows are sent as one array per column, so the batch is one
+        statement and one round trip. Existing hashes are skipped like
+        save_transaction.
+        """
+        if not txs:
+            return
+        columns = [list(column) for column in zip(*map(_transaction_args, txs))]
+        await self._pool.execute(_INSERT_TRANSACTIONS_UNNEST, *columns)
+        for tx in txs:
+            self._remember_hash(tx.hash)
+            self._terminal_cache.pop(tx.hash, None)
+
+    def _remember_hash(self, tx_hash: str) -> None:
+        self._known_hashes[tx_hash] = None
+        self._known_hashes.move_to_end(tx_hash)
+        if len(self._known_hashes) > _KNOWN_HASHES_MAX_SIZE:
+            self._known_hashes.popitem(last=False)
+
+    async def has_transaction(self, tx_hash: str) -> bool:
+        """
+        Check whether a transaction is stored
+
+        Hashes saved or found through this repository are remembered, so
+        re-validating a known transaction skips the database round trip.
+        """
+        if tx_hash in self._known_hashes:
+            self._known_hashes.move_to_end(tx_hash)
+            return True
+        found = await self._pool.fetchval(_HAS_TRANSACTION, tx_hash)
+        if found:
+            self._remember_hash(tx_hash)
+        return bool(found)
 
     async def update_transaction_status(self, tx_hash: str, new_status: str) -> bool:
         """
@@ -46,65 +197,115 @@ class PostgreSQLTransactionRepository:
         Returns:
             bool: True if transaction was updated, False if not found
         """
-        async with self._pool.acquire() as conn:
-            result = await conn.execute(
-                "UPDATE transactions SET status = $1, updated_at = $2 WHERE hash = $3",
-                new_status,
-                datetime.datetime.now(),
-                tx_hash,
-            )
-            # result retorna algo como "UPDATE 1" se uma linha foi afetada
-            return result.split()[-1] == "1"
+        self._terminal_cache.pop(tx_hash, None)
+        result = await self._pool.execute(
+            _UPDATE_TRANSACTION_STATUS,
+            new_status,
+            tx_hash,
+        )
+        # result retorna algo como "UPDATE 1" se uma linha foi afetada
+        return int(result.rsplit(" ", 1)[1]) > 0
+
+    async def update_transactions_status(
+        self, tx_hashes: list[str], new_status: str
+    ) -> int:
+        """
+        Set the same status on many transactions with a single UPDATE
+
+        Args:
+            tx_hashes: Transaction hashes
+            new_status: New status (pending, confirmed, failed, etc.)
+
+        Returns:
+            int: Number of transactions updated
+        """
+        if not tx_hashes:
+            return 0
+        for tx_hash in tx_hashes:
+            self._terminal_cache.pop(tx_hash, None)
+        result = await self._pool.execute(
+            _UPDATE_TRANSACTIONS_STATUS,
+            new_status,
+            tx_hashes,
+        )
+        return int(result.rsplit(" ", 1)[1])
 
     async def get_transaction_by_hash(self, hash: str) -> TransactionEntity | None:
-        async with self._pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT hash, asset, address_from, address_to, value, is_token, type, status, effective_fee, created_at, updated_at, deleted_at FROM transactions WHERE hash = $1",
-                hash,
-            )
-            if row:
-                return TransactionEntity(
-                    hash=row["hash"],
-                    asset=row["asset"],
-                    address_from=row["address_from"],
-                    address_to=row["address_to"],
-                    value=row["value"],
-                    is_token=row["is_token"],
-                    type=row["type"],
-                    status=row["status"],
-                    effective_fee=row["effective_fee"],
-                    created_at=row["created_at"],
-                    updated_at=row["updated_at"],
-                    deleted_at=row["deleted_at"],
-                )
+        """
+        Get a transaction by hash
+
+        Transactions in a terminal status are cached, LRU-style, until they
+        are saved or their status is updated through this repository.
+        """
+        cached = self._terminal_cache.get(hash)
+        if cached is not None:
+            self._terminal_cache.move_to_end(hash)
+            return cached
+        row = await self._pool.fetchrow(
+            _SELECT_TRANSACTION_BY_HASH,
+            hash,
+        )
+        if not row:
             return None
+        tx = _row_to_transaction(row)
+        if tx.status in _TERMINAL_STATUSES:
+            self._terminal_cache[hash] = tx
+            if len(self._terminal_cache) > _TERMINAL_CACHE_MAX_SIZE:
+                self._terminal_cache.popitem(last=False)
+        return tx
 
     async def list_transactions(
-        self, limit: int = 100, offset: int = 0
-    ) -> list[TransactionEntity]:
-        async with self._pool.acquire() as conn:
-            rows = await conn.fetch(
-                "SELECT hash, asset, address_from, address_to, value, is_token, type, status, effective_fee, created_at, updated_at, deleted_at FROM transactions ORDER BY created_at DESC LIMIT $1 OFFSET $2",
-                limit,
-                offset,
-            )
-            return [
-                TransactionEntity(
-                    hash=row["hash"],
-                    asset=row["asset"],
-                    address_from=row["address_from"],
-                    address_to=row["address_to"],
-                    value=row["value"],
-                    is_token=row["is_token"],
-                    type=row["type"],
-                    status=row["status"],
-                    effective_fee=row["effective_fee"],
-                    created_at=row["created_at"],
-                    updated_at=row["updated_at"],
-                    deleted_at=row["deleted_at"],
-                )
-                for row in rows
-            ]
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime.datetime, str] | None = None,
+    ) -> list[TransactionRow]:
+        """
+        List transactions, newest first
+
+        Args:
+            limit: Maximum number of transactions to return
+            offset: Rows to skip (deprecated, ignored when after is given)
+            after: Keyset position (created_at, hash) of the last row already seen
+
+        Returns:
+            List of transaction rows
+        """
+        rows = await self._fetch_transactions_page(limit, offset, after)
+        return list(map(TransactionRow._make, rows))
+
+    async def list_transactions_columnar(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime.datetime, str] | None = None,
+    ) -> dict[str, tuple]:
+        """
+        List transactions, newest first, as one tuple per column
+
+        For bulk scans that aggregate over columns: no entity is built per
+        row, the fetched records are transposed in a single pass.
+
+        Args:
+            limit: Maximum number of transactions to return
+            offset: Rows to skip (deprecated, ignored when after is given)
+            after: Keyset position (created_at, hash) of the last row already seen
+
+        Returns:
+            dict mapping each column name to its values, in row order
+        """
+        rows = await self._fetch_transactions_page(limit, offset, after)
+        columns = zip(*rows) if rows else ((),) * len(TransactionRow._fields)
+        return dict(zip(TransactionRow._fields, columns))
+
+    async def _fetch_transactions_page(
+        self, limit: int, offset: int, after: tuple[datetime.datetime, str] | None
+    ) -> list:
+        if after is None:
+            return await self._pool.fetch(_SELECT_TRANSACTIONS_PAGE, limit, offset)
+        return await self._pool.fetch(
+            _SELECT_TRANSACTIONS_AFTER, limit, after[0], after[1]
+        )
 
     async def get_pending_transactions(
         self, max_age_hours: int = 24
@@ -118,34 +319,29 @@ class PostgreSQLTransactionRepository:
         Returns:
             List of pending transactions
         """
-        async with self._pool.acquire() as conn:
-            # Get transactions with pending or confirming status created in the last max_age_hours
-            rows = await conn.fetch(
-                """SELECT hash, asset, address_from, address_to, value, is_token, type, status, 
-                          effective_fee, created_at, updated_at, deleted_at 
-                   FROM transactions 
-                   WHERE status IN ('pending', 'confirming') 
-                   AND created_at > NOW() - INTERVAL '1 hour' * $1
-                   ORDER BY created_at ASC""",
-                max_age_hours,
-            )
-            return [
-                TransactionEntity(
-                    hash=row["hash"],
-                    asset=row["asset"],
-                    address_from=row["address_from"],
-                    address_to=row["address_to"],
-                    value=row["value"],
-                    is_token=row["is_token"],
-                    type=row["type"],
-                    status=row["status"],
-                    effective_fee=row["effective_fee"],
-                    created_at=row["created_at"],
-                    updated_at=row["updated_at"],
-                    deleted_at=row["deleted_at"],
-                )
-                for row in rows
-            ]
+        rows = await self._pool.fetch(
+            _SELECT_PENDING_TRANSACTIONS,
+            max_age_hours,
+        )
+        return list(map(_row_to_transaction, rows))
+
+    async def get_pending_transaction_hashes(
+        self, max_age_hours: int = 24
+    ) -> list[str]:
+        """
+        Get the hashes of pending transactions that need monitoring
+
+        Same selection as get_pending_transactions, reading only the hash
+        column for callers that look the rest up on the node.
+
+        Args:
+            max_age_hours: Maximum age in hours for transactions to check
+
+        Returns:
+            List of transaction hashes, oldest first
+        """
+        rows = await self._pool.fetch(_SELECT_PENDING_TRANSACTION_HASHES, max_age_hours)
+        return [row[0] for row in rows]
 
     async def get_transaction_with_confirmations(
         self, hash: str, web3_repo
@@ -160,18 +356,82 @@ class PostgreSQLTransactionRepository:
         Returns:
             dict com dados da transação e confirmações atuais
         """
-        tx = await self.get_transaction_by_hash(hash)
+        # The database read and the node call are independent, so they run
+        # concurrently; the blocking Web3 call goes to a worker thread
+        tx, confirmations = await asyncio.gather(
+            self.get_transaction_by_hash(hash),
+            asyncio.to_thread(web3_repo.get_transaction_confirmations, hash),
+            return_exceptions=True,
+        )
+        if isinstance(tx, BaseException):
+            raise tx
         if not tx:
             return None
 
-        # Get current confirmations if transaction is not yet confirmed
-        confirmations = 0
+        if isinstance(confirmations, Exception):
+            # If unable to get confirmations, use default values
+            confirmations = 0
+
+        return self._with_confirmations(tx, confirmations)
+
+    async def get_transactions_by_hashes(
+        self, hashes: list[str]
+    ) -> list[TransactionEntity]:
+        """
+        Get all transactions whose hash is in hashes with a single query
+
+        Args:
+            hashes: Transaction hashes
+
+        Returns:
+            List of found transactions, unknown hashes are skipped
+        """
+        rows = await self._pool.fetch(
+            _SELECT_TRANSACTIONS_BY_HASHES,
+            hashes,
+        )
+        return list(map(_row_to_transaction, rows))
+
+    async def get_many_with_confirmations(
+        self, hashes: list[str], web3_repo
+    ) -> list[dict]:
+        """
+        Batch version of get_transaction_with_confirmations
+
+        Uses one SELECT and one JSON-RPC batch for all hashes; the batch
+        runs in a worker thread.
+
+        Args:
+            hashes: Transaction hashes
+            web3_repo: Web3 repository used to fetch confirmations
+
+        Returns:
+            list of transaction dicts in request order, unknown hashes are skipped
+        """
+        transactions = {
+            tx.hash: tx for tx in await self.get_transactions_by_hashes(hashes)
+        }
+        if not transactions:
+            return []
+
+        found = [h for h in dict.fromkeys(hashes) if h in transactions]
         try:
-            confirmations = web3_repo.get_transaction_confirmations(hash)
+            # The node client is synchronous; keep the batch (and its
+            # per-hash fallback) off the event loop
+            confirmations = await asyncio.to_thread(
+                web3_repo.get_transactions_confirmations, found
+            )
         except Exception:
             # If unable to get confirmations, use default values
-            pass
+            confirmations = {}
+
+        return [
+            self._with_confirmations(transactions[h], confirmations.get(h, 0))
+            for h in found
+        ]
 
+    @staticmethod
+    def _with_confirmations(tx: TransactionEntity, confirmations: int) -> dict:
         return {
             "hash": tx.hash,
             "asset": tx.asset,
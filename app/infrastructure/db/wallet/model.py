@@ -1,10 +1,20 @@
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, Index, String, text
 
 from app.infrastructure.db.base import Base
 
 
 class Wallet(Base):
     __tablename__ = "wallets"
+    __table_args__ = (
+        # Serves the LOWER(address) comparisons in the wallet repository
+        Index("ix_wallets_address_lower", text("lower(address)")),
+        # Serves the active wallet listing as an index-only scan
+        Index(
+            "ix_wallets_active_address",
+            "address",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
     address = Column(String, primary_key=True)
     created_at = Column(DateTime, nullable=False)
     updated_at = Column(DateTime, nullable=False)
@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+from app.domain.wallet.repository import WalletRepository
+
+
+class WalletOwnershipCache:
+    """
+    Process-local snapshot of our wallet addresses, refreshed after a short TTL.
+
+    The wallet set changes rarely, so ownership hits become a set lookup
+    instead of a database round-trip per validation. A miss is not proof a
+    wallet is foreign: wallets created by another process only appear after
+    the next reload, so callers confirm misses against the database. Wallets
+    created by this process call invalidate().
+    """
+
+    def __init__(self, wallet_repo: WalletRepository, ttl: float = 60.0):
+        self._wallet_repo = wallet_repo
+        self._ttl = ttl
+        self._lock = asyncio.Lock()
+        self._addresses: frozenset[str] = frozenset()
+        self._expires_at = 0.0
+
+    async def get(self) -> frozenset[str]:
+        """Return the lowercase addresses of all our active wallets"""
+        if time.monotonic() < self._expires_at:
+            return self._addresses
+
+        async with self._lock:
+            # Another task may have refreshed while we waited for the lock
+            if time.monotonic() >= self._expires_at:
+                addresses = await self._wallet_repo.list_active_addresses()
+                self._addresses = frozenset(addresses)
+                self._expires_at = time.monotonic() + self._ttl
+            return self._addresses
+
+    def invalidate(self) -> None:
+        """Force the next get() to reload the wallet set"""
+        self._expires_at = 0.0
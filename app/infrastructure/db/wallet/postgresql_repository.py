@@ -1,95 +1,240 @@
+import asyncio
+import threading
 import time
-from typing import Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Tuple
 
-import asyncpg
 import hvac
 from eth_account import Account
-from eth_account.messages import encode_defunct
 
 from app.application.v1.wallet.usecase import VaultService, WalletService
 from app.domain.wallet.repository import Wallet, WalletRepository
+from app.infrastructure.db.pool import create_pool
 
 # Monitoring imports
-from app.shared.monitoring.logging import (
-    LoggerMixin,
-    get_logger,
-    log_database_operation,
-    log_vault_operation,
-)
+from app.shared.monitoring.logging import LoggerMixin
 from app.shared.monitoring.metrics import (
     MetricsContext,
     record_database_operation,
     record_vault_operation,
-    record_wallet_created,
     record_wallet_operation,
 )
 
+# Private keys read from Vault are kept in memory for a short time so that
+# repeated sends from the same wallet skip the Vault round-trip. Cached keys
+# are held as bytearrays and zeroed when evicted; expired entries are purged
+# on every cache access, not only when the same key is read again
+_KEY_CACHE_TTL = 300.0
+_KEY_CACHE_MAX_SIZE = 1024
+
+# Concurrent Vault writes per bulk store; hvac's session reuses connections
+_VAULT_BULK_WORKERS = 8
+
+_INSERT_WALLET = (
+    "INSERT INTO wallets(address, created_at, updated_at, deleted_at) "
+    "VALUES($1, $2, $3, $4) ON CONFLICT (address) DO NOTHING"
+)
+
+# Query texts are module constants so every call sends the identical string,
+# which asyncpg's per-connection statement cache prepares only once.
+# Addresses are stored EIP-55 checksummed, as Vault key ids use them, so
+# lookups compare LOWER(address), served by ix_wallets_address_lower, with a
+# parameter already lowercased in Python
+_SELECT_WALLET_BY_ADDRESS = (
+    "SELECT address, created_at, updated_at, deleted_at FROM wallets "
+    "WHERE LOWER(address) = $1"
+)
+_SELECT_OWNED_ADDRESSES = (
+    "SELECT LOWER(address) AS address FROM wallets "
+    "WHERE LOWER(address) = ANY($1) AND deleted_at IS NULL"
+)
+_SELECT_WALLETS = "SELECT address, created_at, updated_at, deleted_at FROM wallets"
+_SELECT_ACTIVE_ADDRESSES = "SELECT LOWER(address) FROM wallets WHERE deleted_at IS NULL"
+
+# Same insert for a whole batch: one array parameter per column, expanded
+# server-side by unnest into one row per wallet
+_INSERT_WALLETS_UNNEST = (
+    "INSERT INTO wallets(address, created_at, updated_at, deleted_at) "
+    "SELECT * FROM unnest($1::text[], $2::timestamp[], $3::timestamp[], $4::timestamp[]) "
+    "ON CONFLICT (address) DO NOTHING"
+)
+
+
+# Bulk imports COPY into a transaction-scoped staging table first: COPY has no
+# ON CONFLICT, so existing addresses are skipped by the INSERT ... SELECT
+_WALLET_COLUMNS = ("address", "created_at", "updated_at", "deleted_at")
+_CREATE_WALLETS_STAGING = (
+    "CREATE TEMP TABLE wallets_staging "
+    "(LIKE wallets INCLUDING DEFAULTS) ON COMMIT DROP"
+)
+_INSERT_WALLETS_FROM_STAGING = (
+    "INSERT INTO wallets(address, created_at, updated_at, deleted_at) "
+    "SELECT address, created_at, updated_at, deleted_at FROM wallets_staging "
+    "ON CONFLICT (address) DO NOTHING"
+)
+
+
+def _zero(buffer: bytearray) -> None:
+    """Overwrite a cached key in place before it is dropped"""
+    buffer[:] = bytes(len(buffer))
+
 
 class HashiCorpVaultService(VaultService, LoggerMixin):
-    def __init__(self, url: str, token: str, secret_path: str = "eth_wallets"):
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        secret_path: str = "eth_wallets",
+        key_cache_ttl: float = _KEY_CACHE_TTL,
+    ):
         self.client = hvac.Client(url=url, token=token)
         self.secret_path = secret_path
-
-        # Test Vault connection
-        if self.client.is_authenticated():
-            self.logger.info(f"Vault client authenticated successfully - URL: {url}")
-        else:
-            self.logger.error(f"Vault authentication failed - URL: {url}")
+        self.key_cache_ttl = key_cache_ttl
+        # get_private_key runs in worker threads and store_private_keys_bulk
+        # invalidates from its own pool, so the cache is guarded by a lock
+        self._key_cache: OrderedDict[str, Tuple[float, bytearray]] = OrderedDict()
+        self._key_cache_lock = threading.Lock()
+
+        # Authentication is checked by healthcheck(), not here, so startup
+        # does not wait on a Vault round trip
+        self.logger.info("Vault client configured (not yet verified) - URL: %s", url)
+
+    async def healthcheck(self) -> bool:
+        """Check that Vault is reachable and the token is valid"""
+        try:
+            return await asyncio.to_thread(self.client.is_authenticated)
+        except Exception as e:
+            self.logger.error("Vault health check failed - Error: %s", e)
+            return False
+
+    def invalidate_private_key(self, key_id: str) -> None:
+        """Drop a cached private key, e.g. after it was rotated in Vault"""
+        with self._key_cache_lock:
+            self._evict_key(key_id)
+
+    def _evict_key(self, key_id: str) -> None:
+        # Caller holds _key_cache_lock
+        entry = self._key_cache.pop(key_id, None)
+        if entry is not None:
+            _zero(entry[1])
+
+    def _purge_expired_keys(self) -> None:
+        # Caller holds _key_cache_lock. Every entry gets the same TTL and
+        # re-inserts go to the end, so expiry follows insertion order
+        now = time.monotonic()
+        while self._key_cache:
+            key_id, (expires_at, _) = next(iter(self._key_cache.items()))
+            if expires_at > now:
+                break
+            self._evict_key(key_id)
+
+    def _cache_key(self, key_id: str, private_key: str) -> None:
+        with self._key_cache_lock:
+            self._purge_expired_keys()
+            self._evict_key(key_id)
+            while len(self._key_cache) >= _KEY_CACHE_MAX_SIZE:
+                self._evict_key(next(iter(self._key_cache)))
+            self._key_cache[key_id] = (
+                time.monotonic() + self.key_cache_ttl,
+                bytearray(private_key.encode()),
+            )
 
     def store_private_key(self, key_id: str, private_key: str) -> None:
-        start_time = time.time()
+        self.invalidate_private_key(key_id)
 
-        self.logger.info(f"Storing private key in Vault - Key ID: {key_id}")
+        self.logger.debug("Storing private key in Vault - Key ID: %s", key_id)
 
         try:
-            with MetricsContext("store_private_key", "vault"):
+            with MetricsContext("store_private_key", "vault") as metrics:
                 secret_data = {"private_key": private_key}
                 self.client.secrets.kv.v2.create_or_update_secret(
                     path=f"{self.secret_path}/{key_id}", secret=secret_data
                 )
 
-            duration = time.time() - start_time
+            duration = metrics.duration
             self.logger.info(
-                f"Private key stored successfully - Key ID: {key_id}, Duration: {duration:.3f}s"
+                "Private key stored successfully - Key ID: %s, Duration: %.3fs",
+                key_id,
+                duration,
             )
             record_vault_operation("store_private_key", "success", duration)
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = metrics.duration
             self.logger.error(
-                f"Failed to store private key - Key ID: {key_id}, Error: {str(e)}, Duration: {duration:.3f}s"
+                "Failed to store private key - Key ID: %s, Error: %s, Duration: %.3fs",
+                key_id,
+                e,
+                duration,
             )
             record_vault_operation("store_private_key", "error", duration)
             raise
 
+    def store_private_keys_bulk(self, private_keys: Dict[str, str]) -> None:
+        """
+        Store many private keys, writing to Vault concurrently
+
+        KV v2 has no multi-secret write, so the per-key writes are overlapped
+        on a small thread pool instead of running one round trip at a time.
+        Raises the first error after all writes have finished.
+        """
+        if not private_keys:
+            return
+
+        self.logger.debug(
+            "Storing private keys in Vault - Count: %s", len(private_keys)
+        )
+
+        workers = min(_VAULT_BULK_WORKERS, len(private_keys))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.store_private_key, key_id, private_key)
+                for key_id, private_key in private_keys.items()
+            ]
+        for future in futures:
+            future.result()
+
     def get_private_key(self, key_id: str) -> str:
-        start_time = time.time()
+        with self._key_cache_lock:
+            self._purge_expired_keys()
+            cached = self._key_cache.get(key_id)
+            if cached is not None:
+                # The signer takes a str, so callers get a short-lived copy
+                return cached[1].decode()
 
-        self.logger.info(f"Retrieving private key from Vault - Key ID: {key_id}")
+        self.logger.debug("Retrieving private key from Vault - Key ID: %s", key_id)
 
         try:
-            with MetricsContext("get_private_key", "vault"):
+            with MetricsContext("get_private_key", "vault") as metrics:
                 response = self.client.secrets.kv.v2.read_secret_version(
                     path=f"{self.secret_path}/{key_id}"
                 )
                 private_key = response["data"]["data"]["private_key"]
 
-            duration = time.time() - start_time
+            duration = metrics.duration
             self.logger.info(
-                f"Private key retrieved successfully - Key ID: {key_id}, Duration: {duration:.3f}s"
+                "Private key retrieved successfully - Key ID: %s, Duration: %.3fs",
+                key_id,
+                duration,
             )
             record_vault_operation("get_private_key", "success", duration)
 
+            self._cache_key(key_id, private_key)
+
             return private_key
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = metrics.duration
             error_message = str(e)
 
             # Check if it's a path not found error (key doesn't exist)
             if "InvalidPath" in error_message or "404" in error_message:
                 self.logger.error(
-                    f"Private key not found in Vault - Key ID: {key_id}. The wallet may need to be recreated. Error: {error_message}, Duration: {duration:.3f}s"
+                    "Private key not found in Vault - Key ID: %s. The wallet may need to be recreated. Error: %s, Duration: %.3fs",
+                    key_id,
+                    error_message,
+                    duration,
                 )
                 record_vault_operation("get_private_key", "not_found", duration)
                 raise ValueError(
@@ -97,7 +242,10 @@ class HashiCorpVaultService(VaultService, LoggerMixin):
                 )
             else:
                 self.logger.error(
-                    f"Failed to retrieve private key - Key ID: {key_id}, Error: {error_message}, Duration: {duration:.3f}s"
+                    "Failed to retrieve private key - Key ID: %s, Error: %s, Duration: %.3fs",
+                    key_id,
+                    error_message,
+                    duration,
                 )
                 record_vault_operation("get_private_key", "error", duration)
                 raise
@@ -106,18 +254,19 @@ class HashiCorpVaultService(VaultService, LoggerMixin):
 class EthereumWalletService(WalletService, LoggerMixin):
     def create_wallet(self) -> Dict[str, str]:
         """Generate a new Ethereum wallet and return address and private key."""
-        start_time = time.time()
 
-        self.logger.info("Creating new Ethereum wallet")
+        self.logger.debug("Creating new Ethereum wallet")
 
         try:
-            with MetricsContext("create_wallet", "wallet"):
+            with MetricsContext("create_wallet", "wallet") as metrics:
                 acct = Account.create()
                 wallet_data = {"address": acct.address, "private_key": acct.key.hex()}
 
-            duration = time.time() - start_time
+            duration = metrics.duration
             self.logger.info(
-                f"Ethereum wallet created successfully - Address: {wallet_data['address']}, Duration: {duration:.3f}s"
+                "Ethereum wallet created successfully - Address: %s, Duration: %.3fs",
+                wallet_data["address"],
+                duration,
             )
             # Note: record_wallet_created() moved to usecase to handle batch count
             record_wallet_operation("create_wallet", "success")
@@ -125,32 +274,35 @@ class EthereumWalletService(WalletService, LoggerMixin):
             return wallet_data
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = metrics.duration
             self.logger.error(
-                f"Failed to create Ethereum wallet - Error: {str(e)}, Duration: {duration:.3f}s"
+                "Failed to create Ethereum wallet - Error: %s, Duration: %.3fs",
+                e,
+                duration,
             )
             record_wallet_operation("create_wallet", "error")
             raise
 
     def sign_transaction(self, private_key: str, transaction: dict) -> str:
         """Sign a transaction dict using the provided private key."""
-        start_time = time.time()
         try:
-            with MetricsContext("sign_transaction", "wallet"):
+            with MetricsContext("sign_transaction", "wallet") as metrics:
                 acct = Account.from_key(private_key)
                 signed = acct.sign_transaction(transaction)
                 raw_tx = signed.raw_transaction
                 signed_tx = raw_tx.hex()
-            duration = time.time() - start_time
+            duration = metrics.duration
             self.logger.info(
-                f"Transaction signed successfully - Signer: {acct.address}, Duration: {duration:.3f}s"
+                "Transaction signed successfully - Signer: %s, Duration: %.3fs",
+                acct.address,
+                duration,
             )
             record_wallet_operation("sign_transaction", "success")
             return signed_tx
         except Exception as e:
-            duration = time.time() - start_time
+            duration = metrics.duration
             self.logger.error(
-                f"Failed to sign transaction - Error: {str(e)}, Duration: {duration:.3f}s"
+                "Failed to sign transaction - Error: %s, Duration: %.3fs", e, duration
             )
             record_wallet_operation("sign_transaction", "error")
             raise
@@ -161,66 +313,174 @@ class PostgreSQLWalletRepository(WalletRepository, LoggerMixin):
         self._pool = pool
 
     @classmethod
-    async def create(cls, dsn: str):
-        pool = await asyncpg.create_pool(dsn=dsn)
+    async def create(cls, dsn: str, **pool_options):
+        pool = await create_pool(dsn, **pool_options)
         return cls(pool)
 
-    async def save_wallet(self, wallet: Wallet) -> None:
-        start_time = time.time()
+    def acquire(self):
+        """
+        Acquire a pooled connection, for work that must hold one connection
+        throughout (e.g. a cursor streamed into a response body)
+        """
+        return self._pool.acquire()
 
-        self.logger.info(f"Saving wallet to database - Address: {wallet.address}")
+    async def save_wallet(self, wallet: Wallet) -> None:
+        self.logger.debug("Saving wallet to database - Address: %s", wallet.address)
 
         try:
-            with MetricsContext("save_wallet", "database"):
-                async with self._pool.acquire() as conn:
-                    await conn.execute(
-                        "INSERT INTO wallets(address, created_at, updated_at, deleted_at) VALUES($1, $2, $3, $4) ON CONFLICT (address) DO NOTHING",
-                        wallet.address,
-                        wallet.created_at,
-                        wallet.updated_at,
-                        wallet.deleted_at,
-                    )
+            with MetricsContext("save_wallet", "database") as metrics:
+                await self._pool.execute(
+                    _INSERT_WALLET,
+                    wallet.address,
+                    wallet.created_at,
+                    wallet.updated_at,
+                    wallet.deleted_at,
+                )
 
-            duration = time.time() - start_time
+            duration = metrics.duration
             self.logger.info(
-                f"Wallet saved successfully - Address: {wallet.address}, Duration: {duration:.3f}s"
+                "Wallet saved successfully - Address: %s, Duration: %.3fs",
+                wallet.address,
+                duration,
             )
             record_database_operation("save_wallet", "wallets", "success", duration)
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = metrics.duration
             self.logger.error(
-                f"Failed to save wallet - Address: {wallet.address}, Error: {str(e)}, Duration: {duration:.3f}s"
+                "Failed to save wallet - Address: %s, Error: %s, Duration: %.3fs",
+                wallet.address,
+                e,
+                duration,
             )
             record_database_operation("save_wallet", "wallets", "error", duration)
             raise
 
-    async def get_wallet_by_address(self, address: str) -> Wallet | None:
-        start_time = time.time()
+    async def save_wallets_bulk(self, wallets: list[Wallet]) -> None:
+        """
+        Save many wallets with a single INSERT ... SELECT FROM unnest
+
+        The rows are sent as one array per column, so the batch is one
+        statement, one round trip and one commit. Existing addresses are
+        skipped like save_wallet.
+        """
+        if not wallets:
+            return
 
-        self.logger.info(f"Fetching wallet by address - Address: {address}")
+        self.logger.debug("Saving wallets to database - Count: %s", len(wallets))
 
         try:
-            with MetricsContext("get_wallet_by_address", "database"):
-                async with self._pool.acquire() as conn:
-                    row = await conn.fetchrow(
-                        "SELECT address, created_at, updated_at, deleted_at FROM wallets WHERE LOWER(address) = LOWER($1)",
-                        address,
-                    )
+            with MetricsContext("save_wallets_bulk", "database") as metrics:
+                await self._pool.execute(
+                    _INSERT_WALLETS_UNNEST,
+                    [wallet.address for wallet in wallets],
+                    [wallet.created_at for wallet in wallets],
+                    [wallet.updated_at for wallet in wallets],
+                    [wallet.deleted_at for wallet in wallets],
+                )
 
-                    wallet = None
-                    if row:
-                        wallet = Wallet(
-                            address=row["address"],
-                            created_at=row["created_at"],
-                            updated_at=row["updated_at"],
-                            deleted_at=row["deleted_at"],
+            duration = metrics.duration
+            self.logger.info(
+                "Wallets saved successfully - Count: %s, Duration: %.3fs",
+                len(wallets),
+                duration,
+            )
+            record_database_operation(
+                "save_wallets_bulk", "wallets", "success", duration
+            )
+
+        except Exception as e:
+            duration = metrics.duration
+            self.logger.error(
+                "Failed to save wallets - Count: %s, Error: %s, Duration: %.3fs",
+                len(wallets),
+                e,
+                duration,
+            )
+            record_database_operation("save_wallets_bulk", "wallets", "error", duration)
+            raise
+
+    async def bulk_load_wallets(self, wallets: Iterable[Wallet]) -> None:
+        """
+        Import a large number of wallets through the binary COPY protocol
+
+        Meant for onboarding and migrations, where batches are too large for
+        save_wallets_bulk's array parameters. Rows are streamed with COPY into
+        a staging table and moved into wallets in the same transaction;
+        existing addresses are skipped like save_wallet.
+        """
+        wallets = list(wallets)
+        if not wallets:
+            return
+
+        self.logger.debug("Bulk loading wallets - Count: %s", len(wallets))
+
+        try:
+            with MetricsContext("bulk_load_wallets", "database") as metrics:
+                async with self._pool.acquire() as conn:
+                    async with conn.transaction():
+                        await conn.execute(_CREATE_WALLETS_STAGING)
+                        await conn.copy_records_to_table(
+                            "wallets_staging",
+                            records=[
+                                (
+                                    wallet.address,
+                                    wallet.created_at,
+                                    wallet.updated_at,
+                                    wallet.deleted_at,
+                                )
+                                for wallet in wallets
+                            ],
+                            columns=_WALLET_COLUMNS,
                         )
+                        await conn.execute(_INSERT_WALLETS_FROM_STAGING)
+
+            duration = metrics.duration
+            self.logger.info(
+                "Wallets bulk loaded successfully - Count: %s, Duration: %.3fs",
+                len(wallets),
+                duration,
+            )
+            record_database_operation(
+                "bulk_load_wallets", "wallets", "success", duration
+            )
 
-            duration = time.time() - start_time
+        except Exception as e:
+            duration = metrics.duration
+            self.logger.error(
+                "Failed to bulk load wallets - Count: %s, Error: %s, Duration: %.3fs",
+                len(wallets),
+                e,
+                duration,
+            )
+            record_database_operation("bulk_load_wallets", "wallets", "error", duration)
+            raise
+
+    async def get_wallet_by_address(self, address: str) -> Wallet | None:
+        self.logger.debug("Fetching wallet by address - Address: %s", address)
+
+        try:
+            with MetricsContext("get_wallet_by_address", "database") as metrics:
+                row = await self._pool.fetchrow(
+                    _SELECT_WALLET_BY_ADDRESS, address.lower()
+                )
+
+                wallet = None
+                if row:
+                    wallet = Wallet(
+                        address=row["address"],
+                        created_at=row["created_at"],
+                        updated_at=row["updated_at"],
+                        deleted_at=row["deleted_at"],
+                    )
+
+            duration = metrics.duration
             found = wallet is not None
             self.logger.info(
-                f"Wallet fetch completed - Address: {address}, Found: {found}, Duration: {duration:.3f}s"
+                "Wallet fetch completed - Address: %s, Found: %s, Duration: %.3fs",
+                address,
+                found,
+                duration,
             )
             record_database_operation(
                 "get_wallet_by_address", "wallets", "success", duration
@@ -229,49 +489,137 @@ class PostgreSQLWalletRepository(WalletRepository, LoggerMixin):
             return wallet
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = metrics.duration
             self.logger.error(
-                f"Failed to fetch wallet - Address: {address}, Error: {str(e)}, Duration: {duration:.3f}s"
+                "Failed to fetch wallet - Address: %s, Error: %s, Duration: %.3fs",
+                address,
+                e,
+                duration,
             )
             record_database_operation(
                 "get_wallet_by_address", "wallets", "error", duration
             )
             raise
 
+    async def get_wallets_by_addresses(self, addresses: list[str]) -> set[str]:
+        """
+        Return which of the given addresses belong to our active wallets, in
+        one query
+
+        Args:
+            addresses: Lowercase addresses to look up
+
+        Returns:
+            set of the lowercase addresses that are our wallets
+        """
+
+        self.logger.debug("Fetching wallets by addresses - Count: %s", len(addresses))
+
+        try:
+            with MetricsContext("get_wallets_by_addresses", "database") as metrics:
+                rows = await self._pool.fetch(
+                    _SELECT_OWNED_ADDRESSES,
+                    addresses,
+                )
+                owned = {row["address"] for row in rows}
+
+            duration = metrics.duration
+            self.logger.info(
+                "Wallets fetch completed - Count: %s, Found: %s, Duration: %.3fs",
+                len(addresses),
+                len(owned),
+                duration,
+            )
+            record_database_operation(
+                "get_wallets_by_addresses", "wallets", "success", duration
+            )
+
+            return owned
+
+        except Exception as e:
+            duration = metrics.duration
+            self.logger.error(
+                "Failed to fetch wallets - Count: %s, Error: %s, Duration: %.3fs",
+                len(addresses),
+                e,
+                duration,
+            )
+            record_database_operation(
+                "get_wallets_by_addresses", "wallets", "error", duration
+            )
+            raise
+
+    async def list_active_addresses(self) -> set[str]:
+        """
+        Return the lowercase addresses of all wallets that are not soft-deleted
+
+        Only the address column is read, and no Wallet is built per row; this
+        backs the ownership cache's periodic reload.
+        """
+
+        self.logger.debug("Listing active wallet addresses")
+
+        try:
+            with MetricsContext("list_active_addresses", "database") as metrics:
+                rows = await self._pool.fetch(_SELECT_ACTIVE_ADDRESSES)
+                addresses = {row[0] for row in rows}
+
+            duration = metrics.duration
+            self.logger.debug(
+                "Active wallet addresses listed - Count: %s, Duration: %.3fs",
+                len(addresses),
+                duration,
+            )
+            record_database_operation(
+                "list_active_addresses", "wallets", "success", duration
+            )
+
+            return addresses
+
+        except Exception as e:
+            duration = metrics.duration
+            self.logger.error(
+                "Failed to list active wallet addresses - Error: %s, Duration: %.3fs",
+                e,
+                duration,
+            )
+            record_database_operation(
+                "list_active_addresses", "wallets", "error", duration
+            )
+            raise
+
     async def list_wallets(self) -> list[Wallet]:
-        start_time = time.time()
 
-        self.logger.info("Listing all wallets")
+        self.logger.debug("Listing all wallets")
 
         try:
-            with MetricsContext("list_wallets", "database"):
-                async with self._pool.acquire() as conn:
-                    rows = await conn.fetch(
-                        "SELECT address, created_at, updated_at, deleted_at FROM wallets"
+            with MetricsContext("list_wallets", "database") as metrics:
+                rows = await self._pool.fetch(_SELECT_WALLETS)
+                wallets = [
+                    Wallet(
+                        address=row["address"],
+                        created_at=row["created_at"],
+                        updated_at=row["updated_at"],
+                        deleted_at=row["deleted_at"],
                     )
-                    wallets = [
-                        Wallet(
-                            address=row["address"],
-                            created_at=row["created_at"],
-                            updated_at=row["updated_at"],
-                            deleted_at=row["deleted_at"],
-                        )
-                        for row in rows
-                    ]
+                    for row in rows
+                ]
 
-            duration = time.time() - start_time
+            duration = metrics.duration
             count = len(wallets)
             self.logger.info(
-                f"Wallets listed successfully - Count: {count}, Duration: {duration:.3f}s"
+                "Wallets listed successfully - Count: %s, Duration: %.3fs",
+                count,
+                duration,
             )
             record_database_operation("list_wallets", "wallets", "success", duration)
 
             return wallets
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = metrics.duration
             self.logger.error(
-                f"Failed to list wallets - Error: {str(e)}, Duration: {duration:.3f}s"
+                "Failed to list wallets - Error: %s, Duration: %.3fs", e, duration
             )
             record_database_operation("list_wallets", "wallets", "error", duration)
             raise
@@ -1,19 +1,146 @@
-import json
+import atexit
+import copy
 import logging
 import os
+import queue
 import sys
-from datetime import datetime
-from typing import Any, Dict
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 
+import pydantic_core
 
-def setup_logging(log_level: str = "INFO") -> None:
+# Background listener that owns the real handlers; see setup_logging
+_listener: Optional[QueueListener] = None
+
+# Log files are flushed once this much is buffered or this long after the
+# previous flush, instead of after every record
+_FILE_BUFFER_SIZE = 64 * 1024
+_FLUSH_INTERVAL = 0.2
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that coalesces records into one write per buffer or interval
+    """
+
+    def __init__(self, filename: str, mode: str = "a") -> None:
+        self._last_flush = time.monotonic()
+        super().__init__(filename, mode=mode)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Same as FileHandler.emit minus the unconditional per-record flush;
+        # the buffer writes itself out when full
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if time.monotonic() - self._last_flush >= _FLUSH_INTERVAL:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+
+# Attributes every LogRecord has; anything else was passed through extra=
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats each record as one JSON object per line
+
+    Fields passed with extra= (e.g. the log_* context dicts) are added at the
+    top level. Encoding uses pydantic-core's compiled serializer, which
+    handles datetimes and Decimals natively; other values fall back to str().
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "func": record.funcName,
+            "line": record.lineno,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return pydantic_core.to_json(entry, fallback=str).decode()
+
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class _ExcTextQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps the traceback apart from the message
+
+    The stock prepare() folds the formatted traceback into msg and drops
+    exc_info, so the listener's formatters could no longer place it (e.g.
+    the JSON "exc_info" field). Here msg only gets its args merged and the
+    traceback is rendered once into exc_text, which every Formatter uses
+    as-is; the traceback objects themselves are not kept on the queue.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _FlushingQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers whenever the queue goes idle
+    """
+
+    def dequeue(self, block: bool):
+        while True:
+            try:
+                return self.queue.get(block, timeout=_FLUSH_INTERVAL)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+
+def setup_logging(log_level: str = "INFO", log_format: str = "text") -> None:
     """
     Configure simple, reliable logging system
+
+    log_format "json" writes one JSON object per line for log aggregators;
+    anything else keeps the plain text format.
     """
     # Create logs directory
     os.makedirs("logs", exist_ok=True)
 
     # Clear existing handlers to avoid conflicts with uvicorn
+    stop_logging()
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
 
@@ -21,32 +148,58 @@ def setup_logging(log_level: str = "INFO") -> None:
     root_logger.setLevel(getattr(logging, log_level.upper()))
 
     # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)s | %(name)s:%(funcName)s:%(lineno)d | %(message)s"
-    )
+    if log_format.lower() == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s | %(levelname)s | %(name)s:%(funcName)s:%(lineno)d | %(message)s"
+        )
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, log_level.upper()))
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
 
     # File handler for all logs
-    file_handler = logging.FileHandler("logs/app.log", mode="a")
+    file_handler = BufferedFileHandler("logs/app.log", mode="a")
     file_handler.setLevel(getattr(logging, log_level.upper()))
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
 
     # Error file handler
-    error_handler = logging.FileHandler("logs/error.log", mode="a")
+    error_handler = BufferedFileHandler("logs/error.log", mode="a")
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(formatter)
-    root_logger.addHandler(error_handler)
 
-    # Force immediate write
-    for handler in root_logger.handlers:
-        if hasattr(handler, "flush"):
-            handler.flush()
+    # Loggers only enqueue records; the stdout and file writes happen on the
+    # listener thread, off the event loop
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(_ExcTextQueueHandler(log_queue))
+
+    global _listener
+    _listener = _FlushingQueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        error_handler,
+        respect_handler_level=True,
+    )
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """
+    Flush queued records and close the handlers started by setup_logging
+    """
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(stop_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -59,13 +212,16 @@ def get_logger(name: str) -> logging.Logger:
 class LoggerMixin:
     """
     Mixin to add structured logging to classes
+
+    Each subclass gets its logger, named after the class, once at class
+    creation, so self.logger is a plain class attribute lookup.
     """
 
-    @property
-    def logger(self):
-        if not hasattr(self, "_logger"):
-            self._logger = get_logger(self.__class__.__name__)
-        return self._logger
+    logger: logging.Logger
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.logger = get_logger(cls.__name__)
 
 
 def log_function_call(func_name: str, **kwargs) -> Dict[str, Any]:
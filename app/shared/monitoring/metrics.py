@@ -1,6 +1,10 @@
 import asyncio
-import time
+import atexit
+import random
+import threading
+from bisect import bisect_left
 from functools import wraps
+from time import perf_counter
 from typing import Any, Callable, Dict, Optional
 
 from prometheus_client import Counter, Gauge, Histogram, Info
@@ -113,84 +117,184 @@ errors_total = Counter(
     "errors_total", "Total number of errors", ["error_type", "component"]
 )
 
+# Label-bound children, keyed by metric and label items. labels() validates
+# the values and takes the metric's lock on every call; the children are
+# kept by prometheus_client anyway, so caching them adds no cardinality
+_children: Dict[tuple, Any] = {}
+
+
+def _child(metric, **labels):
+    key = (metric, *labels.items())
+    child = _children.get(key)
+    if child is None:
+        child = _children[key] = metric.labels(**labels)
+    return child
+
+
 # Decorators for automatic metrics collection
 
 
-def track_time(metric: Histogram, labels: Optional[Dict[str, Any]] = None):
-    """Decorator to track execution time"""
+class _BatchedObserver:
+    """
+    Buffer histogram observations per thread and apply them every `batch` calls
+
+    A flush adds the buffered total to the sum and each bucket's count once,
+    instead of one sum and one bucket increment (each under its own lock)
+    per observation; counts and sums stay exact. Buffers still held at
+    exit are flushed from an atexit hook.
+    """
+
+    def __init__(self, bound, batch: int) -> None:
+        self._bound = bound
+        self._batch = batch
+        self._local = threading.local()
+        self._buffers: list[list[float]] = []
+        atexit.register(self.flush_all)
+
+    def observe(self, amount: float) -> None:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = []
+            self._buffers.append(buffer)
+        buffer.append(amount)
+        if len(buffer) >= self._batch:
+            self._flush(buffer)
+
+    def flush_all(self) -> None:
+        for buffer in self._buffers:
+            self._flush(buffer)
+
+    def _flush(self, buffer: list[float]) -> None:
+        amounts = buffer[:]
+        del buffer[: len(amounts)]
+        if not amounts:
+            return
+        bound = self._bound
+        if not isinstance(bound, Histogram):
+            for amount in amounts:
+                bound.observe(amount)
+            return
+        # Same bucket choice as Histogram.observe: the first bound >= amount
+        upper_bounds = bound._upper_bounds
+        counts = [0] * len(upper_bounds)
+        for amount in amounts:
+            counts[bisect_left(upper_bounds, amount)] += 1
+        bound._sum.inc(sum(amounts))
+        for bucket, count in zip(bound._buckets, counts):
+            if count:
+                bucket.inc(count)
+
+
+def track_time(
+    metric: Histogram,
+    labels: Optional[Dict[str, Any]] = None,
+    sample_rate: float = 1.0,
+    batch: int = 1,
+):
+    """
+    Decorator to track execution time
+
+    sample_rate < 1.0 times only that fraction of calls; batch > 1 buffers
+    observations and applies them every `batch` calls per thread. Both are
+    opt-in for hot paths and leave the default behaviour unchanged.
+    """
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs) -> Any:
-            start_time = time.time()
-            try:
-                result = await func(*args, **kwargs)
-                return result
-            finally:
-                duration = time.time() - start_time
-                if labels:
-                    metric.labels(**labels).observe(duration)
-                else:
-                    metric.observe(duration)
+        # The labels are fixed per decorated function, so bind them once
+        bound = metric.labels(**labels) if labels else metric
+        observer = _BatchedObserver(bound, batch) if batch > 1 else bound
+
+        # Wrappers are specialized at decoration time, so the default
+        # (unsampled) path does no per-call sampling check
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                start_time = perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    observer.observe(perf_counter() - start_time)
+
+            if sample_rate >= 1.0:
+                return async_wrapper
+
+            @wraps(func)
+            async def sampled_async_wrapper(*args, **kwargs) -> Any:
+                if random.random() < sample_rate:
+                    return await async_wrapper(*args, **kwargs)
+                return await func(*args, **kwargs)
+
+            return sampled_async_wrapper
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
-            start_time = time.time()
+            start_time = perf_counter()
             try:
-                result = func(*args, **kwargs)
-                return result
+                return func(*args, **kwargs)
             finally:
-                duration = time.time() - start_time
-                if labels:
-                    metric.labels(**labels).observe(duration)
-                else:
-                    metric.observe(duration)
+                observer.observe(perf_counter() - start_time)
 
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
+        if sample_rate >= 1.0:
             return sync_wrapper
 
+        @wraps(func)
+        def sampled_sync_wrapper(*args, **kwargs) -> Any:
+            if random.random() < sample_rate:
+                return sync_wrapper(*args, **kwargs)
+            return func(*args, **kwargs)
+
+        return sampled_sync_wrapper
+
     return decorator
 
 
+def _lazy_inc(metric: Counter, labels: Dict[str, Any]) -> Callable[[], None]:
+    """Return an increment that binds metric's labelled child on first use"""
+    child = None
+
+    def inc() -> None:
+        nonlocal child
+        if child is None:
+            child = metric.labels(**labels)
+        child.inc()
+
+    return inc
+
+
 def count_calls(metric: Counter, labels: Optional[Dict[str, Any]] = None):
     """Decorator to count function calls"""
 
     def decorator(func: Callable) -> Callable:
+        # Each child is bound on its first increment and reused after, so
+        # decorating never touches labels() (a counter without a status
+        # label only fails if the function actually raises) and no
+        # zero-valued error series is created up front
+        if labels:
+            on_success = _lazy_inc(metric, labels)
+            on_error = _lazy_inc(metric, {**labels, "status": "error"})
+        else:
+            on_success = on_error = metric.inc
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs) -> Any:
             try:
                 result = await func(*args, **kwargs)
-                if labels:
-                    metric.labels(**labels).inc()
-                else:
-                    metric.inc()
-                return result
-            except Exception as e:
-                if labels:
-                    error_labels = {**labels, "status": "error"}
-                    metric.labels(**error_labels).inc()
-                else:
-                    metric.inc()
+            except Exception:
+                on_error()
                 raise
+            on_success()
+            return result
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
             try:
                 result = func(*args, **kwargs)
-                if labels:
-                    metric.labels(**labels).inc()
-                else:
-                    metric.inc()
-                return result
-            except Exception as e:
-                if labels:
-                    error_labels = {**labels, "status": "error"}
-                    metric.labels(**error_labels).inc()
-                else:
-                    metric.inc()
+            except Exception:
+                on_error()
                 raise
+            on_success()
+            return result
 
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
@@ -207,9 +311,9 @@ def record_transaction_created(
     asset: str, status: str, value: Optional[float] = None
 ) -> None:
     """Record a transaction creation"""
-    transactions_created_total.labels(asset=asset, status=status).inc()
+    _child(transactions_created_total, asset=asset, status=status).inc()
     if value and asset:
-        transaction_value_total.labels(asset=asset).inc(value)
+        _child(transaction_value_total, asset=asset).inc(value)
 
 
 def record_transaction_validated(
@@ -219,20 +323,22 @@ def record_transaction_validated(
     asset: Optional[str] = None,
 ) -> None:
     """Record a transaction validation"""
-    transactions_validated_total.labels(
-        is_valid=str(is_valid), is_confirmed=str(is_confirmed)
+    _child(
+        transactions_validated_total,
+        is_valid=str(is_valid),
+        is_confirmed=str(is_confirmed),
     ).inc()
     if confirmations is not None and asset:
-        blockchain_confirmations.labels(asset=asset).observe(confirmations)
+        _child(blockchain_confirmations, asset=asset).observe(confirmations)
 
 
 def record_blockchain_operation(
     operation: str, status: str, duration: Optional[float] = None
 ) -> None:
     """Record a blockchain operation"""
-    blockchain_operations_total.labels(operation=operation, status=status).inc()
+    _child(blockchain_operations_total, operation=operation, status=status).inc()
     if duration is not None:
-        blockchain_operation_duration_seconds.labels(operation=operation).observe(
+        _child(blockchain_operation_duration_seconds, operation=operation).observe(
             duration
         )
 
@@ -241,21 +347,21 @@ def record_vault_operation(
     operation: str, status: str, duration: Optional[float] = None
 ) -> None:
     """Record a Vault operation"""
-    vault_operations_total.labels(operation=operation, status=status).inc()
+    _child(vault_operations_total, operation=operation, status=status).inc()
     if duration is not None:
-        vault_operation_duration_seconds.labels(operation=operation).observe(duration)
+        _child(vault_operation_duration_seconds, operation=operation).observe(duration)
 
 
 def record_database_operation(
     operation: str, table: str, status: str, duration: Optional[float] = None
 ) -> None:
     """Record a database operation"""
-    database_operations_total.labels(
-        operation=operation, table=table, status=status
+    _child(
+        database_operations_total, operation=operation, table=table, status=status
     ).inc()
     if duration is not None:
-        database_operation_duration_seconds.labels(
-            operation=operation, table=table
+        _child(
+            database_operation_duration_seconds, operation=operation, table=table
         ).observe(duration)
 
 
@@ -266,12 +372,12 @@ def record_wallet_created(count: int = 1):
 
 def record_wallet_operation(operation: str, status: str):
     """Record wallet operation"""
-    wallet_operations_total.labels(operation=operation, status=status).inc()
+    _child(wallet_operations_total, operation=operation, status=status).inc()
 
 
 def record_error(error_type: str, component: str):
     """Record an error"""
-    errors_total.labels(error_type=error_type, component=component).inc()
+    _child(errors_total, error_type=error_type, component=component).inc()
 
 
 def set_app_info(version: str, environment: str):
@@ -283,15 +389,21 @@ def set_app_info(version: str, environment: str):
 
 
 class MetricsContext:
-    """Context manager for tracking metrics"""
+    """
+    Context manager for tracking metrics
+
+    The elapsed time is read once on exit from perf_counter and kept
+    as duration (seconds), so callers reuse it instead of timing again.
+    """
 
     def __init__(self, operation: str, component: str) -> None:
         self.operation = operation
         self.component = component
         self.start_time: Optional[float] = None
+        self.duration: float = 0.0
 
     def __enter__(self) -> "MetricsContext":
-        self.start_time = time.time()
+        self.start_time = perf_counter()
         return self
 
     def __exit__(
@@ -301,9 +413,8 @@ class MetricsContext:
         exc_tb: Optional[Any],
     ) -> None:
         if self.start_time is not None:
-            duration = time.time() - self.start_time
-        else:
-            duration = 0.0
+            self.duration = perf_counter() - self.start_time
+        duration = self.duration
 
         if exc_type is None:
             status = "success"
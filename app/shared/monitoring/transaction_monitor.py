@@ -1,5 +1,4 @@
 import asyncio
-import time
 from typing import List, Optional
 
 from app.infrastructure.blockchain.transaction.node_repository import (
@@ -24,12 +23,16 @@ class TransactionMonitorService(LoggerMixin):
         min_confirmations: int = 1,
         poll_interval: int = 30,
         max_age_hours: int = 24,
+        batch_size: int = 100,
+        concurrency: int = 4,
     ):
         self.web3_repo = web3_repo
         self.db_repo = db_repo
         self.min_confirmations = min_confirmations
         self.poll_interval = poll_interval
         self.max_age_hours = max_age_hours
+        self.batch_size = batch_size
+        self.concurrency = concurrency
         self.running = False
         self._task: Optional[asyncio.Task] = None
 
@@ -71,55 +74,63 @@ class TransactionMonitorService(LoggerMixin):
     async def _check_pending_transactions(self) -> None:
         """Check pending transactions and update status"""
         try:
-            # Get pending transactions
-            pending_transactions = await self.db_repo.get_pending_transactions(
+            # Only the hashes are needed; confirmations come from the node
+            pending_hashes = await self.db_repo.get_pending_transaction_hashes(
                 max_age_hours=self.max_age_hours
             )
 
-            if not pending_transactions:
+            if not pending_hashes:
                 self.logger.debug("No pending transactions to check")
                 return
 
+            self.logger.info("Checking %d pending transactions", len(pending_hashes))
+
+            # JSON-RPC batches of batch_size hashes, then one UPDATE for all
+            # that reached the threshold
+            confirmations = await self._get_confirmations(pending_hashes)
+            confirmed = [
+                tx_hash
+                for tx_hash in pending_hashes
+                if confirmations.get(tx_hash, 0) >= self.min_confirmations
+            ]
+            if not confirmed:
+                return
+
+            updated = await self.db_repo.update_transactions_status(
+                confirmed, "confirmed"
+            )
             self.logger.info(
-                f"Checking {len(pending_transactions)} pending transactions"
+                "Confirmed %d of %d pending transactions", updated, len(pending_hashes)
             )
 
-            for tx in pending_transactions:
-                await self._check_transaction_status(tx.hash)
-                # Small pause between checks to avoid overwhelming the node
-                await asyncio.sleep(0.5)
-
         except Exception as e:
-            self.logger.error(f"Error checking pending transactions: {str(e)}")
+            self.logger.error("Error checking pending transactions: %s", e)
 
-    async def _check_transaction_status(self, tx_hash: str) -> None:
-        """Check the status of a specific transaction"""
-        try:
-            # Check confirmations
-            confirmations = self.web3_repo.get_transaction_confirmations(tx_hash)
+    async def _get_confirmations(self, tx_hashes: List[str]) -> dict:
+        """
+        Get confirmations for tx_hashes, at most concurrency batches in flight
 
-            if confirmations >= self.min_confirmations:
-                # Transaction confirmed
-                success = await self.db_repo.update_transaction_status(
-                    tx_hash, "confirmed"
-                )
-                if success:
-                    self.logger.info(
-                        f"Transaction {tx_hash[:10]}... confirmed and updated ({confirmations} confirmations)"
-                    )
-                else:
-                    self.logger.warning(
-                        f"Failed to update transaction status for {tx_hash[:10]}..."
-                    )
-            else:
-                self.logger.debug(
-                    f"Transaction {tx_hash[:10]}... still pending ({confirmations}/{self.min_confirmations} confirmations)"
+        Nodes cap the size of a JSON-RPC batch, so a large backlog is split
+        into batch_size chunks that run concurrently off the event loop.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(chunk: List[str]) -> dict:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.web3_repo.get_transactions_confirmations, chunk
                 )
 
-        except Exception as e:
-            self.logger.error(
-                f"Error checking transaction status for {tx_hash[:10]}...: {str(e)}"
+        results = await asyncio.gather(
+            *(
+                fetch(tx_hashes[start : start + self.batch_size])
+                for start in range(0, len(tx_hashes), self.batch_size)
             )
+        )
+        confirmations = {}
+        for result in results:
+            confirmations.update(result)
+        return confirmations
 
 
 class TransactionMonitorManager:
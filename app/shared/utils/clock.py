@@ -0,0 +1,11 @@
+import datetime
+
+
+def utc_now() -> datetime.datetime:
+    """
+    Current UTC time as a naive datetime.
+
+    The timestamp columns are TIMESTAMP WITHOUT TIME ZONE and asyncpg rejects
+    aware datetimes for them, so values are stored as naive UTC.
+    """
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,17 @@
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered directly by pydantic-core's compiled encoder.
+
+    Accepts Pydantic models, dicts and Decimals as-is, so handlers returning
+    this response skip FastAPI's response_model re-validation and
+    jsonable_encoder pass entirely.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
@@ -1,9 +1,59 @@
+import re
 from decimal import ROUND_DOWN, Decimal, getcontext
-from typing import Union
+from typing import Iterable, List, Optional, Union
 
 # Set precision high enough to handle large numbers
 getcontext().prec = 50
 
+_WEI_PER_ETH = Decimal("1000000000000000000")
+_MAX_ETH = Decimal("120000000")  # Approximate max ETH supply
+
+# Plain decimal strings and finite Decimals that fit in wei exactly are
+# converted with integer arithmetic; anything else (floats, strings with
+# signs, exponents or whitespace, sub-wei digits) goes through the Decimal
+# multiply
+_PLAIN_ETH_RE = re.compile(r"([0-9]+)(?:\.([0-9]{1,18}))?")
+_WEI_PER_ETH_INT = 10**18
+_MAX_WEI = int(_MAX_ETH) * _WEI_PER_ETH_INT
+
+
+def normalize_tx_hash(tx_hash: str) -> str:
+    """
+    Normalize a transaction hash to lowercase hex with a single 0x prefix.
+
+    Applied once where a hash enters the application, so downstream code can
+    use it as-is.
+    """
+    tx_hash = tx_hash.strip().lower()
+    return tx_hash if tx_hash.startswith("0x") else "0x" + tx_hash
+
+
+def _exact_wei(eth_value: Union[str, float, Decimal]) -> Optional[int]:
+    """
+    Integer-only conversion for in-range values that fit in wei exactly.
+
+    Returns None for anything else, which eth_to_wei then converts (or
+    rejects) through Decimal, so its results and errors stay the same.
+    """
+    if isinstance(eth_value, str):
+        match = _PLAIN_ETH_RE.fullmatch(eth_value)
+        if match is None:
+            return None
+        whole, fraction = match.groups()
+        wei_value = int(whole) * _WEI_PER_ETH_INT
+        if fraction:
+            wei_value += int(fraction.ljust(18, "0"))
+    elif isinstance(eth_value, Decimal) and eth_value.is_finite():
+        # API requests arrive as Decimal; the ratio's denominator divides
+        # 10**18 exactly when the value has no sub-wei digits
+        numerator, denominator = eth_value.as_integer_ratio()
+        if _WEI_PER_ETH_INT % denominator:
+            return None
+        wei_value = numerator * (_WEI_PER_ETH_INT // denominator)
+    else:
+        return None
+    return wei_value if 0 < wei_value <= _MAX_WEI else None
+
 
 def eth_to_wei(eth_value: Union[str, float, Decimal]) -> int:
     """
@@ -18,6 +68,10 @@ def eth_to_wei(eth_value: Union[str, float, Decimal]) -> int:
     Raises:
         ValueError: If value is invalid
     """
+    wei_value = _exact_wei(eth_value)
+    if wei_value is not None:
+        return wei_value
+
     try:
         # Handle scientific notation by converting float to string with proper formatting
         if isinstance(eth_value, float):
@@ -32,13 +86,12 @@ def eth_to_wei(eth_value: Union[str, float, Decimal]) -> int:
             raise ValueError("Value must be positive")
 
         # Check if value is too large (more than total ETH supply)
-        max_eth = Decimal("120000000")  # Approximate max ETH supply
-        if eth_decimal > max_eth:
+        if eth_decimal > _MAX_ETH:
             raise ValueError(
                 f"Value too large: {eth_decimal} ETH exceeds maximum supply"
             )
 
-        wei_decimal = eth_decimal * Decimal("1000000000000000000")
+        wei_decimal = eth_decimal * _WEI_PER_ETH
 
         # Use to_integral_value instead of quantize for large numbers
         wei_value = int(wei_decimal.to_integral_value(rounding=ROUND_DOWN))
@@ -63,12 +116,13 @@ def wei_to_eth(wei_value: Union[str, int]) -> Decimal:
         ValueError: If value is invalid
     """
     try:
-        wei_decimal = Decimal(str(wei_value))
+        # Decimal(int) is exact, only strings need parsing
+        wei_decimal = Decimal(wei_value if type(wei_value) is int else str(wei_value))
 
         if wei_decimal < 0:
             raise ValueError("Wei value must be non-negative")
 
-        eth_decimal = wei_decimal / Decimal("1000000000000000000")
+        eth_decimal = wei_decimal / _WEI_PER_ETH
 
         return eth_decimal
 
@@ -76,18 +130,64 @@ def wei_to_eth(wei_value: Union[str, int]) -> Decimal:
         raise ValueError(f"Error converting Wei to ETH: {e}")
 
 
-def validate_eth_value(eth_value: Union[str, float]) -> bool:
+def wei_to_eth_batch(wei_values: Iterable[int]) -> List[Decimal]:
+    """
+    Convert many integer Wei values to ETH in a single pass.
+
+    Produces exactly the same Decimals as calling wei_to_eth per value, but
+    skips the str() round-trip and per-call setup, which dominates when
+    converting a page of up to 1000 rows.
+
+    Args:
+        wei_values: Values in Wei (ints, e.g. straight from the database)
+
+    Returns:
+        List[Decimal]: Values in ETH, in input order
+
+    Raises:
+        ValueError: If any value is invalid
+    """
+    eth_values = []
+    try:
+        for wei_value in wei_values:
+            if wei_value < 0:
+                raise ValueError("Wei value must be non-negative")
+            eth_values.append(Decimal(wei_value) / _WEI_PER_ETH)
+    except (ValueError, TypeError, ArithmeticError) as e:
+        raise ValueError(f"Error converting Wei to ETH: {e}")
+    return eth_values
+
+
+def validate_eth_value(
+    eth_value: Union[str, float, Decimal], max_decimal_places: Optional[int] = None
+) -> bool:
     """
     Validate if an ETH value is valid and positive.
 
+    Cheap checks run first: Decimal input is used as-is, and the digit
+    extraction for the precision check only runs when it is requested.
+
     Args:
         eth_value: ETH value to validate
+        max_decimal_places: Optional maximum number of decimal places allowed
 
     Returns:
         bool: True if valid, False otherwise
     """
     try:
-        eth_decimal = Decimal(str(eth_value))
-        return eth_decimal > 0
+        if isinstance(eth_value, Decimal):
+            eth_decimal = eth_value
+        elif isinstance(eth_value, float):
+            # str() keeps the shortest repr, e.g. 0.1 rather than its binary expansion
+            eth_decimal = Decimal(str(eth_value))
+        else:
+            eth_decimal = Decimal(eth_value)
     except (ValueError, TypeError, ArithmeticError):
         return False
+
+    # NaN and Infinity must be rejected before comparing, NaN comparisons raise
+    if not eth_decimal.is_finite() or eth_decimal <= 0:
+        return False
+    if max_decimal_places is None:
+        return True
+    return -eth_decimal.as_tuple().exponent <= max_decimal_places
@@ -2,7 +2,6 @@ import os
 import time
 from contextlib import asynccontextmanager
 
-import asyncpg
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
@@ -17,10 +16,14 @@ from app.infrastructure.blockchain.transaction.node_repository import (
     Web3TransactionRepository,
 )
 from app.infrastructure.config import load_config
+from app.infrastructure.db.pool import create_pool
 from app.infrastructure.db.transaction.postgresql_repository import (
     PostgreSQLTransactionRepository,
 )
+from app.infrastructure.db.wallet.ownership_cache import WalletOwnershipCache
 from app.infrastructure.db.wallet.postgresql_repository import (
+    EthereumWalletService,
+    HashiCorpVaultService,
     PostgreSQLWalletRepository,
 )
 from app.shared.monitoring.logging import get_logger, setup_logging
@@ -42,7 +45,7 @@ from app.shared.monitoring.transaction_monitor import (
 config = load_config()
 
 # Setup logging
-setup_logging(config.log_level)
+setup_logging(config.log_level, config.log_format)
 logger = get_logger(__name__)
 
 # Create logs directory if it doesn't exist
@@ -56,10 +59,20 @@ async def lifespan(app: FastAPI):
     )
 
     try:
+        app.state.config = config
+
         # Database setup
-        pool = await asyncpg.create_pool(config.postgres_dsn)
+        # create_pool opens min_size connections before the app takes traffic
+        pool = await create_pool(
+            config.postgres_dsn,
+            min_size=config.postgres_pool_min_size,
+            max_size=config.postgres_pool_max_size,
+            statement_cache_size=config.postgres_statement_cache_size,
+            command_timeout=config.postgres_command_timeout,
+        )
         app.state.pool = pool  # Store pool reference for health checks
         app.state.wallet_repo = PostgreSQLWalletRepository(pool)
+        app.state.wallet_cache = WalletOwnershipCache(app.state.wallet_repo)
         app.state.transaction_repo = PostgreSQLTransactionRepository(pool)
 
         # Initialize database metrics
@@ -71,6 +84,7 @@ async def lifespan(app: FastAPI):
         # Web3 setup
         app.state.web3 = Web3(Web3.HTTPProvider(config.web3_provider_url))
         app.state.web3_repo = Web3TransactionRepository(app.state.web3)
+        app.state.token_gas_limits = config.token_gas_overrides
 
         if app.state.web3.is_connected():
             logger.info(
@@ -81,6 +95,14 @@ async def lifespan(app: FastAPI):
                 f"Web3 connection failed - Provider: {config.web3_provider_url}"
             )
 
+        # Vault and wallet services are shared across requests
+        app.state.vault_service = HashiCorpVaultService(
+            url=config.vault_url,
+            token=config.vault_token,
+            secret_path=config.vault_secret_path,
+        )
+        app.state.wallet_service = EthereumWalletService()
+
         # Transaction monitor setup
         app.state.transaction_monitor_manager = TransactionMonitorManager()
 
@@ -278,13 +300,11 @@ async def health_check():
         except Exception:
             health_info["web3_connected"] = False
 
-    # Check Vault connection (if available)
-    try:
-        # This would need to be implemented based on your vault setup
-        # For now, just mark as unknown
+    # Check Vault connection; the service does not authenticate at startup
+    if hasattr(app.state, "vault_service") and app.state.vault_service:
+        health_info["vault_connected"] = await app.state.vault_service.healthcheck()
+    else:
         health_info["vault_connected"] = None
-    except Exception:
-        health_info["vault_connected"] = False
 
     # Check transaction monitors
     if hasattr(app.state, "transaction_monitor_manager"):
@@ -298,7 +318,7 @@ async def health_check():
     # Determine overall status
     if not health_info["database_connected"]:
         health_info["status"] = "unhealthy"
-    elif not health_info["web3_connected"]:
+    elif not health_info["web3_connected"] or health_info["vault_connected"] is False:
         health_info["status"] = "degraded"
 
     return health_info
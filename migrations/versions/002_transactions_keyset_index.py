@@ -0,0 +1,42 @@
+"""add transactions keyset pagination index
+
+Revision ID: 002_transactions_keyset_index
+Revises: 001_initial
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002_transactions_keyset_index"
+down_revision: Union[str, Sequence[str], None] = "001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Composite index for keyset pagination on (created_at, hash);
+    # scanned backwards for ORDER BY created_at DESC, hash DESC
+    # CONCURRENTLY avoids holding a SHARE lock (blocking writes) for the
+    # whole build; it cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_transactions_created_at_hash",
+            "transactions",
+            ["created_at", "hash"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_transactions_created_at_hash",
+            table_name="transactions",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,43 @@
+"""add functional index on lower(wallets.address)
+
+Revision ID: 003_wallets_address_lower_index
+Revises: 002_transactions_keyset_index
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003_wallets_address_lower_index"
+down_revision: Union[str, Sequence[str], None] = "002_transactions_keyset_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Wallet lookups compare LOWER(address), which the primary key on the raw
+    # checksum address cannot serve; index the lowercased form instead
+    # CONCURRENTLY avoids holding a SHARE lock (blocking writes) for the
+    # whole build; it cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_wallets_address_lower",
+            "wallets",
+            [sa.text("lower(address)")],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_wallets_address_lower",
+            table_name="wallets",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,44 @@
+"""add partial index on active wallets
+
+Revision ID: 004_wallets_active_partial_index
+Revises: 003_wallets_address_lower_index
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004_wallets_active_partial_index"
+down_revision: Union[str, Sequence[str], None] = "003_wallets_address_lower_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GET /v1/wallets lists addresses WHERE deleted_at IS NULL; a partial index
+    # on address lets it run as an index-only scan over active wallets
+    # CONCURRENTLY avoids holding a SHARE lock (blocking writes) for the
+    # whole build; it cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_wallets_active_address",
+            "wallets",
+            ["address"],
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_wallets_active_address",
+            table_name="wallets",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,46 @@
+"""add partial index on pending transactions
+
+Revision ID: 005_transactions_pending_partial_index
+Revises: 004_wallets_active_partial_index
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005_transactions_pending_partial_index"
+down_revision: Union[str, Sequence[str], None] = "004_wallets_active_partial_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The monitor polls pending/confirming rows by age, oldest first; indexing
+    # only those rows on created_at keeps the scan proportional to the pending
+    # set, and including hash makes the hash-only poll an index-only scan
+    # CONCURRENTLY avoids holding a SHARE lock (blocking writes) for the
+    # whole build; it cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_transactions_pending_created_at",
+            "transactions",
+            ["created_at"],
+            postgresql_where=sa.text("status IN ('pending', 'confirming')"),
+            postgresql_include=["hash"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_transactions_pending_created_at",
+            table_name="transactions",
+            postgresql_concurrently=True,
+        )
@@ -1,9 +1,11 @@
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import pytest
 
 from app.infrastructure.blockchain.transaction.node_repository import (
     Web3TransactionRepository,
+    encode_erc20_transfer,
+    fetch_transaction_parameters,
 )
 
 
@@ -147,6 +149,7 @@ class TestWeb3TransactionRepositoryErrorHandling:
         # Should still return ETH transfer even if receipt is None
         assert len(result) == 1
         assert result[0]["asset"] == "eth"
+        assert result[0]["address_from"] == "0xfrom"
 
     def test_get_transaction_transfers_receipt_exception(self, repository, mock_web3):
         """Test get_transaction_transfers when getting receipt fails"""
@@ -236,3 +239,167 @@ class TestWeb3TransactionRepositoryErrorHandling:
         result = repository.get_transaction_transfers("0x123")
         # Should return empty list since no ETH transfer and no token transfers
         assert result == []
+
+    def test_get_transactions_confirmations_batch(self, repository, mock_web3):
+        """Test batch confirmations use one block number and one receipt batch"""
+        mock_web3.provider.make_batch_request.return_value = [
+            {"jsonrpc": "2.0", "id": 0, "result": {"blockNumber": "0x64"}},
+            {"jsonrpc": "2.0", "id": 1, "result": {"blockNumber": "0x6e"}},
+        ]
+
+        result = repository.get_transactions_confirmations(["0x1", "0x2"])
+
+        assert result == {"0x1": 11, "0x2": 1}
+        mock_web3.provider.make_batch_request.assert_called_once_with(
+            [
+                ("eth_getTransactionReceipt", ["0x1"]),
+                ("eth_getTransactionReceipt", ["0x2"]),
+            ]
+        )
+        mock_web3.eth.get_transaction.assert_not_called()
+
+    def test_get_transactions_confirmations_batch_per_item_failures(
+        self, repository, mock_web3
+    ):
+        """Test a pending or failing hash does not fail the rest of the batch"""
+        mock_web3.provider.make_batch_request.return_value = [
+            {"jsonrpc": "2.0", "id": 0, "result": None},
+            {"jsonrpc": "2.0", "id": 1, "result": {"blockNumber": "0x64"}},
+            {"jsonrpc": "2.0", "id": 2, "error": {"code": -32000, "message": "x"}},
+        ]
+
+        result = repository.get_transactions_confirmations(["0x1", "0x2", "0x3"])
+
+        assert result == {"0x1": 0, "0x2": 11, "0x3": 0}
+        mock_web3.eth.get_transaction.assert_not_called()
+
+    def test_get_transactions_confirmations_batch_exception(
+        self, repository, mock_web3
+    ):
+        """Test batch confirmations default to 0 when every lookup fails"""
+        mock_web3.provider.make_batch_request.side_effect = Exception("Batch error")
+        mock_web3.batch_requests.side_effect = Exception("Batch error")
+        mock_web3.eth.get_transaction.side_effect = Exception("Not found")
+
+        result = repository.get_transactions_confirmations(["0x1", "0x2"])
+
+        assert result == {"0x1": 0, "0x2": 0}
+
+    def test_get_transactions_confirmations_batch_fallback(self, repository, mock_web3):
+        """Test a provider without batch support falls back to one lookup per hash"""
+        mock_web3.provider.make_batch_request.side_effect = NotImplementedError
+        mock_web3.batch_requests.side_effect = Exception("Batch not supported")
+        mock_web3.eth.block_number = 110
+
+        def get_transaction(tx_hash):
+            if tx_hash != "0x1":
+                raise Exception("Not found")
+            return MockTransaction(blockNumber=100)
+
+        mock_web3.eth.get_transaction.side_effect = get_transaction
+
+        result = repository.get_transactions_confirmations(["0x1", "0x2"])
+
+        assert result == {"0x1": 11, "0x2": 0}
+
+    def test_get_transaction_confirmations_batch(self, repository, mock_web3):
+        """Test the transaction and current block are fetched in one batch"""
+        batch = MagicMock()
+        batch.__enter__.return_value = batch
+        mock_web3.batch_requests.return_value = batch
+        batch.execute.return_value = [MockTransaction(blockNumber=100), 105]
+
+        assert repository.get_transaction_confirmations("0x1") == 6
+        assert batch.add.call_count == 2
+
+    def test_get_transaction_transfers_batch(self, repository, mock_web3):
+        """Test the transaction and receipt are fetched in one batch"""
+        tx = MagicMock()
+        tx.value = 5
+        tx.__getitem__.side_effect = {"from": "0xfrom", "to": "0xto"}.__getitem__
+        receipt = MagicMock()
+        receipt.logs = []
+        batch = MagicMock()
+        batch.__enter__.return_value = batch
+        mock_web3.batch_requests.return_value = batch
+        batch.execute.return_value = [tx, receipt]
+
+        result = repository.get_transaction_transfers("0x1")
+
+        assert [transfer["value"] for transfer in result] == [5]
+        assert batch.add.call_count == 2
+        mock_web3.eth.get_transaction_receipt.assert_called_once_with("0x1")
+
+    def test_chain_id_cached(self, repository, mock_web3):
+        """Test chain_id is read from the node only once"""
+        chain_id = PropertyMock(return_value=1)
+        type(mock_web3.eth).chain_id = chain_id
+
+        assert repository.chain_id == 1
+        assert repository.chain_id == 1
+
+        chain_id.assert_called_once()
+
+    def test_get_token_symbol_cached(self, repository, mock_web3):
+        """Test token symbols are fetched once per contract"""
+        mock_web3.to_checksum_address.side_effect = lambda address: address.upper()
+        contract = mock_web3.eth.contract.return_value
+        contract.functions.symbol.return_value.call.return_value = "usdt"
+
+        assert repository.get_token_symbol("0xabc") == "USDT"
+        assert repository.get_token_symbol("0xABC") == "USDT"
+
+        mock_web3.eth.contract.assert_called_once()
+
+    def test_get_token_symbol_failure_not_cached(self, repository, mock_web3):
+        """Test failed symbol lookups are retried on the next call"""
+        mock_web3.to_checksum_address.side_effect = lambda address: address.upper()
+        contract = mock_web3.eth.contract.return_value
+        contract.functions.symbol.return_value.call.side_effect = [
+            Exception("RPC error"),
+            "dai",
+        ]
+
+        assert repository.get_token_symbol("0xabc") == "UNKNOWN"
+        assert repository.get_token_symbol("0xabc") == "DAI"
+
+
+def test_encode_erc20_transfer():
+    """Test ERC20 transfer calldata matches the ABI encoding"""
+    data = encode_erc20_transfer("0xC2DBAAF3E4944EDE0DEF95D9D1A129AED2F74587", 1000)
+
+    assert data == (
+        "0xa9059cbb"
+        "000000000000000000000000c2dbaaf3e4944ede0def95d9d1a129aed2f74587"
+        "00000000000000000000000000000000000000000000000000000000000003e8"
+    )
+
+
+def test_fetch_transaction_parameters_batch():
+    """Test parameters are fetched in a single batch request"""
+    web3 = MagicMock()
+    batch = web3.batch_requests.return_value.__enter__.return_value
+    batch.execute.return_value = [3, 10**18, 20_000_000_000, 1_000_000_000]
+
+    result = fetch_transaction_parameters(web3, "0xfrom")
+
+    assert result == (3, 10**18, 20_000_000_000, 1_000_000_000)
+    assert batch.add.call_count == 4
+
+
+def test_fetch_transaction_parameters_fallback():
+    """Test single calls are used when the batch request fails"""
+    web3 = MagicMock()
+    web3.batch_requests.side_effect = Exception("batch not supported")
+    web3.eth.get_transaction_count.return_value = 3
+    web3.eth.get_balance.return_value = 10**18
+    web3.eth.gas_price = 20_000_000_000
+
+    def max_priority_fee_getter(self):
+        raise ValueError("method not found")
+
+    type(web3.eth).max_priority_fee = property(max_priority_fee_getter)
+
+    result = fetch_transaction_parameters(web3, "0xfrom")
+
+    assert result == (3, 10**18, 20_000_000_000, 2_000_000_000)
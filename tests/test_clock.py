@@ -0,0 +1,16 @@
+import datetime
+
+from app.shared.utils.clock import utc_now
+
+
+class TestUtcNow:
+    """Test the UTC timestamp helper"""
+
+    def test_utc_now_is_naive_utc(self):
+        """Test utc_now returns naive datetimes in UTC"""
+        before = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        now = utc_now()
+        after = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+        assert now.tzinfo is None
+        assert before <= now <= after
@@ -0,0 +1,39 @@
+from app.infrastructure.config import load_config, parse_gas_overrides
+
+
+class TestParseGasOverrides:
+    """Test TOKEN_GAS_OVERRIDES parsing"""
+
+    def test_parse_gas_overrides(self):
+        """Test entries are keyed by lowercase contract address"""
+        overrides = parse_gas_overrides("0xABC=65000, 0xdef=90000")
+
+        assert overrides == {"0xabc": 65000, "0xdef": 90000}
+
+    def test_parse_gas_overrides_empty(self):
+        """Test an unset variable yields no overrides"""
+        assert parse_gas_overrides("") == {}
+
+
+class TestLoadConfig:
+    """Test environment-driven settings"""
+
+    def test_pool_size_from_env(self, monkeypatch):
+        """Test pool bounds are read from the environment"""
+        monkeypatch.setenv("POSTGRES_POOL_MIN_SIZE", "4")
+        monkeypatch.setenv("POSTGRES_POOL_MAX_SIZE", "8")
+
+        config = load_config()
+
+        assert config.postgres_pool_min_size == 4
+        assert config.postgres_pool_max_size == 8
+
+    def test_pool_query_settings_from_env(self, monkeypatch):
+        """Test statement cache size and command timeout are read from the environment"""
+        monkeypatch.setenv("POSTGRES_STATEMENT_CACHE_SIZE", "256")
+        monkeypatch.setenv("POSTGRES_COMMAND_TIMEOUT", "5")
+
+        config = load_config()
+
+        assert config.postgres_statement_cache_size == 256
+        assert config.postgres_command_timeout == 5.0
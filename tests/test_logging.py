@@ -1,12 +1,18 @@
+import datetime
+import json
 import logging
 import os
 import shutil
 import tempfile
+from logging.handlers import QueueHandler
 from unittest.mock import Mock, patch
 
 import pytest
 
+import app.shared.monitoring.logging as logging_module
 from app.shared.monitoring.logging import (
+    BufferedFileHandler,
+    JsonFormatter,
     LoggerMixin,
     get_logger,
     log_blockchain_operation,
@@ -14,6 +20,7 @@ from app.shared.monitoring.logging import (
     log_function_call,
     log_vault_operation,
     setup_logging,
+    stop_logging,
 )
 
 
@@ -29,7 +36,8 @@ class TestSetupLogging:
 
     def teardown_method(self):
         """Cleanup after each test"""
-        # Clear logging handlers first to release file handles
+        # Stop the listener and clear handlers first to release file handles
+        stop_logging()
         root_logger = logging.getLogger()
         for handler in root_logger.handlers[:]:
             try:
@@ -54,7 +62,9 @@ class TestSetupLogging:
 
         root_logger = logging.getLogger()
         assert root_logger.level == logging.INFO
-        assert len(root_logger.handlers) == 3  # console, file, error
+        # console, file and error handlers sit behind a single queue handler
+        assert len(root_logger.handlers) == 1
+        assert isinstance(root_logger.handlers[0], QueueHandler)
 
         # Check if logs directory was created
         assert os.path.exists("logs")
@@ -82,13 +92,17 @@ class TestSetupLogging:
         logger.info("Test message")
         logger.error("Test error")
 
-        # Force flush
-        for handler in logging.getLogger().handlers:
-            if hasattr(handler, "flush"):
-                handler.flush()
+        # Drain the queue into the file handlers
+        stop_logging()
 
         assert os.path.exists("logs/app.log")
         assert os.path.exists("logs/error.log")
+        with open("logs/app.log") as f:
+            assert "Test message" in f.read()
+        with open("logs/error.log") as f:
+            content = f.read()
+        assert "Test error" in content
+        assert "Test message" not in content
 
     def test_setup_logging_clears_existing_handlers(self):
         """Test that setup clears existing handlers"""
@@ -99,8 +113,9 @@ class TestSetupLogging:
 
         setup_logging()
 
-        # Should have exactly 3 handlers (our new ones)
-        assert len(root_logger.handlers) == 3
+        # Should have exactly our queue handler
+        assert len(root_logger.handlers) == 1
+        assert isinstance(root_logger.handlers[0], QueueHandler)
 
     def test_setup_logging_handles_existing_logs_dir(self):
         """Test that setup handles existing logs directory"""
@@ -112,7 +127,96 @@ class TestSetupLogging:
 
         # Should still work
         root_logger = logging.getLogger()
-        assert len(root_logger.handlers) == 3
+        assert len(root_logger.handlers) == 1
+
+
+class TestJsonFormatter:
+    """Test the JSON line formatter"""
+
+    def test_format_includes_message_and_extra(self):
+        """Test records become one JSON object with extra fields at the top level"""
+        record = logging.LogRecord(
+            "app.test", logging.INFO, __file__, 7, "saved %s", ("0xabc",), None
+        )
+        record.log_event = "database_operation"
+        record.created_at = datetime.datetime(2025, 7, 1, 12, 0, 0)
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        assert entry["msg"] == "saved 0xabc"
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "app.test"
+        assert entry["line"] == 7
+        assert entry["log_event"] == "database_operation"
+        assert entry["created_at"] == "2025-07-01T12:00:00"
+        assert "args" not in entry
+
+    def test_setup_logging_json_format(self, tmp_path, monkeypatch):
+        """Test setup_logging installs the JSON formatter when asked to"""
+        monkeypatch.chdir(tmp_path)
+        try:
+            setup_logging("INFO", "json")
+            listener_handlers = logging_module._listener.handlers
+            assert all(
+                isinstance(handler.formatter, JsonFormatter)
+                for handler in listener_handlers
+            )
+        finally:
+            stop_logging()
+            logging.getLogger().handlers.clear()
+
+    def test_exception_through_queue_keeps_exc_info(self, tmp_path, monkeypatch):
+        """Test a traceback logged through the queue lands in the exc_info field"""
+        monkeypatch.chdir(tmp_path)
+        try:
+            setup_logging("INFO", "json")
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logging.getLogger("app.test").exception("failed for %s", "0xabc")
+        finally:
+            stop_logging()
+            logging.getLogger().handlers.clear()
+
+        with open(tmp_path / "logs" / "app.log") as log_file:
+            entry = json.loads(log_file.read().splitlines()[-1])
+        assert entry["msg"] == "failed for 0xabc"
+        assert "Traceback" in entry["exc_info"]
+        assert "ValueError: boom" in entry["exc_info"]
+
+
+class TestBufferedFileHandler:
+    """Test the coalescing file handler"""
+
+    def _record(self, message):
+        return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+    def test_emit_does_not_flush_each_record(self, tmp_path):
+        """Test records stay buffered until flushed or closed"""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(str(path))
+        try:
+            handler.emit(self._record("first"))
+            assert path.read_text() == ""
+
+            handler.flush()
+            assert path.read_text() == "first\n"
+        finally:
+            handler.close()
+
+    def test_emit_flushes_after_interval(self, tmp_path):
+        """Test a record arriving after the flush interval is written out"""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(str(path))
+        try:
+            with patch(
+                "app.shared.monitoring.logging.time.monotonic",
+                return_value=handler._last_flush + 1,
+            ):
+                handler.emit(self._record("late"))
+            assert path.read_text() == "late\n"
+        finally:
+            handler.close()
 
 
 class TestGetLogger:
@@ -176,6 +280,15 @@ class TestLoggerMixin:
         assert instance2.logger.name == "TestClass2"
         assert instance1.logger is not instance2.logger
 
+    def test_logger_mixin_logger_is_class_attribute(self):
+        """Test the logger is assigned once per class, not per instance"""
+
+        class TestClass(LoggerMixin):
+            pass
+
+        assert TestClass.logger is TestClass().logger
+        assert "logger" not in vars(TestClass())
+
 
 class TestLogContextFunctions:
     """Test log context creation functions"""
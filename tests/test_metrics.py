@@ -3,6 +3,7 @@ import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from prometheus_client import CollectorRegistry, Counter, Histogram
 
 from app.shared.monitoring.metrics import (  # Metrics instances; Functions
     MetricsContext,
@@ -224,6 +225,55 @@ class TestTrackTimeDecorator:
         # Should still record timing even with exception
         mock_metric.observe.assert_called_once()
 
+    def test_track_time_sampled_skips_unsampled_calls(self):
+        """Test track_time only times calls that fall within sample_rate"""
+        mock_metric = Mock()
+
+        @track_time(mock_metric, sample_rate=0.5)
+        def test_function():
+            return "result"
+
+        with patch(
+            "app.shared.monitoring.metrics.random.random", side_effect=[0.9, 0.1]
+        ):
+            assert test_function() == "result"
+            assert test_function() == "result"
+
+        mock_metric.observe.assert_called_once()
+
+    def test_track_time_batched_applies_observations_per_batch(self):
+        """Test batched track_time keeps exact counts and buckets"""
+        registry = CollectorRegistry()
+        histogram = Histogram(
+            "test_batched_seconds",
+            "Batched histogram",
+            buckets=(0.5, 1.0),
+            registry=registry,
+        )
+        durations = iter([0.0, 0.2, 1.0, 1.7, 2.0, 5.0])
+
+        @track_time(histogram, batch=2)
+        def test_function():
+            return "result"
+
+        with patch(
+            "app.shared.monitoring.metrics.perf_counter",
+            side_effect=lambda: next(durations),
+        ):
+            test_function()
+            assert registry.get_sample_value("test_batched_seconds_count") == 0
+            test_function()
+            test_function()
+
+        # The third observation stays buffered until the batch fills
+        assert registry.get_sample_value("test_batched_seconds_count") == 2
+        assert (
+            registry.get_sample_value("test_batched_seconds_bucket", {"le": "0.5"}) == 1
+        )
+        assert registry.get_sample_value("test_batched_seconds_sum") == pytest.approx(
+            0.9
+        )
+
 
 class TestCountCallsDecorator:
     """Test count_calls decorator"""
@@ -323,6 +373,18 @@ class TestCountCallsDecorator:
 
         mock_metric.inc.assert_called_once()
 
+    def test_count_calls_without_status_label_decorates(self):
+        """Test decorating with a counter lacking a status label does not raise"""
+        registry = CollectorRegistry()
+        counter = Counter("test_calls", "Calls", ["operation"], registry=registry)
+
+        @count_calls(counter, {"operation": "test"})
+        def test_function():
+            return "result"
+
+        assert test_function() == "result"
+        assert registry.get_sample_value("test_calls_total", {"operation": "test"}) == 1
+
 
 class TestMetricsRecordingFunctions:
     """Test metrics recording functions"""
@@ -495,6 +557,20 @@ class TestMetricsRecordingFunctions:
         )
         mock_labeled_errors.inc.assert_called_once()
 
+    @patch("app.shared.monitoring.metrics.errors_total")
+    def test_record_error_reuses_labeled_child(self, mock_errors_metric):
+        """Test repeated calls with the same labels bind the child only once"""
+        mock_labeled_errors = Mock()
+        mock_errors_metric.labels.return_value = mock_labeled_errors
+
+        record_error("ValueError", "vault")
+        record_error("ValueError", "vault")
+
+        mock_errors_metric.labels.assert_called_once_with(
+            error_type="ValueError", component="vault"
+        )
+        assert mock_labeled_errors.inc.call_count == 2
+
     @patch("app.shared.monitoring.metrics.app_info")
     def test_set_app_info(self, mock_app_info):
         """Test set_app_info function"""
@@ -590,3 +666,12 @@ class TestMetricsContext:
 
         assert start_time is not None
         assert start_time > 0
+
+    @patch("app.shared.monitoring.metrics.record_vault_operation")
+    def test_metrics_context_duration(self, mock_record):
+        """Test MetricsContext exposes the recorded duration"""
+        with MetricsContext("store_key", "vault") as context:
+            time.sleep(0.01)
+
+        assert context.duration >= 0.01
+        assert mock_record.call_args[0][2] == context.duration
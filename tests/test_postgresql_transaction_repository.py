@@ -6,6 +6,7 @@ import pytest
 from app.domain.transaction.entity import Transaction as TransactionEntity
 from app.infrastructure.db.transaction.postgresql_repository import (
     PostgreSQLTransactionRepository,
+    TransactionRow,
 )
 
 
@@ -18,11 +19,11 @@ class TestPostgreSQLTransactionRepository:
         pool = Mock()
         conn = AsyncMock()
 
-        # Mock the async context manager
-        async_context = AsyncMock()
-        async_context.__aenter__ = AsyncMock(return_value=conn)
-        async_context.__aexit__ = AsyncMock(return_value=None)
-        pool.acquire.return_value = async_context
+        # Single queries go through the pool's acquire-and-run shortcuts
+        pool.execute = conn.execute
+        pool.fetch = conn.fetch
+        pool.fetchrow = conn.fetchrow
+        pool.fetchval = conn.fetchval
 
         return pool, conn
 
@@ -66,7 +67,68 @@ class TestPostgreSQLTransactionRepository:
 
             assert isinstance(repo, PostgreSQLTransactionRepository)
             assert repo._pool == mock_pool
-            mock_create_pool.assert_called_once_with(dsn="postgresql://test")
+            mock_create_pool.assert_called_once()
+            args, kwargs = mock_create_pool.call_args
+            assert args == ("postgresql://test",)
+            assert kwargs["statement_cache_size"] == 1024
+            assert kwargs["server_settings"] == {"jit": "off"}
+
+    @pytest.mark.asyncio
+    async def test_save_transactions_bulk(self, repository, sample_transaction):
+        """Test saving many transactions with one unnest INSERT"""
+        repo, conn = repository
+
+        await repo.save_transactions_bulk([sample_transaction, sample_transaction])
+
+        conn.execute.assert_called_once()
+        query, *columns = conn.execute.call_args[0]
+        assert "INSERT INTO transactions" in query
+        assert "unnest" in query
+        assert len(columns) == 12
+        assert columns[0] == ["0x123abc", "0x123abc"]
+
+    @pytest.mark.asyncio
+    async def test_save_transactions_bulk_empty(self, repository):
+        """Test saving an empty batch does not touch the database"""
+        repo, conn = repository
+
+        await repo.save_transactions_bulk([])
+
+        conn.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_has_transaction_remembers_saved_hash(
+        self, repository, sample_transaction
+    ):
+        """Test a saved hash is answered without querying the database"""
+        repo, conn = repository
+
+        await repo.save_transaction(sample_transaction)
+
+        assert await repo.has_transaction("0x123abc") is True
+        conn.fetchval.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_has_transaction_queries_once(self, repository):
+        """Test a stored hash found in the database is remembered"""
+        repo, conn = repository
+        conn.fetchval.return_value = 1
+
+        assert await repo.has_transaction("0xabc") is True
+        assert await repo.has_transaction("0xabc") is True
+
+        conn.fetchval.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_has_transaction_not_found(self, repository):
+        """Test unknown hashes are not remembered"""
+        repo, conn = repository
+        conn.fetchval.return_value = None
+
+        assert await repo.has_transaction("0xabc") is False
+        assert await repo.has_transaction("0xabc") is False
+
+        assert conn.fetchval.call_count == 2
 
     @pytest.mark.asyncio
     async def test_save_transaction(self, repository, sample_transaction):
@@ -94,8 +156,8 @@ class TestPostgreSQLTransactionRepository:
         conn.execute.assert_called_once()
         call_args = conn.execute.call_args[0]
         assert "UPDATE transactions SET status" in call_args[0]
-        assert call_args[1] == "confirmed"
-        assert call_args[3] == "0x123"
+        assert "updated_at = NOW() AT TIME ZONE 'UTC'" in call_args[0]
+        assert call_args[1:] == ("confirmed", "0x123")
 
     @pytest.mark.asyncio
     async def test_update_transaction_status_not_found(self, repository):
@@ -107,26 +169,49 @@ class TestPostgreSQLTransactionRepository:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_update_transactions_status(self, repository):
+        """Test updating many transaction statuses with one statement"""
+        repo, conn = repository
+        conn.execute.return_value = "UPDATE 2"
+
+        result = await repo.update_transactions_status(["0x1", "0x2"], "confirmed")
+
+        assert result == 2
+        conn.execute.assert_called_once()
+        query, status, hashes = conn.execute.call_args[0]
+        assert "WHERE hash = ANY($2)" in query
+        assert status == "confirmed"
+        assert hashes == ["0x1", "0x2"]
+
+    @pytest.mark.asyncio
+    async def test_update_transactions_status_empty(self, repository):
+        """Test an empty update does not touch the database"""
+        repo, conn = repository
+
+        assert await repo.update_transactions_status([], "confirmed") == 0
+        conn.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_transaction_by_hash_found(self, repository, sample_transaction):
         """Test getting transaction by hash when found"""
         repo, conn = repository
 
-        # Mock database row
-        mock_row = {
-            "hash": sample_transaction.hash,
-            "asset": sample_transaction.asset,
-            "address_from": sample_transaction.address_from,
-            "address_to": sample_transaction.address_to,
-            "value": sample_transaction.value,
-            "is_token": sample_transaction.is_token,
-            "type": sample_transaction.type,
-            "status": sample_transaction.status,
-            "effective_fee": sample_transaction.effective_fee,
-            "created_at": sample_transaction.created_at,
-            "updated_at": sample_transaction.updated_at,
-            "deleted_at": sample_transaction.deleted_at,
-        }
+        # Mock database row, in _TRANSACTION_COLUMNS order
+        mock_row = (
+            sample_transaction.hash,
+            sample_transaction.asset,
+            sample_transaction.address_from,
+            sample_transaction.address_to,
+            sample_transaction.value,
+            sample_transaction.is_token,
+            sample_transaction.type,
+            sample_transaction.status,
+            sample_transaction.effective_fee,
+            sample_transaction.created_at,
+            sample_transaction.updated_at,
+            sample_transaction.deleted_at,
+        )
         conn.fetchrow.return_value = mock_row
 
         result = await repo.get_transaction_by_hash("0x123abc")
@@ -137,6 +222,59 @@ class TestPostgreSQLTransactionRepository:
         assert result.status == sample_transaction.status
         conn.fetchrow.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_transaction_by_hash_caches_terminal_status(
+        self, repository, sample_transaction
+    ):
+        """Test confirmed transactions are cached until their status is updated"""
+        repo, conn = repository
+        created_at = sample_transaction.created_at
+        conn.fetchrow.return_value = (
+            "0x123abc",
+            "eth",
+            "0xfrom",
+            "0xto",
+            1,
+            False,
+            "onchain",
+            "confirmed",
+        ) + (None, created_at, created_at, None)
+        conn.execute.return_value = "UPDATE 1"
+
+        first = await repo.get_transaction_by_hash("0x123abc")
+        second = await repo.get_transaction_by_hash("0x123abc")
+
+        assert second is first
+        conn.fetchrow.assert_called_once()
+
+        await repo.update_transaction_status("0x123abc", "failed")
+        await repo.get_transaction_by_hash("0x123abc")
+
+        assert conn.fetchrow.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_transaction_by_hash_pending_not_cached(
+        self, repository, sample_transaction
+    ):
+        """Test pending transactions are always read from the database"""
+        repo, conn = repository
+        created_at = sample_transaction.created_at
+        conn.fetchrow.return_value = (
+            "0x123abc",
+            "eth",
+            "0xfrom",
+            "0xto",
+            1,
+            False,
+            "onchain",
+            "pending",
+        ) + (None, created_at, created_at, None)
+
+        await repo.get_transaction_by_hash("0x123abc")
+        await repo.get_transaction_by_hash("0x123abc")
+
+        assert conn.fetchrow.call_count == 2
+
     @pytest.mark.asyncio
     async def test_get_transaction_by_hash_not_found(self, repository):
         """Test getting transaction by hash when not found"""
@@ -153,30 +291,32 @@ class TestPostgreSQLTransactionRepository:
         """Test listing transactions with pagination"""
         repo, conn = repository
 
-        # Mock database rows
-        mock_row = {
-            "hash": sample_transaction.hash,
-            "asset": sample_transaction.asset,
-            "address_from": sample_transaction.address_from,
-            "address_to": sample_transaction.address_to,
-            "value": sample_transaction.value,
-            "is_token": sample_transaction.is_token,
-            "type": sample_transaction.type,
-            "status": sample_transaction.status,
-            "effective_fee": sample_transaction.effective_fee,
-            "created_at": sample_transaction.created_at,
-            "updated_at": sample_transaction.updated_at,
-            "deleted_at": sample_transaction.deleted_at,
-        }
+        # Mock database rows, in _TRANSACTION_COLUMNS order
+        mock_row = (
+            sample_transaction.hash,
+            sample_transaction.asset,
+            sample_transaction.address_from,
+            sample_transaction.address_to,
+            sample_transaction.value,
+            sample_transaction.is_token,
+            sample_transaction.type,
+            sample_transaction.status,
+            sample_transaction.effective_fee,
+            sample_transaction.created_at,
+            sample_transaction.updated_at,
+            sample_transaction.deleted_at,
+        )
         conn.fetch.return_value = [mock_row, mock_row]
 
         result = await repo.list_transactions(limit=10, offset=5)
 
         assert len(result) == 2
-        assert all(isinstance(tx, TransactionEntity) for tx in result)
+        assert all(isinstance(tx, TransactionRow) for tx in result)
+        assert result[0].hash == sample_transaction.hash
+        assert result[0].value == sample_transaction.value
         conn.fetch.assert_called_once()
         call_args = conn.fetch.call_args[0]
-        assert "ORDER BY created_at DESC LIMIT" in call_args[0]
+        assert "ORDER BY created_at DESC, hash DESC LIMIT" in call_args[0]
         assert call_args[1] == 10  # limit
         assert call_args[2] == 5  # offset
 
@@ -193,26 +333,74 @@ class TestPostgreSQLTransactionRepository:
         assert call_args[1] == 100  # default limit
         assert call_args[2] == 0  # default offset
 
+    @pytest.mark.asyncio
+    async def test_list_transactions_keyset(self, repository):
+        """Test listing transactions after a keyset position"""
+        repo, conn = repository
+        conn.fetch.return_value = []
+        created_at = datetime.datetime(2025, 7, 1, 12, 0, 0)
+
+        result = await repo.list_transactions(limit=10, after=(created_at, "0xabc"))
+
+        assert result == []
+        call_args = conn.fetch.call_args[0]
+        assert "WHERE (created_at, hash) < ($2, $3)" in call_args[0]
+        assert "OFFSET" not in call_args[0]
+        assert call_args[1:] == (10, created_at, "0xabc")
+
+    @pytest.mark.asyncio
+    async def test_list_transactions_columnar(self, repository, sample_transaction):
+        """Test listing transactions as one tuple per column"""
+        repo, conn = repository
+        created_at = sample_transaction.created_at
+        rows = [
+            ("0xaaa", "eth", "0xfrom1", "0xto", 1, False, "onchain", "confirmed")
+            + (None, created_at, created_at, None),
+            ("0xbbb", "USDT", "0xfrom2", "0xto", 2, True, "onchain", "pending")
+            + (None, created_at, created_at, None),
+        ]
+        conn.fetch.return_value = rows
+
+        result = await repo.list_transactions_columnar(limit=2)
+
+        assert result["hash"] == ("0xaaa", "0xbbb")
+        assert result["asset"] == ("eth", "USDT")
+        assert result["value"] == (1, 2)
+        assert len(result) == 12
+        call_args = conn.fetch.call_args[0]
+        assert call_args[1:] == (2, 0)
+
+    @pytest.mark.asyncio
+    async def test_list_transactions_columnar_empty(self, repository):
+        """Test columnar listing keeps every column when no rows match"""
+        repo, conn = repository
+        conn.fetch.return_value = []
+
+        result = await repo.list_transactions_columnar()
+
+        assert len(result) == 12
+        assert all(values == () for values in result.values())
+
     @pytest.mark.asyncio
     async def test_get_pending_transactions(self, repository, sample_transaction):
         """Test getting pending transactions"""
         repo, conn = repository
 
-        # Mock database row
-        mock_row = {
-            "hash": sample_transaction.hash,
-            "asset": sample_transaction.asset,
-            "address_from": sample_transaction.address_from,
-            "address_to": sample_transaction.address_to,
-            "value": sample_transaction.value,
-            "is_token": sample_transaction.is_token,
-            "type": sample_transaction.type,
-            "status": "pending",
-            "effective_fee": sample_transaction.effective_fee,
-            "created_at": sample_transaction.created_at,
-            "updated_at": sample_transaction.updated_at,
-            "deleted_at": sample_transaction.deleted_at,
-        }
+        # Mock database row, in _TRANSACTION_COLUMNS order
+        mock_row = (
+            sample_transaction.hash,
+            sample_transaction.asset,
+            sample_transaction.address_from,
+            sample_transaction.address_to,
+            sample_transaction.value,
+            sample_transaction.is_token,
+            sample_transaction.type,
+            "pending",
+            sample_transaction.effective_fee,
+            sample_transaction.created_at,
+            sample_transaction.updated_at,
+            sample_transaction.deleted_at,
+        )
         conn.fetch.return_value = [mock_row]
 
         result = await repo.get_pending_transactions(max_age_hours=12)
@@ -224,6 +412,20 @@ class TestPostgreSQLTransactionRepository:
         assert "status IN ('pending', 'confirming')" in call_args[0]
         assert call_args[1] == 12  # max_age_hours
 
+    @pytest.mark.asyncio
+    async def test_get_pending_transaction_hashes(self, repository):
+        """Test getting only the hashes of pending transactions"""
+        repo, conn = repository
+        conn.fetch.return_value = [("0xaaa",), ("0xbbb",)]
+
+        result = await repo.get_pending_transaction_hashes(max_age_hours=12)
+
+        assert result == ["0xaaa", "0xbbb"]
+        query, max_age_hours = conn.fetch.call_args[0]
+        assert query.startswith("SELECT hash FROM transactions")
+        assert "status IN ('pending', 'confirming')" in query
+        assert max_age_hours == 12
+
     @pytest.mark.asyncio
     async def test_get_pending_transactions_default_age(self, repository):
         """Test getting pending transactions with default age"""
@@ -268,11 +470,23 @@ class TestPostgreSQLTransactionRepository:
         repo.get_transaction_by_hash = AsyncMock(return_value=None)
 
         mock_web3_repo = Mock()
+        mock_web3_repo.get_transaction_confirmations.return_value = 0
 
         result = await repo.get_transaction_with_confirmations("0x999", mock_web3_repo)
 
         assert result is None
-        mock_web3_repo.get_transaction_confirmations.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_transaction_with_confirmations_db_error(self, repository):
+        """Test a database error is raised even though the node call succeeded"""
+        repo, conn = repository
+        repo.get_transaction_by_hash = AsyncMock(side_effect=Exception("DB error"))
+
+        mock_web3_repo = Mock()
+        mock_web3_repo.get_transaction_confirmations.return_value = 3
+
+        with pytest.raises(Exception, match="DB error"):
+            await repo.get_transaction_with_confirmations("0x123", mock_web3_repo)
 
     @pytest.mark.asyncio
     async def test_get_transaction_with_confirmations_web3_error(
@@ -296,3 +510,61 @@ class TestPostgreSQLTransactionRepository:
         assert result["confirmations"] == 0  # Default when web3 fails
         assert result["is_confirmed"] is False
         mock_web3_repo.get_transaction_confirmations.assert_called_once_with("0x123")
+
+    @pytest.mark.asyncio
+    async def test_get_transactions_by_hashes(self, repository):
+        """Test fetching many transactions with a single query"""
+        repo, conn = repository
+        conn.fetch.return_value = []
+
+        result = await repo.get_transactions_by_hashes(["0x1", "0x2"])
+
+        assert result == []
+        query, hashes = conn.fetch.call_args[0]
+        assert "WHERE hash = ANY($1)" in query
+        assert hashes == ["0x1", "0x2"]
+
+    @pytest.mark.asyncio
+    async def test_get_many_with_confirmations(self, repository, sample_transaction):
+        """Test batch status keeps request order and skips unknown hashes"""
+        repo, conn = repository
+        repo.get_transactions_by_hashes = AsyncMock(return_value=[sample_transaction])
+
+        mock_web3_repo = Mock()
+        mock_web3_repo.get_transactions_confirmations.return_value = {
+            sample_transaction.hash: 3
+        }
+
+        result = await repo.get_many_with_confirmations(
+            ["0x999", sample_transaction.hash], mock_web3_repo
+        )
+
+        assert len(result) == 1
+        assert result[0]["hash"] == sample_transaction.hash
+        assert result[0]["confirmations"] == 3
+        assert result[0]["is_confirmed"] is True
+        mock_web3_repo.get_transactions_confirmations.assert_called_once_with(
+            [sample_transaction.hash]
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_many_with_confirmations_runs_off_loop(
+        self, repository, sample_transaction
+    ):
+        """Test the confirmations batch is run in a worker thread"""
+        repo, conn = repository
+        repo.get_transactions_by_hashes = AsyncMock(return_value=[sample_transaction])
+        mock_web3_repo = Mock()
+
+        with patch(
+            "app.infrastructure.db.transaction.postgresql_repository.asyncio.to_thread",
+            new=AsyncMock(return_value={sample_transaction.hash: 1}),
+        ) as mock_to_thread:
+            result = await repo.get_many_with_confirmations(
+                [sample_transaction.hash], mock_web3_repo
+            )
+
+        mock_to_thread.assert_awaited_once_with(
+            mock_web3_repo.get_transactions_confirmations, [sample_transaction.hash]
+        )
+        assert result[0]["confirmations"] == 1
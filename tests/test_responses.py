@@ -0,0 +1,26 @@
+import json
+from decimal import Decimal
+
+from app.application.v1.transaction.dto import TransactionDTO
+from app.shared.utils.responses import FastJSONResponse
+
+
+class TestFastJSONResponse:
+    """Test FastJSONResponse rendering"""
+
+    def test_render_models(self):
+        """Test rendering a list of Pydantic models"""
+        response = FastJSONResponse(
+            [TransactionDTO(asset="eth", address_from="0xfrom", value=Decimal("0.1"))]
+        )
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == [
+            {"asset": "eth", "address_from": "0xfrom", "value": "0.1"}
+        ]
+
+    def test_render_dicts_with_decimal(self):
+        """Test rendering plain dicts containing Decimal values"""
+        response = FastJSONResponse({"value": Decimal("1.5"), "items": []})
+
+        assert json.loads(response.body) == {"value": "1.5", "items": []}
@@ -0,0 +1,76 @@
+import asyncio
+import json
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.application.v1.transaction.handlers import (
+    check_transaction_handler,
+    list_transactions_handler,
+)
+
+
+def build_usecase(transfer_count: int):
+    usecase = Mock()
+    usecase.execute = AsyncMock(
+        return_value={
+            "tx_data": {},
+            "is_token": False,
+            "confirmations": 3,
+            "is_confirmed": True,
+            "min_confirmations_required": 1,
+            "is_destination_our_wallet": True,
+            "transfers": [{"asset": "eth", "address_from": "0xfrom", "value": 10**18}]
+            * transfer_count,
+        }
+    )
+    return usecase
+
+
+class TestCheckTransactionHandler:
+    """Test check_transaction_handler"""
+
+    @pytest.mark.asyncio
+    async def test_small_transfer_list_built_inline(self):
+        """Test few transfers are built on the event loop"""
+        with patch("asyncio.to_thread") as mock_to_thread:
+            result = await check_transaction_handler("0x123", build_usecase(2))
+
+        mock_to_thread.assert_not_called()
+        assert len(result.transfers) == 2
+        assert result.transfers[0].value == Decimal("1")
+        assert result.confirmations == 3
+
+    @pytest.mark.asyncio
+    async def test_large_transfer_list_built_in_thread(self):
+        """Test many transfers are built in a worker thread"""
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+            result = await check_transaction_handler("0x123", build_usecase(100))
+
+        mock_to_thread.assert_called_once()
+        assert len(result.transfers) == 100
+        assert result.transfers[-1].address_from == "0xfrom"
+
+
+class TestListTransactionsHandler:
+    """Test list_transactions_handler"""
+
+    @pytest.mark.asyncio
+    async def test_list_encodes_rows(self):
+        """Test rows are encoded as TransactionDTO-shaped JSON"""
+        usecase = Mock()
+        usecase.execute = AsyncMock(
+            return_value=[
+                Mock(asset="ETH", address_from="0xfrom", value=5 * 10**17),
+                Mock(asset="USDT", address_from="0xother", value=10**18),
+            ]
+        )
+
+        response = await list_transactions_handler(usecase, limit=10)
+
+        assert json.loads(response.body) == [
+            {"asset": "ETH", "address_from": "0xfrom", "value": "0.5"},
+            {"asset": "USDT", "address_from": "0xother", "value": "1"},
+        ]
+        assert "X-Next-Cursor" not in response.headers
@@ -0,0 +1,75 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.shared.monitoring.transaction_monitor import TransactionMonitorService
+
+
+class TestTransactionMonitorService:
+    """Test the pending transaction poll"""
+
+    @pytest.fixture
+    def monitor(self):
+        web3_repo = Mock()
+        db_repo = Mock()
+        db_repo.get_pending_transaction_hashes = AsyncMock()
+        db_repo.update_transactions_status = AsyncMock(return_value=1)
+        return TransactionMonitorService(web3_repo, db_repo, min_confirmations=3)
+
+    @pytest.mark.asyncio
+    async def test_check_pending_transactions_batches(self, monitor):
+        """Test one confirmations batch and one UPDATE for all pending hashes"""
+        monitor.db_repo.get_pending_transaction_hashes.return_value = ["0x1", "0x2"]
+        monitor.web3_repo.get_transactions_confirmations.return_value = {
+            "0x1": 5,
+            "0x2": 1,
+        }
+
+        await monitor._check_pending_transactions()
+
+        monitor.web3_repo.get_transactions_confirmations.assert_called_once_with(
+            ["0x1", "0x2"]
+        )
+        monitor.db_repo.update_transactions_status.assert_awaited_once_with(
+            ["0x1"], "confirmed"
+        )
+
+    @pytest.mark.asyncio
+    async def test_check_pending_transactions_splits_batches(self, monitor):
+        """Test a backlog larger than batch_size is fetched in chunks"""
+        monitor.batch_size = 2
+        monitor.db_repo.get_pending_transaction_hashes.return_value = [
+            "0x1",
+            "0x2",
+            "0x3",
+        ]
+        monitor.web3_repo.get_transactions_confirmations.side_effect = lambda hashes: {
+            tx_hash: 3 for tx_hash in hashes
+        }
+
+        await monitor._check_pending_transactions()
+
+        calls = monitor.web3_repo.get_transactions_confirmations.call_args_list
+        assert sorted(call.args[0] for call in calls) == [["0x1", "0x2"], ["0x3"]]
+        monitor.db_repo.update_transactions_status.assert_awaited_once_with(
+            ["0x1", "0x2", "0x3"], "confirmed"
+        )
+
+    @pytest.mark.asyncio
+    async def test_check_pending_transactions_none_confirmed(self, monitor):
+        """Test nothing is updated while every transaction is below the threshold"""
+        monitor.db_repo.get_pending_transaction_hashes.return_value = ["0x1"]
+        monitor.web3_repo.get_transactions_confirmations.return_value = {"0x1": 0}
+
+        await monitor._check_pending_transactions()
+
+        monitor.db_repo.update_transactions_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_check_pending_transactions_empty(self, monitor):
+        """Test the node is not called when nothing is pending"""
+        monitor.db_repo.get_pending_transaction_hashes.return_value = []
+
+        await monitor._check_pending_transactions()
+
+        monitor.web3_repo.get_transactions_confirmations.assert_not_called()
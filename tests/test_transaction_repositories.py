@@ -2,6 +2,7 @@ import datetime
 from unittest.mock import MagicMock
 
 import pytest
+from hexbytes import HexBytes
 
 from app.domain.transaction.entity import Transaction as TransactionEntity
 from app.domain.transaction.repository import TransactionRepository
@@ -74,17 +75,6 @@ import asyncio
 import types
 
 
-class AsyncContextManagerMock:
-    def __init__(self, obj):
-        self.obj = obj
-
-    async def __aenter__(self):
-        return self.obj
-
-    async def __aexit__(self, exc_type, exc, tb):
-        pass
-
-
 @pytest.mark.asyncio
 async def test_postgresql_transaction_repository_methods():
     pool = MagicMock()
@@ -105,30 +95,27 @@ async def test_postgresql_transaction_repository_methods():
         deleted_at=None,
         contract_address=None,
     )
-    conn = MagicMock()
-    pool.acquire.return_value = AsyncContextManagerMock(conn)
     from unittest.mock import AsyncMock
 
-    conn.execute = AsyncMock()
+    pool.execute = AsyncMock()
     await repo.save_transaction(tx)
-    conn.execute.assert_called()
+    pool.execute.assert_called()
     # get_transaction_by_hash
-    conn.fetchrow = AsyncMock(
-        return_value={
-            "hash": "0xhash",
-            "asset": "ETH",
-            "address_from": "0xfrom",
-            "address_to": "0xto",
-            "value": 1,
-            "is_token": False,
-            "type": "onchain",
-            "status": "pending",
-            "effective_fee": 1,
-            "created_at": datetime.datetime.now(),
-            "updated_at": datetime.datetime.now(),
-            "deleted_at": None,
-            "contract_address": None,
-        }
+    pool.fetchrow = AsyncMock(
+        return_value=(
+            "0xhash",
+            "ETH",
+            "0xfrom",
+            "0xto",
+            1,
+            False,
+            "onchain",
+            "pending",
+            1,
+            datetime.datetime.now(),
+            datetime.datetime.now(),
+            None,
+        )
     )
     result = await repo.get_transaction_by_hash("0xhash")
     assert result.hash == "0xhash"
@@ -225,18 +212,14 @@ def test_web3_transaction_repository_get_transaction_transfers_token():
     web3.eth.get_transaction.return_value = tx
     # Receipt com um log de token
     log = MagicMock()
-    topic0 = MagicMock()
-    # Fix: Return without 0x prefix to match the implementation
-    topic0.hex.return_value = (
-        "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+    topic0 = HexBytes(
+        "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
     )
-    topic1 = MagicMock()
-    topic1.hex.return_value = (
-        "0000000000000000000000001111111111111111111111111111111111111111"
+    topic1 = HexBytes(
+        "0x0000000000000000000000001111111111111111111111111111111111111111"
     )
-    topic2 = MagicMock()
-    topic2.hex.return_value = (
-        "0000000000000000000000002222222222222222222222222222222222222222"
+    topic2 = HexBytes(
+        "0x0000000000000000000000002222222222222222222222222222222222222222"
     )
     log.topics = [topic0, topic1, topic2]
     # Fix: Return bytes instead of hex string to match real Web3 behavior
@@ -270,35 +253,27 @@ def test_web3_transaction_repository_get_transaction_transfers_multiple_tokens()
     web3.eth.get_transaction.return_value = tx
     # Receipt com dois logs de token
     log1 = MagicMock()
-    topic0_1 = MagicMock()
-    # Fix: Return without 0x prefix to match the implementation
-    topic0_1.hex.return_value = (
-        "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+    topic0_1 = HexBytes(
+        "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
     )
-    topic1_1 = MagicMock()
-    topic1_1.hex.return_value = (
-        "000000000000000000000000aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
+    topic1_1 = HexBytes(
+        "0x000000000000000000000000aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
     )
-    topic2_1 = MagicMock()
-    topic2_1.hex.return_value = (
-        "000000000000000000000000bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb"
+    topic2_1 = HexBytes(
+        "0x000000000000000000000000bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb"
     )
     log1.topics = [topic0_1, topic1_1, topic2_1]
     # Fix: Return bytes instead of hex string to match real Web3 behavior
     log1.data = bytes.fromhex("01f4")  # 500 em hexadecimal como bytes (pad com zero)
     log2 = MagicMock()
-    topic0_2 = MagicMock()
-    # Fix: Return without 0x prefix to match the implementation
-    topic0_2.hex.return_value = (
-        "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+    topic0_2 = HexBytes(
+        "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
     )
-    topic1_2 = MagicMock()
-    topic1_2.hex.return_value = (
-        "000000000000000000000000cccccccccccccccccccccccccccccccccccccccc"
+    topic1_2 = HexBytes(
+        "0x000000000000000000000000cccccccccccccccccccccccccccccccccccccccc"
     )
-    topic2_2 = MagicMock()
-    topic2_2.hex.return_value = (
-        "000000000000000000000000dddddddddddddddddddddddddddddddddddddddd"
+    topic2_2 = HexBytes(
+        "0x000000000000000000000000dddddddddddddddddddddddddddddddddddddddd"
     )
     log2.topics = [topic0_2, topic1_2, topic2_2]
     # Fix: Return bytes instead of hex string to match real Web3 behavior
@@ -327,3 +302,32 @@ def test_web3_transaction_repository_get_transaction_transfers_multiple_tokens()
         transfers[1]["to"].lower().endswith("dddddddddddddddddddddddddddddddddddddddd")
     )
     assert transfers[1]["value"] == 1500
+
+
+def test_web3_transaction_repository_get_transaction_transfers_hex_string_data():
+    web3 = MagicMock()
+    tx = MagicMock()
+    tx.value = 0
+    web3.eth.get_transaction.return_value = tx
+    log = MagicMock()
+    log.topics = [
+        HexBytes("0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"),
+        HexBytes("0x" + "00" * 12 + "11" * 20),
+        HexBytes("0x" + "00" * 12 + "22" * 20),
+    ]
+    # Some providers return data as a 0x-prefixed hex string
+    log.data = "0x" + (10**18).to_bytes(32, "big").hex()
+    receipt = MagicMock()
+    receipt.logs = [log]
+    web3.eth.get_transaction_receipt.return_value = receipt
+    repo = Web3TransactionRepository(web3)
+    transfers = repo.get_transaction_transfers("0xabc")
+    assert transfers == [
+        {
+            "asset": "token",
+            "from": "0x" + "11" * 20,
+            "address_from": "0x" + "11" * 20,
+            "to": "0x" + "22" * 20,
+            "value": 10**18,
+        }
+    ]
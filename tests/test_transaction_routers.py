@@ -0,0 +1,53 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+
+from app.application.v1.transaction.routers import parse_onchain_request_body
+
+
+def build_request(body: bytes):
+    request = Mock()
+    request.body = AsyncMock(return_value=body)
+    return request
+
+
+class TestParseOnChainRequestBody:
+    """Test POST /v1/transaction body parsing"""
+
+    @pytest.mark.asyncio
+    async def test_parse_valid_body(self):
+        """Test a valid JSON body is parsed into the request model"""
+        request = build_request(
+            b'{"address_from": "0xfrom", "address_to": "0xto", '
+            b'"asset": "ETH", "value": 0.1}'
+        )
+
+        result = await parse_onchain_request_body(request)
+
+        assert result.address_from == "0xfrom"
+        assert result.value == Decimal("0.1")
+        assert result.contract_address is None
+
+    @pytest.mark.asyncio
+    async def test_parse_invalid_body(self):
+        """Test validation errors are reported as 422 errors located in the body"""
+        request = build_request(
+            b'{"address_from": "0xfrom", "asset": "ETH", "value": "-1"}'
+        )
+
+        with pytest.raises(RequestValidationError) as exc_info:
+            await parse_onchain_request_body(request)
+
+        locations = {error["loc"] for error in exc_info.value.errors()}
+        assert ("body", "address_to") in locations
+        assert ("body", "value") in locations
+
+    @pytest.mark.asyncio
+    async def test_parse_malformed_json(self):
+        """Test malformed JSON is rejected"""
+        request = build_request(b"{not json")
+
+        with pytest.raises(RequestValidationError):
+            await parse_onchain_request_body(request)
@@ -0,0 +1,93 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+from pydantic_core import SchemaSerializer, SchemaValidator
+
+from app.application.v1.transaction.dto import TransactionDTO
+from app.application.v1.transaction.schemas import (
+    TransactionHashResponse,
+    TransactionOnChainRequest,
+    TransactionOnChainResponse,
+    TransactionStatusBatchRequest,
+)
+from app.shared.utils.validators import _exact_wei
+
+VALID_FROM_ADDRESS = "0x742d35Cc6634C0532925a3b8D0C9964b8d7B1234"
+VALID_TO_ADDRESS = "0xC2DBAAF3E4944EDE0DEF95D9D1A129AED2F74587"
+
+
+def build_request(value):
+    return TransactionOnChainRequest(
+        address_from=VALID_FROM_ADDRESS,
+        address_to=VALID_TO_ADDRESS,
+        asset="ETH",
+        value=value,
+    )
+
+
+class TestTransactionOnChainRequest:
+    """Test TransactionOnChainRequest value parsing"""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("0.5", Decimal("0.5")),
+            (0.1, Decimal("0.1")),
+            (1000, Decimal("1000")),
+            ("1e-6", Decimal("0.000001")),
+        ],
+    )
+    def test_value_parsed_to_decimal(self, value, expected):
+        """Test numbers and strings are parsed into an exact Decimal"""
+        request = build_request(value)
+        assert isinstance(request.value, Decimal)
+        assert request.value == expected
+
+    def test_get_value_in_wei_is_exact(self):
+        """Test float input does not lose precision when converted to Wei"""
+        assert build_request(0.1).get_value_in_wei() == 100000000000000000
+
+    @pytest.mark.parametrize("value", ["1.25", 0.1, 1000, "1e-6"])
+    def test_get_value_in_wei_uses_integer_path(self, value):
+        """Test request Decimals are converted without the Decimal multiply"""
+        request = build_request(value)
+
+        with patch(
+            "app.shared.utils.validators._exact_wei", wraps=_exact_wei
+        ) as exact_wei:
+            wei_value = request.get_value_in_wei()
+
+        exact_wei.assert_called_once_with(request.value)
+        assert _exact_wei(request.value) == wei_value
+        assert wei_value == int(request.value * 10**18)
+
+    @pytest.mark.parametrize("value", ["0", "-1", "NaN", "Infinity", "invalid"])
+    def test_invalid_value_rejected(self, value):
+        """Test non-positive, non-finite and malformed values are rejected"""
+        with pytest.raises(ValidationError):
+            build_request(value)
+
+
+def test_status_batch_request_normalizes_hashes():
+    """Test batch hashes are normalized once at the request boundary"""
+    request = TransactionStatusBatchRequest(hashes=["ABC", "0xdef"])
+
+    assert request.hashes == ["0xabc", "0xdef"]
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        TransactionDTO,
+        TransactionHashResponse,
+        TransactionOnChainRequest,
+        TransactionOnChainResponse,
+    ],
+)
+def test_models_built_at_import(model):
+    """Test core schemas are compiled at import, not on the first request"""
+    assert model.__pydantic_complete__ is True
+    assert isinstance(model.__pydantic_validator__, SchemaValidator)
+    assert isinstance(model.__pydantic_serializer__, SchemaSerializer)
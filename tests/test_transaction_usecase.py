@@ -2,6 +2,8 @@ import datetime
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from fastapi import HTTPException
+from hexbytes import HexBytes
 from web3 import Web3
 
 from app.application.v1.transaction.schemas import TransactionOnChainRequest
@@ -9,12 +11,13 @@ from app.application.v1.transaction.usecase import (
     CreateOnChainTransaction,
     GetTransactionHash,
     ListTransactions,
+    decode_cursor,
+    encode_cursor,
 )
-from app.domain.wallet.entity import Wallet
 
 # Valid Ethereum addresses for testing
 VALID_FROM_ADDRESS = "0x742d35Cc6634C0532925a3b8D0C9964b8d7B1234"
-VALID_TO_ADDRESS = "0x8ba1f109551bD432803012645Hac136c0c8b5678"
+VALID_TO_ADDRESS = "0x8ba1f109551bd432803012645aac136c0c8b5678"
 VALID_CONTRACT_ADDRESS = "0xA0b86a33E6441D6B1c5d8b1d8e4a8B2c3d4e5f90"
 
 
@@ -24,7 +27,6 @@ def mock_web3_repo():
     web3 = Mock()
     web3.eth.get_transaction_count.return_value = 1
     web3.eth.gas_price = 100_000_000_000  # 100 gwei
-    web3.eth.chain_id = 1
     web3.eth.get_balance.return_value = 10**18  # 1 ETH
     web3.eth.max_priority_fee = 2000000000  # 2 gwei
     web3.eth.estimate_gas.return_value = 21000
@@ -40,13 +42,8 @@ def mock_web3_repo():
     send_result.hex.return_value = "0x" + "abcdef" * 16
     web3.eth.send_raw_transaction.return_value = send_result
 
-    web3.eth.contract.return_value.functions.transfer.return_value.build_transaction.return_value = {
-        "data": "0xdata",
-        "gas": 0,
-        "gasPrice": 0,
-    }
-
     repo.web3 = web3
+    repo.chain_id = 1
     return repo
 
 
@@ -60,10 +57,17 @@ def mock_db_repo():
 @pytest.fixture
 def mock_wallet_repo():
     repo = Mock()
-    repo.get_wallet_by_address = AsyncMock()
+    repo.get_wallets_by_addresses = AsyncMock(return_value=set())
     return repo
 
 
+@pytest.fixture
+def mock_wallet_cache():
+    cache = Mock()
+    cache.get = AsyncMock(return_value=frozenset())
+    return cache
+
+
 @pytest.fixture
 def mock_vault_service():
     vault = Mock()
@@ -136,6 +140,41 @@ async def test_create_token_transaction(
     assert resp.effective_fee > 0
     mock_db_repo.save_transaction.assert_called_once()
     mock_vault_service.get_private_key.assert_called_once()
+    signed_tx = mock_web3_repo.web3.eth.account.sign_transaction.call_args[0][0]
+    assert signed_tx["data"].startswith("0xa9059cbb")
+    assert signed_tx["data"][-64:] == hex(1000 * 10**18)[2:].zfill(64)
+
+
+@pytest.mark.asyncio
+@patch("app.application.v1.transaction.usecase.Web3")
+async def test_create_token_transaction_known_gas_limit(
+    mock_web3_class,
+    mock_web3_repo,
+    mock_db_repo,
+    mock_vault_service,
+    mock_wallet_service,
+):
+    mock_web3_class.to_checksum_address.side_effect = lambda x: x
+
+    usecase = CreateOnChainTransaction(
+        mock_web3_repo,
+        mock_db_repo,
+        mock_vault_service,
+        mock_wallet_service,
+        token_gas_limits={VALID_CONTRACT_ADDRESS.lower(): 65000},
+    )
+    req = TransactionOnChainRequest(
+        address_from=VALID_FROM_ADDRESS,
+        address_to=VALID_TO_ADDRESS,
+        asset="USDT",
+        value=1000,
+        contract_address=VALID_CONTRACT_ADDRESS,
+    )
+    await usecase.execute(req)
+
+    signed_tx = mock_web3_repo.web3.eth.account.sign_transaction.call_args[0][0]
+    assert signed_tx["gas"] == 65000
+    mock_web3_repo.web3.eth.estimate_gas.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -193,16 +232,16 @@ async def test_missing_fields(
 
 @pytest.mark.asyncio
 async def test_get_transaction_hash_valid_eth(
-    mock_web3_repo, mock_wallet_repo, mock_db_repo
+    mock_web3_repo, mock_wallet_repo, mock_db_repo, mock_wallet_cache
 ):
-    mock_wallet_repo.get_wallet_by_address.return_value = None
-    mock_db_repo.get_transaction_by_hash = AsyncMock(return_value=None)
+    mock_db_repo.has_transaction = AsyncMock(return_value=False)
 
     usecase = GetTransactionHash(
         "0x" + "a" * 64,
         mock_web3_repo,
         mock_wallet_repo,
         mock_db_repo,
+        mock_wallet_cache,
         min_confirmations=6,
     )
     mock_web3_repo.is_valid_transaction.return_value = True
@@ -223,28 +262,19 @@ async def test_get_transaction_hash_valid_eth(
     assert result["is_confirmed"] is True
     assert result["min_confirmations_required"] == 6
     assert result["is_destination_our_wallet"] is False
+    mock_web3_repo.get_transaction_transfers.assert_not_called()
+    mock_wallet_cache.get.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_get_transaction_hash_our_wallet_destination(
-    mock_web3_repo, mock_wallet_repo, mock_db_repo
+    mock_web3_repo, mock_wallet_repo, mock_db_repo, mock_wallet_cache
 ):
-    # Configure AsyncMock to return None for FROM address and Wallet for TO address
-    # Fix: Account for address normalization to lowercase
-    async def mock_get_wallet_by_address(address):
-        if address.lower() == VALID_TO_ADDRESS.lower():
-            return Wallet(
-                address=VALID_TO_ADDRESS,
-                created_at=datetime.datetime.now(),
-                updated_at=datetime.datetime.now(),
-                deleted_at=None,
-            )
-        return None
-
-    mock_wallet_repo.get_wallet_by_address = AsyncMock(
-        side_effect=mock_get_wallet_by_address
+    # Only the TO address is one of our wallets
+    mock_wallet_cache.get = AsyncMock(
+        return_value=frozenset({VALID_TO_ADDRESS.lower()})
     )
-    mock_db_repo.get_transaction_by_hash = AsyncMock(return_value=None)
+    mock_db_repo.has_transaction = AsyncMock(return_value=False)
     mock_db_repo.save_transaction = AsyncMock()
 
     usecase = GetTransactionHash(
@@ -252,6 +282,7 @@ async def test_get_transaction_hash_our_wallet_destination(
         mock_web3_repo,
         mock_wallet_repo,
         mock_db_repo,
+        mock_wallet_cache,
         min_confirmations=6,
     )
     mock_web3_repo.is_valid_transaction.return_value = True
@@ -267,21 +298,21 @@ async def test_get_transaction_hash_our_wallet_destination(
     }
     result = await usecase.execute("0x" + "a" * 64)
     assert result["is_destination_our_wallet"] is True
-    # Verify both addresses were checked (now with lowercase normalization)
-    assert mock_wallet_repo.get_wallet_by_address.call_count == 2
-    mock_wallet_repo.get_wallet_by_address.assert_any_call(VALID_FROM_ADDRESS.lower())
-    mock_wallet_repo.get_wallet_by_address.assert_any_call(VALID_TO_ADDRESS.lower())
+    # A snapshot hit is answered without a wallet query
+    mock_wallet_cache.get.assert_awaited_once()
+    mock_wallet_repo.get_wallets_by_addresses.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_get_transaction_hash_insufficient_confirmations(
-    mock_web3_repo, mock_wallet_repo, mock_db_repo
+    mock_web3_repo, mock_wallet_repo, mock_db_repo, mock_wallet_cache
 ):
     usecase = GetTransactionHash(
         "0x" + "d" * 64,
         mock_web3_repo,
         mock_wallet_repo,
         mock_db_repo,
+        mock_wallet_cache,
         min_confirmations=6,
     )
     mock_web3_repo.get_transaction.return_value = None
@@ -292,16 +323,16 @@ async def test_get_transaction_hash_insufficient_confirmations(
 
 @pytest.mark.asyncio
 async def test_get_transaction_hash_no_confirmation_required(
-    mock_web3_repo, mock_wallet_repo, mock_db_repo
+    mock_web3_repo, mock_wallet_repo, mock_db_repo, mock_wallet_cache
 ):
-    mock_wallet_repo.get_wallet_by_address = AsyncMock(return_value=None)
-    mock_db_repo.get_transaction_by_hash = AsyncMock(return_value=None)
+    mock_db_repo.has_transaction = AsyncMock(return_value=False)
 
     usecase = GetTransactionHash(
         "0x" + "e" * 64,
         mock_web3_repo,
         mock_wallet_repo,
         mock_db_repo,
+        mock_wallet_cache,
         min_confirmations=0,
     )
     mock_web3_repo.is_valid_transaction.return_value = True
@@ -324,16 +355,16 @@ async def test_get_transaction_hash_no_confirmation_required(
 
 @pytest.mark.asyncio
 async def test_get_transaction_hash_valid_token(
-    mock_web3_repo, mock_wallet_repo, mock_db_repo
+    mock_web3_repo, mock_wallet_repo, mock_db_repo, mock_wallet_cache
 ):
-    mock_wallet_repo.get_wallet_by_address = AsyncMock(return_value=None)
-    mock_db_repo.get_transaction_by_hash = AsyncMock(return_value=None)
+    mock_db_repo.has_transaction = AsyncMock(return_value=False)
 
     usecase = GetTransactionHash(
         "0x" + "b" * 64,
         mock_web3_repo,
         mock_wallet_repo,
         mock_db_repo,
+        mock_wallet_cache,
         min_confirmations=6,
     )
     mock_web3_repo.is_valid_transaction.return_value = True
@@ -361,18 +392,59 @@ async def test_get_transaction_hash_valid_token(
     assert result["tx_hash"] == "0x" + "b" * 64
     assert result["is_token"] is True
     assert result["tx_data"]["value"] == 0
+    assert "input" not in result["tx_data"]
     assert result["is_destination_our_wallet"] is False
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "input_data, is_token",
+    [(HexBytes(b""), False), (HexBytes(b"\x01"), True), (HexBytes("0xa9059cbb"), True)],
+)
+async def test_get_transaction_hash_hexbytes_input(
+    mock_web3_repo,
+    mock_wallet_repo,
+    mock_db_repo,
+    mock_wallet_cache,
+    input_data,
+    is_token,
+):
+    mock_db_repo.has_transaction = AsyncMock(return_value=False)
+    mock_web3_repo.get_transaction_confirmations.return_value = 1
+    mock_web3_repo.get_transaction_transfers.return_value = []
+    mock_web3_repo.get_token_symbol.return_value = "USDT"
+    mock_web3_repo.get_transaction.return_value = {
+        "input": input_data,
+        "value": 0,
+        "to": VALID_CONTRACT_ADDRESS,
+        "from": VALID_FROM_ADDRESS,
+        "hash": "0x" + "b" * 64,
+    }
+    usecase = GetTransactionHash(
+        "0x" + "b" * 64,
+        mock_web3_repo,
+        mock_wallet_repo,
+        mock_db_repo,
+        mock_wallet_cache,
+        min_confirmations=6,
+    )
+
+    result = await usecase.execute("0x" + "b" * 64)
+
+    # Even a single byte of calldata is a contract call
+    assert result["is_token"] is is_token
+
+
 @pytest.mark.asyncio
 async def test_get_transaction_hash_not_found(
-    mock_web3_repo, mock_wallet_repo, mock_db_repo
+    mock_web3_repo, mock_wallet_repo, mock_db_repo, mock_wallet_cache
 ):
     usecase = GetTransactionHash(
         "0x" + "c" * 64,
         mock_web3_repo,
         mock_wallet_repo,
         mock_db_repo,
+        mock_wallet_cache,
         min_confirmations=0,
     )
     mock_web3_repo.get_transaction.return_value = None
@@ -383,10 +455,9 @@ async def test_get_transaction_hash_not_found(
 
 @pytest.mark.asyncio
 async def test_get_transaction_hash_multiple_transfers(
-    mock_web3_repo, mock_wallet_repo, mock_db_repo
+    mock_web3_repo, mock_wallet_repo, mock_db_repo, mock_wallet_cache
 ):
-    mock_wallet_repo.get_wallet_by_address = AsyncMock(return_value=None)
-    mock_db_repo.get_transaction_by_hash = AsyncMock(return_value=None)
+    mock_db_repo.has_transaction = AsyncMock(return_value=False)
 
     # Simula múltiplas transferências (ETH + 2 tokens)
     mock_web3_repo.is_valid_transaction.return_value = True
@@ -415,6 +486,7 @@ async def test_get_transaction_hash_multiple_transfers(
         mock_web3_repo,
         mock_wallet_repo,
         mock_db_repo,
+        mock_wallet_cache,
         min_confirmations=6,
     )
     result = await usecase.execute("0x" + "f" * 64)
@@ -422,3 +494,107 @@ async def test_get_transaction_hash_multiple_transfers(
     assert result["transfers"][0]["asset"] == "eth"
     assert result["transfers"][1]["asset"] == "token"
     assert result["transfers"][2]["value"] == 1500
+
+
+@pytest.mark.asyncio
+async def test_get_transaction_hash_picks_largest_incoming_transfer(
+    mock_web3_repo, mock_wallet_repo, mock_db_repo, mock_wallet_cache
+):
+    # Two transfers land in our wallets; the larger one is recorded
+    our_small = "0x00000000000000000000000000000000000000a1"
+    our_large = "0x00000000000000000000000000000000000000a2"
+    mock_wallet_cache.get = AsyncMock(return_value=frozenset({our_small, our_large}))
+    mock_db_repo.has_transaction = AsyncMock(return_value=False)
+    mock_db_repo.save_transaction = AsyncMock()
+    mock_web3_repo.get_transaction_confirmations.return_value = 10
+    mock_web3_repo.get_token_symbol.return_value = "USDT"
+    mock_web3_repo.get_transaction.return_value = {
+        "input": "0xa9059cbb",
+        "value": 0,
+        "to": VALID_CONTRACT_ADDRESS,
+        "from": VALID_FROM_ADDRESS,
+        "hash": "0x" + "f" * 64,
+    }
+    mock_web3_repo.get_transaction_transfers.return_value = [
+        {"asset": "USDT", "from": VALID_FROM_ADDRESS, "to": our_small, "value": 5},
+        {"asset": "USDT", "from": VALID_FROM_ADDRESS, "to": our_large, "value": 50},
+    ]
+    usecase = GetTransactionHash(
+        "0x" + "f" * 64,
+        mock_web3_repo,
+        mock_wallet_repo,
+        mock_db_repo,
+        mock_wallet_cache,
+        min_confirmations=6,
+    )
+
+    result = await usecase.execute("0x" + "f" * 64)
+
+    assert result["is_destination_our_wallet"] is True
+    saved = mock_db_repo.save_transaction.call_args[0][0]
+    assert saved.address_to == our_large
+    assert saved.value == 50
+    assert saved.type == "deposit"
+    mock_wallet_cache.get.assert_awaited_once()
+
+
+def test_cursor_round_trip():
+    created_at = datetime.datetime(2025, 7, 1, 12, 30, 15, 123456)
+    cursor = encode_cursor(created_at, "0x" + "a" * 64)
+    assert decode_cursor(cursor) == (created_at, "0x" + "a" * 64)
+
+
+def test_decode_invalid_cursor():
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor("not-a-cursor")
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_transactions_with_cursor(mock_db_repo):
+    created_at = datetime.datetime(2025, 7, 1, 12, 0, 0)
+    mock_db_repo.list_transactions = AsyncMock(return_value=[])
+
+    usecase = ListTransactions(mock_db_repo)
+    result = await usecase.execute(limit=20, cursor=encode_cursor(created_at, "0xabc"))
+
+    assert result == []
+    mock_db_repo.list_transactions.assert_called_once_with(
+        limit=20, after=(created_at, "0xabc")
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_transaction_hash_confirms_snapshot_miss(
+    mock_web3_repo, mock_wallet_repo, mock_db_repo, mock_wallet_cache
+):
+    # The destination was created by another process after the last reload
+    mock_wallet_repo.get_wallets_by_addresses = AsyncMock(
+        return_value={VALID_TO_ADDRESS.lower()}
+    )
+    mock_db_repo.has_transaction = AsyncMock(return_value=False)
+    mock_web3_repo.get_transaction_confirmations.return_value = 10
+    mock_web3_repo.get_transaction.return_value = {
+        "input": "0x",
+        "value": 1000000000000000000,
+        "to": VALID_TO_ADDRESS,
+        "from": VALID_FROM_ADDRESS,
+        "hash": "0x" + "a" * 64,
+    }
+    usecase = GetTransactionHash(
+        "0x" + "a" * 64,
+        mock_web3_repo,
+        mock_wallet_repo,
+        mock_db_repo,
+        mock_wallet_cache,
+        min_confirmations=6,
+    )
+
+    result = await usecase.execute("0x" + "a" * 64)
+
+    assert result["is_destination_our_wallet"] is True
+    mock_db_repo.save_transaction.assert_called_once()
+    (addresses,) = mock_wallet_repo.get_wallets_by_addresses.call_args[0]
+    assert sorted(addresses) == sorted(
+        [VALID_FROM_ADDRESS.lower(), VALID_TO_ADDRESS.lower()]
+    )
@@ -11,7 +11,6 @@ from app.application.v1.transaction.usecase import (
     ListTransactions,
 )
 from app.domain.transaction.entity import Transaction as TransactionEntity
-from app.domain.wallet.entity import Wallet
 
 
 class TestGetTransactionHashErrors:
@@ -22,6 +21,7 @@ class TestGetTransactionHashErrors:
         """Create mock repositories"""
         web3_repo = Mock()
         wallet_repo = AsyncMock()
+        wallet_repo.get_wallets_by_addresses.return_value = set()
         db_repo = AsyncMock()
         return web3_repo, wallet_repo, db_repo
 
@@ -29,26 +29,17 @@ class TestGetTransactionHashErrors:
     def usecase(self, mock_repositories):
         """Create GetTransactionHash usecase with mocks"""
         web3_repo, wallet_repo, db_repo = mock_repositories
+        wallet_cache = Mock()
+        wallet_cache.get = AsyncMock(return_value=frozenset())
         return GetTransactionHash(
             tx_hash="0x123abc",
             web3_repo=web3_repo,
             wallet_repo=wallet_repo,
             db_repo=db_repo,
+            wallet_cache=wallet_cache,
             min_confirmations=12,
         )
 
-    @pytest.mark.asyncio
-    async def test_validate_destination_address_error(self, usecase):
-        """Test validate_destination_address with database error"""
-        usecase.wallet_repo.get_wallet_by_address.side_effect = Exception(
-            "Database error"
-        )
-
-        result = await usecase.validate_destination_address("0x123")
-
-        assert result is False
-        usecase.wallet_repo.get_wallet_by_address.assert_called_once_with("0x123")
-
     @pytest.mark.asyncio
     async def test_execute_transaction_not_found(self, usecase):
         """Test execute when transaction is not found"""
@@ -87,7 +78,6 @@ class TestGetTransactionHashErrors:
             "Token transfer parsing error"
         )
         usecase.web3_repo.get_transaction_confirmations.return_value = 15
-        usecase.wallet_repo.get_wallet_by_address.return_value = None
 
         with pytest.raises(Exception, match="Token transfer parsing error"):
             await usecase.execute("0x123abc")
@@ -104,21 +94,11 @@ class TestGetTransactionHashErrors:
             "input": "0x",
         }
 
-        # Mock wallet exists (to trigger save)
-        mock_wallet = Wallet(
-            address="0xto123",
-            created_at=datetime.datetime.now(),
-            updated_at=datetime.datetime.now(),
-            deleted_at=None,
-        )
-
         usecase.web3_repo.get_transaction.return_value = tx_data
         usecase.web3_repo.get_transaction_confirmations.return_value = 15
-        usecase.wallet_repo.get_wallet_by_address.side_effect = [
-            None,
-            mock_wallet,
-        ]  # from=None, to=wallet
-        usecase.db_repo.get_transaction_by_hash.return_value = None
+        # Destination wallet exists (to trigger save), source is external
+        usecase.wallet_cache.get.return_value = frozenset({"0xto123"})
+        usecase.db_repo.has_transaction.return_value = False
         usecase.db_repo.save_transaction.side_effect = Exception("Database save error")
 
         with pytest.raises(Exception, match="Database save error"):
@@ -154,27 +134,11 @@ class TestGetTransactionHashErrors:
             "input": "0x",
         }
 
-        # Both wallets exist
-        mock_wallet_from = Wallet(
-            address="0xfrom123",
-            created_at=datetime.datetime.now(),
-            updated_at=datetime.datetime.now(),
-            deleted_at=None,
-        )
-        mock_wallet_to = Wallet(
-            address="0xto123",
-            created_at=datetime.datetime.now(),
-            updated_at=datetime.datetime.now(),
-            deleted_at=None,
-        )
-
         usecase.web3_repo.get_transaction.return_value = tx_data
         usecase.web3_repo.get_transaction_confirmations.return_value = 15
-        usecase.wallet_repo.get_wallet_by_address.side_effect = [
-            mock_wallet_from,
-            mock_wallet_to,
-        ]
-        usecase.db_repo.get_transaction_by_hash.return_value = None
+        # Both wallets exist
+        usecase.wallet_cache.get.return_value = frozenset({"0xfrom123", "0xto123"})
+        usecase.db_repo.has_transaction.return_value = False
 
         result = await usecase.execute("0x123abc")
 
@@ -201,6 +165,7 @@ class TestCreateOnChainTransactionErrors:
         # Mock Web3 instance
         mock_web3 = Mock()
         web3_repo.web3 = mock_web3
+        web3_repo.chain_id = 1
 
         return web3_repo, db_repo, vault_service, wallet_service, mock_web3
 
@@ -253,7 +218,6 @@ class TestCreateOnChainTransactionErrors:
         # Mock Web3 responses
         mock_web3.to_checksum_address.side_effect = lambda x: x
         mock_web3.eth.get_transaction_count.return_value = 1
-        mock_web3.eth.chain_id = 1
         mock_web3.eth.get_balance.return_value = 0  # Zero balance
 
         with pytest.raises(HTTPException) as exc_info:
@@ -272,7 +236,6 @@ class TestCreateOnChainTransactionErrors:
         # Mock Web3 responses
         mock_web3.to_checksum_address.side_effect = lambda x: x
         mock_web3.eth.get_transaction_count.return_value = 1
-        mock_web3.eth.chain_id = 1
         mock_web3.eth.get_balance.return_value = 100000000000000000  # 0.1 ETH
         mock_web3.eth.gas_price = 20000000000  # 20 gwei
         mock_web3.eth.max_priority_fee = 2000000000  # 2 gwei
@@ -302,7 +265,6 @@ class TestCreateOnChainTransactionErrors:
         # Mock sufficient ETH balance
         mock_web3.to_checksum_address.side_effect = lambda x: x
         mock_web3.eth.get_transaction_count.return_value = 1
-        mock_web3.eth.chain_id = 1
         mock_web3.eth.get_balance.return_value = 1000000000000000000  # 1 ETH
         mock_web3.eth.gas_price = 20000000000
         mock_web3.eth.max_priority_fee = 2000000000
@@ -329,19 +291,13 @@ class TestCreateOnChainTransactionErrors:
         # Mock responses
         mock_web3.to_checksum_address.side_effect = lambda x: x
         mock_web3.eth.get_transaction_count.return_value = 1
-        mock_web3.eth.chain_id = 1
         mock_web3.eth.get_balance.return_value = (
             1000000000000000  # 0.001 ETH (very low)
         )
         mock_web3.eth.gas_price = 100000000000  # 100 gwei (very high gas price)
         mock_web3.eth.max_priority_fee = 10000000000  # 10 gwei
 
-        # Mock contract and gas estimation
-        mock_contract = Mock()
-        mock_contract.functions.transfer.return_value.build_transaction.return_value = {
-            "data": "0xabcd"
-        }
-        mock_web3.eth.contract.return_value = mock_contract
+        # Mock gas estimation
         mock_web3.eth.estimate_gas.return_value = 200000  # Very high gas limit
 
         with pytest.raises(HTTPException) as exc_info:
@@ -360,7 +316,6 @@ class TestCreateOnChainTransactionErrors:
         # Mock successful Web3 setup
         mock_web3.to_checksum_address.side_effect = lambda x: x
         mock_web3.eth.get_transaction_count.return_value = 1
-        mock_web3.eth.chain_id = 1
         mock_web3.eth.get_balance.return_value = 10000000000000000000  # 10 ETH
         mock_web3.eth.gas_price = 20000000000
         mock_web3.eth.max_priority_fee = 2000000000
@@ -386,7 +341,6 @@ class TestCreateOnChainTransactionErrors:
         # Mock successful Web3 setup
         mock_web3.to_checksum_address.side_effect = lambda x: x
         mock_web3.eth.get_transaction_count.return_value = 1
-        mock_web3.eth.chain_id = 1
         mock_web3.eth.get_balance.return_value = 10000000000000000000  # 10 ETH
         mock_web3.eth.gas_price = 20000000000
         mock_web3.eth.max_priority_fee = 2000000000
@@ -410,7 +364,6 @@ class TestCreateOnChainTransactionErrors:
         # Mock successful Web3 setup
         mock_web3.to_checksum_address.side_effect = lambda x: x
         mock_web3.eth.get_transaction_count.return_value = 1
-        mock_web3.eth.chain_id = 1
         mock_web3.eth.get_balance.return_value = 10000000000000000000  # 10 ETH
         mock_web3.eth.gas_price = 20000000000
         mock_web3.eth.max_priority_fee = 2000000000
@@ -440,7 +393,6 @@ class TestCreateOnChainTransactionErrors:
         # Mock successful Web3 setup and transaction
         mock_web3.to_checksum_address.side_effect = lambda x: x
         mock_web3.eth.get_transaction_count.return_value = 1
-        mock_web3.eth.chain_id = 1
         mock_web3.eth.get_balance.return_value = 10000000000000000000  # 10 ETH
         mock_web3.eth.gas_price = 20000000000
         mock_web3.eth.max_priority_fee = 2000000000
@@ -472,7 +424,6 @@ class TestCreateOnChainTransactionErrors:
         # Mock Web3 responses
         mock_web3.to_checksum_address.side_effect = lambda x: x
         mock_web3.eth.get_transaction_count.return_value = 1
-        mock_web3.eth.chain_id = 1
         mock_web3.eth.get_balance.return_value = 10000000000000000000  # 10 ETH
         mock_web3.eth.gas_price = 20000000000
 
@@ -2,7 +2,13 @@ from decimal import Decimal
 
 import pytest
 
-from app.shared.utils.validators import eth_to_wei, validate_eth_value, wei_to_eth
+from app.shared.utils.validators import (
+    eth_to_wei,
+    normalize_tx_hash,
+    validate_eth_value,
+    wei_to_eth,
+    wei_to_eth_batch,
+)
 
 
 class TestEthToWei:
@@ -34,6 +40,19 @@ class TestEthToWei:
         result = eth_to_wei(1e-6)  # 0.000001 ETH
         assert result == 1000000000000
 
+    @pytest.mark.parametrize(
+        "eth_str",
+        ["1", "0.5", "1.123456789012345678", "120000000", "007.25", "0.1234567"],
+    )
+    def test_eth_to_wei_plain_string_matches_decimal(self, eth_str):
+        """Test the integer fast path agrees with the Decimal conversion"""
+        assert eth_to_wei(eth_str) == eth_to_wei(Decimal(eth_str))
+
+    def test_eth_to_wei_truncates_sub_wei_digits(self):
+        """Test strings with more than 18 decimals are rounded down"""
+        assert eth_to_wei("0.0000000000000000019") == 1
+        assert eth_to_wei(Decimal("0.0000000000000000019")) == 1
+
     def test_eth_to_wei_zero_value_error(self):
         """Test that zero value raises ValueError"""
         with pytest.raises(ValueError, match="Value must be positive"):
@@ -104,6 +123,31 @@ class TestWeiToEth:
             wei_to_eth(None)
 
 
+class TestWeiToEthBatch:
+    """Test batch Wei to ETH conversion"""
+
+    def test_wei_to_eth_batch_matches_single(self):
+        """Test batch conversion matches wei_to_eth value by value"""
+        values = [0, 1, 500000000000000000, 10**18, 123456789012345678901234]
+        result = wei_to_eth_batch(values)
+        assert result == [wei_to_eth(v) for v in values]
+        assert [str(r) for r in result] == [str(wei_to_eth(v)) for v in values]
+
+    def test_wei_to_eth_batch_empty(self):
+        """Test batch conversion of no values"""
+        assert wei_to_eth_batch([]) == []
+
+    def test_wei_to_eth_batch_negative_value_error(self):
+        """Test that a negative value in the batch raises ValueError"""
+        with pytest.raises(ValueError, match="Wei value must be non-negative"):
+            wei_to_eth_batch([1, -1])
+
+    def test_wei_to_eth_batch_invalid_value_error(self):
+        """Test that an invalid value in the batch raises ValueError"""
+        with pytest.raises(ValueError, match="Error converting Wei to ETH"):
+            wei_to_eth_batch([None])
+
+
 class TestValidateEthValue:
     """Test ETH value validation"""
 
@@ -141,3 +185,35 @@ class TestValidateEthValue:
         """Test validation with scientific notation"""
         assert validate_eth_value("1e-6") is True
         assert validate_eth_value("1E+2") is True
+
+    def test_validate_eth_value_non_finite_invalid(self):
+        """Test that NaN and Infinity are invalid"""
+        assert validate_eth_value("NaN") is False
+        assert validate_eth_value("Infinity") is False
+        assert validate_eth_value(Decimal("-Infinity")) is False
+        assert validate_eth_value(float("nan")) is False
+
+    def test_validate_eth_value_decimal(self):
+        """Test validation of Decimal input"""
+        assert validate_eth_value(Decimal("0.5")) is True
+        assert validate_eth_value(Decimal("0")) is False
+
+    def test_validate_eth_value_max_decimal_places(self):
+        """Test optional decimal places limit"""
+        assert validate_eth_value("0.000000000000000001", max_decimal_places=18) is True
+        assert (
+            validate_eth_value("0.0000000000000000001", max_decimal_places=18) is False
+        )
+        assert validate_eth_value(0.1, max_decimal_places=1) is True
+        assert validate_eth_value("1E+2", max_decimal_places=0) is True
+
+
+class TestNormalizeTxHash:
+    """Test transaction hash normalization"""
+
+    @pytest.mark.parametrize(
+        "tx_hash", ["0xabc123", "abc123", " 0xABC123 ", "ABC123", "0XABC123"]
+    )
+    def test_normalize_tx_hash(self, tx_hash):
+        """Test hashes end up lowercase with a single 0x prefix"""
+        assert normalize_tx_hash(tx_hash) == "0xabc123"
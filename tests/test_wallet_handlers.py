@@ -0,0 +1,40 @@
+import logging
+from unittest.mock import patch
+
+from app.application.v1.wallet.handlers import write_log
+
+
+class TestWriteLog:
+    """Test wallet handler logging"""
+
+    def test_write_log_goes_through_logger(self, caplog):
+        """Test extra data is logged without opening the log file"""
+        with patch("builtins.open") as mock_open, caplog.at_level(logging.INFO):
+            write_log("INFO", "%d wallets created", 2, extra_data={"wallet_count": 2})
+
+        mock_open.assert_not_called()
+        assert caplog.records[-1].levelno == logging.INFO
+        assert (
+            caplog.records[-1].getMessage() == "2 wallets created | {'wallet_count': 2}"
+        )
+
+    def test_write_log_error_level(self, caplog):
+        """Test ERROR entries keep their level"""
+        with caplog.at_level(logging.INFO):
+            write_log("ERROR", "failed")
+
+        assert caplog.records[-1].levelno == logging.ERROR
+        assert caplog.records[-1].getMessage() == "failed"
+
+    def test_write_log_skips_disabled_level(self):
+        """Test nothing is formatted when the level is disabled"""
+        with (
+            patch(
+                "app.application.v1.wallet.handlers.logger.isEnabledFor",
+                return_value=False,
+            ),
+            patch("app.application.v1.wallet.handlers.logger.log") as mock_log,
+        ):
+            write_log("INFO", "wallets created", extra_data={"wallet_count": 2})
+
+        mock_log.assert_not_called()
@@ -0,0 +1,67 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.infrastructure.db.wallet.ownership_cache import WalletOwnershipCache
+
+
+class TestWalletOwnershipCache:
+    """Test WalletOwnershipCache"""
+
+    @pytest.fixture
+    def wallet_repo(self):
+        """Create mock wallet repository"""
+        repo = Mock()
+        repo.list_active_addresses = AsyncMock(return_value={"0xabc", "0xdef"})
+        return repo
+
+    @pytest.mark.asyncio
+    async def test_get_returns_active_addresses(self, wallet_repo):
+        """Test the active wallet addresses are loaded into the snapshot"""
+        cache = WalletOwnershipCache(wallet_repo)
+
+        assert await cache.get() == frozenset({"0xabc", "0xdef"})
+
+    @pytest.mark.asyncio
+    async def test_get_uses_cache_within_ttl(self, wallet_repo):
+        """Test the database is queried once while the snapshot is fresh"""
+        cache = WalletOwnershipCache(wallet_repo, ttl=60)
+
+        await cache.get()
+        await cache.get()
+
+        wallet_repo.list_active_addresses.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_refreshes_after_ttl(self, wallet_repo):
+        """Test the snapshot is reloaded once the TTL expires"""
+        cache = WalletOwnershipCache(wallet_repo, ttl=5)
+
+        with patch("time.monotonic", return_value=100.0):
+            await cache.get()
+        with patch("time.monotonic", return_value=106.0):
+            await cache.get()
+
+        assert wallet_repo.list_active_addresses.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self, wallet_repo):
+        """Test invalidate makes the next get reload the wallet set"""
+        cache = WalletOwnershipCache(wallet_repo, ttl=60)
+
+        await cache.get()
+        cache.invalidate()
+        await cache.get()
+
+        assert wallet_repo.list_active_addresses.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_loads_once(self, wallet_repo):
+        """Test concurrent callers share a single reload"""
+        cache = WalletOwnershipCache(wallet_repo, ttl=60)
+
+        results = await asyncio.gather(*(cache.get() for _ in range(5)))
+
+        assert all(result == frozenset({"0xabc", "0xdef"}) for result in results)
+        wallet_repo.list_active_addresses.assert_awaited_once()
@@ -27,21 +27,38 @@ class TestHashiCorpVaultService:
             }
             yield mock_client
 
-    def test_vault_service_init_authenticated(self, mock_hvac_client):
-        """Test Vault service initialization when authenticated"""
+    def test_vault_service_init_does_not_authenticate(self, mock_hvac_client):
+        """Test Vault service initialization makes no Vault round trip"""
         service = HashiCorpVaultService("http://vault:8200", "test-token")
 
         assert service.secret_path == "eth_wallets"
+        mock_hvac_client.is_authenticated.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_vault_service_healthcheck_authenticated(self, mock_hvac_client):
+        """Test health check when the token is valid"""
+        service = HashiCorpVaultService("http://vault:8200", "test-token")
+
+        assert await service.healthcheck() is True
         mock_hvac_client.is_authenticated.assert_called_once()
 
-    def test_vault_service_init_not_authenticated(self, mock_hvac_client):
-        """Test Vault service initialization when not authenticated"""
+    @pytest.mark.asyncio
+    async def test_vault_service_healthcheck_not_authenticated(self, mock_hvac_client):
+        """Test health check when the token is rejected"""
         mock_hvac_client.is_authenticated.return_value = False
 
         service = HashiCorpVaultService("http://vault:8200", "invalid-token")
 
-        assert service.secret_path == "eth_wallets"
-        mock_hvac_client.is_authenticated.assert_called_once()
+        assert await service.healthcheck() is False
+
+    @pytest.mark.asyncio
+    async def test_vault_service_healthcheck_unreachable(self, mock_hvac_client):
+        """Test health check when Vault cannot be reached"""
+        mock_hvac_client.is_authenticated.side_effect = Exception("Connection refused")
+
+        service = HashiCorpVaultService("http://vault:8200", "test-token")
+
+        assert await service.healthcheck() is False
 
     def test_vault_service_custom_secret_path(self, mock_hvac_client):
         """Test Vault service with custom secret path"""
@@ -71,6 +88,28 @@ class TestHashiCorpVaultService:
         with pytest.raises(Exception, match="Vault error"):
             service.store_private_key("wallet_123", "0x123abc")
 
+    def test_store_private_keys_bulk(self, mock_hvac_client):
+        """Test storing many private keys writes each one to Vault"""
+        service = HashiCorpVaultService("http://vault:8200", "test-token")
+
+        service.store_private_keys_bulk({"wallet_1": "0x1", "wallet_2": "0x2"})
+
+        calls = mock_hvac_client.secrets.kv.v2.create_or_update_secret.call_args_list
+        assert sorted(call.kwargs["path"] for call in calls) == [
+            "eth_wallets/wallet_1",
+            "eth_wallets/wallet_2",
+        ]
+
+    def test_store_private_keys_bulk_error(self, mock_hvac_client):
+        """Test a failed write is raised after the batch"""
+        mock_hvac_client.secrets.kv.v2.create_or_update_secret.side_effect = Exception(
+            "Vault error"
+        )
+        service = HashiCorpVaultService("http://vault:8200", "test-token")
+
+        with pytest.raises(Exception, match="Vault error"):
+            service.store_private_keys_bulk({"wallet_1": "0x1"})
+
     def test_get_private_key_success(self, mock_hvac_client):
         """Test retrieving private key successfully"""
         service = HashiCorpVaultService("http://vault:8200", "test-token")
@@ -82,6 +121,62 @@ class TestHashiCorpVaultService:
             path="eth_wallets/wallet_123"
         )
 
+    def test_get_private_key_cached(self, mock_hvac_client):
+        """Test repeated reads of the same key hit Vault only once"""
+        service = HashiCorpVaultService("http://vault:8200", "test-token")
+
+        assert service.get_private_key("wallet_123") == "0x123abc"
+        assert service.get_private_key("wallet_123") == "0x123abc"
+
+        mock_hvac_client.secrets.kv.v2.read_secret_version.assert_called_once()
+
+    def test_get_private_key_cache_expired(self, mock_hvac_client):
+        """Test an expired cached key is read from Vault again"""
+        service = HashiCorpVaultService(
+            "http://vault:8200", "test-token", key_cache_ttl=0
+        )
+
+        service.get_private_key("wallet_123")
+        service.get_private_key("wallet_123")
+
+        assert mock_hvac_client.secrets.kv.v2.read_secret_version.call_count == 2
+
+    def test_get_private_key_purges_other_expired_keys(self, mock_hvac_client):
+        """Test an expired key is dropped and zeroed on any cache access"""
+        service = HashiCorpVaultService("http://vault:8200", "test-token")
+
+        with patch("time.monotonic", return_value=100.0):
+            service.get_private_key("wallet_old")
+        _, cached_key = service._key_cache["wallet_old"]
+        with patch("time.monotonic", return_value=100.0 + service.key_cache_ttl):
+            service.get_private_key("wallet_new")
+
+        assert "wallet_old" not in service._key_cache
+        assert cached_key == bytearray(len(b"0x123abc"))
+
+    def test_invalidate_private_key_zeroes_cached_key(self, mock_hvac_client):
+        """Test invalidation overwrites the cached key bytes"""
+        service = HashiCorpVaultService("http://vault:8200", "test-token")
+        service.get_private_key("wallet_123")
+        _, cached_key = service._key_cache["wallet_123"]
+
+        service.invalidate_private_key("wallet_123")
+
+        assert "wallet_123" not in service._key_cache
+        assert not any(cached_key)
+
+    def test_store_private_key_invalidates_cache(self, mock_hvac_client):
+        """Test storing a key drops its cached value"""
+        service = HashiCorpVaultService("http://vault:8200", "test-token")
+        service.get_private_key("wallet_123")
+
+        service.store_private_key("wallet_123", "0x456def")
+        mock_hvac_client.secrets.kv.v2.read_secret_version.return_value = {
+            "data": {"data": {"private_key": "0x456def"}}
+        }
+
+        assert service.get_private_key("wallet_123") == "0x456def"
+
     def test_get_private_key_not_found(self, mock_hvac_client):
         """Test retrieving private key when not found"""
         mock_hvac_client.secrets.kv.v2.read_secret_version.side_effect = Exception(
@@ -197,11 +292,11 @@ class TestPostgreSQLWalletRepository:
         pool = Mock()
         conn = AsyncMock()
 
-        # Mock the async context manager
-        async_context = AsyncMock()
-        async_context.__aenter__ = AsyncMock(return_value=conn)
-        async_context.__aexit__ = AsyncMock(return_value=None)
-        pool.acquire.return_value = async_context
+        # Single queries go through the pool's acquire-and-run shortcuts
+        pool.execute = conn.execute
+        pool.fetch = conn.fetch
+        pool.fetchrow = conn.fetchrow
+        pool.fetchval = conn.fetchval
 
         return pool, conn
 
@@ -237,7 +332,11 @@ class TestPostgreSQLWalletRepository:
 
             assert isinstance(repo, PostgreSQLWalletRepository)
             assert repo._pool == mock_pool
-            mock_create_pool.assert_called_once_with(dsn="postgresql://test")
+            mock_create_pool.assert_called_once()
+            args, kwargs = mock_create_pool.call_args
+            assert args == ("postgresql://test",)
+            assert kwargs["statement_cache_size"] == 1024
+            assert kwargs["server_settings"] == {"jit": "off"}
 
     @pytest.mark.asyncio
     async def test_save_wallet_success(self, repository, sample_wallet):
@@ -261,6 +360,83 @@ class TestPostgreSQLWalletRepository:
         with pytest.raises(Exception, match="Database error"):
             await repo.save_wallet(sample_wallet)
 
+    @pytest.mark.asyncio
+    async def test_save_wallets_bulk(self, repository, sample_wallet):
+        """Test saving many wallets with one unnest INSERT"""
+        repo, conn = repository
+
+        await repo.save_wallets_bulk([sample_wallet, sample_wallet])
+
+        conn.execute.assert_called_once()
+        query, addresses, created, updated, deleted = conn.execute.call_args[0]
+        assert "INSERT INTO wallets" in query
+        assert "unnest" in query
+        assert "ON CONFLICT (address) DO NOTHING" in query
+        assert addresses == [sample_wallet.address, sample_wallet.address]
+        assert deleted == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_save_wallets_bulk_empty(self, repository):
+        """Test saving an empty batch does not touch the database"""
+        repo, conn = repository
+
+        await repo.save_wallets_bulk([])
+
+        conn.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_wallets_bulk_error(self, repository, sample_wallet):
+        """Test saving wallets with database error"""
+        repo, conn = repository
+        conn.execute.side_effect = Exception("Database error")
+
+        with pytest.raises(Exception, match="Database error"):
+            await repo.save_wallets_bulk([sample_wallet])
+
+    @pytest.mark.asyncio
+    async def test_bulk_load_wallets(self, repository, sample_wallet):
+        """Test bulk loading copies into a staging table, then inserts from it"""
+        repo, conn = repository
+        repo._pool.acquire = MagicMock()
+        repo._pool.acquire.return_value.__aenter__.return_value = conn
+        conn.transaction = MagicMock()
+
+        await repo.bulk_load_wallets(iter([sample_wallet]))
+
+        conn.transaction.assert_called_once()
+        conn.copy_records_to_table.assert_awaited_once()
+        args, kwargs = conn.copy_records_to_table.call_args
+        assert args == ("wallets_staging",)
+        assert kwargs["records"] == [
+            (
+                sample_wallet.address,
+                sample_wallet.created_at,
+                sample_wallet.updated_at,
+                None,
+            )
+        ]
+        assert kwargs["columns"] == (
+            "address",
+            "created_at",
+            "updated_at",
+            "deleted_at",
+        )
+        create, insert = [call[0][0] for call in conn.execute.call_args_list]
+        assert "CREATE TEMP TABLE wallets_staging" in create
+        assert "ON COMMIT DROP" in create
+        assert "FROM wallets_staging" in insert
+        assert "ON CONFLICT (address) DO NOTHING" in insert
+
+    @pytest.mark.asyncio
+    async def test_bulk_load_wallets_empty(self, repository):
+        """Test bulk loading nothing does not acquire a connection"""
+        repo, conn = repository
+        repo._pool.acquire = MagicMock()
+
+        await repo.bulk_load_wallets([])
+
+        repo._pool.acquire.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_wallet_by_address_found(self, repository, sample_wallet):
         """Test getting wallet by address when found"""
@@ -280,6 +456,7 @@ class TestPostgreSQLWalletRepository:
         assert isinstance(result, Wallet)
         assert result.address == sample_wallet.address
         conn.fetchrow.assert_called_once()
+        assert conn.fetchrow.call_args[0][1] == sample_wallet.address.lower()
 
     @pytest.mark.asyncio
     async def test_get_wallet_by_address_not_found(self, repository):
@@ -301,6 +478,51 @@ class TestPostgreSQLWalletRepository:
         with pytest.raises(Exception, match="Database error"):
             await repo.get_wallet_by_address("0x123")
 
+    @pytest.mark.asyncio
+    async def test_list_active_addresses(self, repository):
+        """Test only lowercase addresses of active wallets are fetched"""
+        repo, conn = repository
+        conn.fetch.return_value = [("0xabc",), ("0xdef",)]
+
+        result = await repo.list_active_addresses()
+
+        assert result == {"0xabc", "0xdef"}
+        (query,) = conn.fetch.call_args[0]
+        assert "SELECT LOWER(address) FROM wallets" in query
+        assert "deleted_at IS NULL" in query
+
+    @pytest.mark.asyncio
+    async def test_list_active_addresses_error(self, repository):
+        """Test listing active addresses with database error"""
+        repo, conn = repository
+        conn.fetch.side_effect = Exception("Database error")
+
+        with pytest.raises(Exception, match="Database error"):
+            await repo.list_active_addresses()
+
+    @pytest.mark.asyncio
+    async def test_get_wallets_by_addresses(self, repository):
+        """Test resolving many addresses with a single query"""
+        repo, conn = repository
+        conn.fetch.return_value = [{"address": "0xabc"}]
+
+        result = await repo.get_wallets_by_addresses(["0xabc", "0xdef"])
+
+        assert result == {"0xabc"}
+        conn.fetch.assert_called_once()
+        query, addresses = conn.fetch.call_args[0]
+        assert "ANY($1)" in query
+        assert addresses == ["0xabc", "0xdef"]
+
+    @pytest.mark.asyncio
+    async def test_get_wallets_by_addresses_error(self, repository):
+        """Test resolving many addresses with database error"""
+        repo, conn = repository
+        conn.fetch.side_effect = Exception("Database error")
+
+        with pytest.raises(Exception, match="Database error"):
+            await repo.get_wallets_by_addresses(["0xabc"])
+
     @pytest.mark.asyncio
     async def test_list_wallets_success(self, repository, sample_wallet):
         """Test listing wallets successfully"""
@@ -361,6 +583,7 @@ class TestWalletRepositoryIntegration:
             with patch(
                 "app.infrastructure.db.wallet.postgresql_repository.MetricsContext"
             ) as mock_metrics:
+                mock_metrics.return_value.__enter__.return_value.duration = 0.0
                 service = HashiCorpVaultService("http://vault:8200", "test-token")
                 service.store_private_key("wallet_123", "0x123abc")
 
@@ -389,16 +612,12 @@ class TestWalletRepositoryIntegration:
     async def test_repository_with_metrics_context(self):
         """Test repository operations with metrics context"""
         pool = Mock()
-        conn = AsyncMock()
-
-        async_context = AsyncMock()
-        async_context.__aenter__ = AsyncMock(return_value=conn)
-        async_context.__aexit__ = AsyncMock(return_value=None)
-        pool.acquire.return_value = async_context
+        pool.execute = AsyncMock()
 
         with patch(
             "app.infrastructure.db.wallet.postgresql_repository.MetricsContext"
         ) as mock_metrics:
+            mock_metrics.return_value.__enter__.return_value.duration = 0.0
             repo = PostgreSQLWalletRepository(pool)
             wallet = Wallet(
                 address="0x123",
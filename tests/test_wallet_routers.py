@@ -0,0 +1,69 @@
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi.responses import StreamingResponse
+
+from app.application.v1.wallet.routers import get_all_wallets
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for row in self.rows:
+            yield row
+
+
+def build_conn(rows):
+    conn = Mock()
+    conn.cursor = Mock(return_value=FakeCursor(rows))
+    transaction = AsyncMock()
+    transaction.__aenter__ = AsyncMock(return_value=None)
+    transaction.__aexit__ = AsyncMock(return_value=None)
+    conn.transaction = Mock(return_value=transaction)
+    return conn
+
+
+def build_request(rows):
+    acquire = AsyncMock()
+    acquire.__aenter__ = AsyncMock(return_value=build_conn(rows))
+    acquire.__aexit__ = AsyncMock(return_value=None)
+    request = Mock()
+    request.app.state.wallet_repo.acquire.return_value = acquire
+    return request, acquire
+
+
+async def read_body(response):
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+class TestGetAllWallets:
+    """Test GET /v1/wallets"""
+
+    @pytest.mark.asyncio
+    async def test_get_all_wallets(self):
+        """Test active wallets are streamed and the connection is released"""
+        request, acquire = build_request([{"address": "0xabc"}, {"address": "0xdef"}])
+
+        response = await get_all_wallets(request)
+
+        assert isinstance(response, StreamingResponse)
+        assert response.media_type == "application/json"
+        assert json.loads(await read_body(response)) == {
+            "wallets": [{"address": "0xabc"}, {"address": "0xdef"}]
+        }
+        acquire.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_all_wallets_empty(self):
+        """Test an empty table streams an empty list"""
+        request, _ = build_request([])
+
+        response = await get_all_wallets(request)
+
+        assert json.loads(await read_body(response)) == {"wallets": []}
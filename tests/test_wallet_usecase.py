@@ -16,7 +16,7 @@ async def test_create_wallets_usecase():
     vault_service = MagicMock()
     wallet_service = MagicMock()
     wallet_repository = MagicMock()
-    wallet_repository.save_wallet = AsyncMock()
+    wallet_repository.save_wallets_bulk = AsyncMock()
     # Simula criação de 2 wallets
     wallet_service.create_wallet.side_effect = [
         {"address": "0xabc", "private_key": "priv1"},
@@ -25,8 +25,31 @@ async def test_create_wallets_usecase():
     usecase = CreateWalletsUseCase(vault_service, wallet_service, wallet_repository)
     addresses = await usecase.execute(2)
     assert addresses == ["0xabc", "0xdef"]
-    assert vault_service.store_private_key.call_count == 2
-    assert wallet_repository.save_wallet.call_count == 2
+    vault_service.store_private_keys_bulk.assert_called_once_with(
+        {"eth_wallet_0xabc": "priv1", "eth_wallet_0xdef": "priv2"}
+    )
+    wallet_repository.save_wallets_bulk.assert_awaited_once()
+    (wallets,) = wallet_repository.save_wallets_bulk.call_args[0]
+    assert [wallet.address for wallet in wallets] == ["0xabc", "0xdef"]
+    assert wallets[0].created_at == wallets[1].created_at
+
+
+@pytest.mark.asyncio
+async def test_create_wallets_usecase_invalidates_cache():
+    vault_service = MagicMock()
+    wallet_service = MagicMock()
+    wallet_repository = MagicMock()
+    wallet_repository.save_wallets_bulk = AsyncMock()
+    wallet_cache = MagicMock()
+    wallet_service.create_wallet.return_value = {
+        "address": "0xabc",
+        "private_key": "priv1",
+    }
+    usecase = CreateWalletsUseCase(
+        vault_service, wallet_service, wallet_repository, wallet_cache=wallet_cache
+    )
+    await usecase.execute(1)
+    wallet_cache.invalidate.assert_called_once()
 
 
 def test_sign_transaction_with_vault_wallet_usecase():
@@ -52,3 +75,20 @@ async def test_get_all_wallets_usecase():
     result = await usecase.execute()
     assert result == [{"address": "0xabc"}, {"address": "0xdef"}]
     conn.fetch.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_all_wallets_usecase_stream():
+    conn = MagicMock()
+    conn.cursor.return_value.__aiter__.return_value = [
+        {"address": "0xabc"},
+        {"address": "0xdef"},
+        {"address": "0x123"},
+    ]
+    usecase = GetAllWalletsUseCase(conn)
+    batches = [batch async for batch in usecase.stream(batch_size=2)]
+    assert batches == [
+        [{"address": "0xabc"}, {"address": "0xdef"}],
+        [{"address": "0x123"}],
+    ]
+    conn.transaction.assert_called_once()